@@ -0,0 +1,62 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# benchmarks/expansion_rate.py
+#
+# Measures how many cells per second the priority-queue solvers expand on a large
+# random maze. With --min-rate it exits with status 1 when any solver falls below
+# that rate, so it can guard against open lists regressing to linear scans.
+# Run from the repository root: python -m benchmarks.expansion_rate
+
+import argparse
+import sys
+import time
+
+from mazesolver.engine import ALGORITHMS, Search
+from mazesolver.stats import SearchStats
+from mazesolver.generate import random_grid
+
+SOLVERS = ["A*", "D*", "SMA*", "Jump Point Search", "JPS+"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Expansion rate of the heap-based solvers.")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--density", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=2)
+    parser.add_argument("--algorithms", nargs="+", default=SOLVERS)
+    parser.add_argument("--min-rate", type=float, default=0,
+                        help="fail if a solver expands fewer cells per second")
+    args = parser.parse_args()
+
+    grid = random_grid(args.size, args.size, density=args.density, seed=args.seed)
+    start, end = (0, 0), (args.size - 1, args.size - 1)
+
+    print(f"{'algorithm':<18} {'time (s)':>10} {'expanded':>10} {'cells/s':>12} {'path':>7}")
+    slow = []
+    for algorithm in args.algorithms:
+        stats = SearchStats()
+        search = Search(grid, start, end, stats=stats)
+        began = time.perf_counter()
+        path = ALGORITHMS[algorithm](search)
+        elapsed = time.perf_counter() - began
+        expanded = stats.expansions
+        rate = expanded / elapsed if elapsed else float("inf")
+        length = len(path) if path else "-"
+        print(f"{algorithm:<18} {elapsed:>10.3f} {expanded:>10} {rate:>12.0f} {length:>7}")
+        if rate < args.min_rate:
+            slow.append(algorithm)
+
+    if slow:
+        print(f"below {args.min_rate:.0f} cells/s: {', '.join(slow)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# benchmarks/hpa.py
+#
+# Compares HPA* with A* on a large random maze: query time, cells or abstract
+# nodes expanded and path length. HPA* is timed on its first queries (which
+# build the clusters they touch), again once its graph is warm, and after
+# set_wall edits that make it repair the affected clusters.
+# Run from the repository root: python -m benchmarks.hpa
+
+import argparse
+import random
+import time
+
+from mazesolver.engine import ALGORITHMS, Search
+from mazesolver.generate import random_grid
+
+
+def run(grid, start, end, algorithm):
+    expanded = 0
+
+    def count(cell, event):
+        nonlocal expanded
+        expanded += 1
+
+    began = time.perf_counter()
+    path = ALGORITHMS[algorithm](Search(grid, start, end, count))
+    return path, time.perf_counter() - began, expanded
+
+
+def random_open_cell(grid, rng):
+    while True:
+        cell = (rng.randrange(grid.height), rng.randrange(grid.width))
+        if not grid.is_wall(cell):
+            return cell
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HPA* against A* on a large maze.")
+    parser.add_argument("--size", type=int, default=2048)
+    parser.add_argument("--density", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=2)
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--edits", type=int, default=20,
+                        help="walls placed before the repaired-graph round")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    grid = random_grid(args.size, args.size, density=args.density, seed=args.seed)
+    queries = [(random_open_cell(grid, rng), random_open_cell(grid, rng))
+               for _ in range(args.queries)]
+
+    print(f"{'round':<10} {'algorithm':<6} {'time (s)':>10} {'expanded':>10} {'length':>10}")
+
+    def measure(label, algorithm):
+        total = expanded = length = 0
+        for start, end in queries:
+            path, seconds, count = run(grid, start, end, algorithm)
+            total += seconds
+            expanded += count
+            length += len(path) if path else 0
+        print(f"{label:<10} {algorithm:<6} {total:>10.3f} {expanded:>10} {length:>10}")
+
+    measure("baseline", "A*")
+    measure("cold", "HPA*")
+    measure("warm", "HPA*")
+    for _ in range(args.edits):
+        grid.set_wall(random_open_cell(grid, rng))
+    measure("repaired", "HPA*")
+
+
+if __name__ == "__main__":
+    main()
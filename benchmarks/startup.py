@@ -0,0 +1,75 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# benchmarks/startup.py
+#
+# Times fresh interpreter start-ups that import the package, the way short-lived
+# worker processes do, and checks that the headless imports never load tkinter
+# (or NumPy, which is only imported when a NumPy feature is used). Exits with
+# status 1 if they do.
+# Run from the repository root: python -m benchmarks.startup
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "python only": "pass",
+    "import mazesolver": "import mazesolver",
+    "import + solve": (
+        "from mazesolver import solve; solve([[0, 0], [1, 0]], (0, 0), (1, 1), 'A*')"
+    ),
+    "import GUI": "import mazesolver.gui",
+}
+HEADLESS = ["import mazesolver", "import + solve"]
+CHECK = "import sys; {code}; print(','.join(m for m in ('tkinter', 'numpy') if m in sys.modules))"
+
+
+def run(code):
+    began = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+    return time.perf_counter() - began, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Package import time in fresh processes.")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<18} {'median (ms)':>12} {'min (ms)':>10}")
+    for name, code in SCENARIOS.items():
+        times = []
+        for _ in range(args.runs):
+            elapsed, result = run(code)
+            if result.returncode:
+                break
+            times.append(elapsed * 1000)
+        if not times:
+            print(f"{name:<18} {'unavailable':>12}")
+            continue
+        print(f"{name:<18} {statistics.median(times):>12.1f} {min(times):>10.1f}")
+
+    failed = False
+    for name in HEADLESS:
+        _, result = run(CHECK.format(code=SCENARIOS[name]))
+        loaded = result.stdout.strip()
+        if result.returncode or loaded:
+            print(f"{name}: loaded {loaded or result.stderr.strip()}")
+            failed = True
+    if failed:
+        sys.exit(1)
+    print("headless imports load neither tkinter nor NumPy")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# benchmarks/suite.py
+#
+# Runs every algorithm over seeded mazes of several sizes and topologies
+# (perfect mazes, rooms joined by doors and open fields at each wall density)
+# and prints a table of solve time, cells expanded, peak open-list size and
+# peak memory. Each solve runs in its own process and is killed after
+# --timeout seconds, so one slow algorithm cannot stall the suite;
+# Floyd-Warshall is skipped outright on mazes too big for its table. Peak
+# memory is how far the worker's peak resident size grew during the solve
+# (--memory rss, where the resource module exists), which costs nothing, or
+# the most bytes allocated at once as tracemalloc counts them (--memory
+# tracemalloc), which is exact but slows solves down about tenfold.
+#
+# Save a run with --format json -o FILE and pass it back with --baseline to
+# compare releases: solves more than --max-slowdown times slower than the
+# baseline are listed, and the suite exits with status 1.
+# Run from the repository root: python -m benchmarks.suite
+
+import argparse
+import csv
+import importlib.util
+import json
+import multiprocessing
+import random
+import sys
+import time
+
+from mazesolver import ALGORITHMS, SearchStats, solve
+from mazesolver.generate import perfect_maze, random_grid, room_grid
+
+FIELDS = [
+    "topology", "density", "size", "algorithm", "status", "seconds", "expansions",
+    "pushes", "peak_frontier", "peak_bytes", "length",
+]
+
+HEADER = (
+    f"{'maze':<16} {'algorithm':<18} {'status':<8} {'time (s)':>10} {'expanded':>10} "
+    f"{'pushes':>10} {'peak open':>10} {'peak KiB':>10} {'length':>7}"
+)
+
+# Floyd-Warshall's table holds a distance for every pair of open cells; beyond
+# this many it would not fit in memory, so those solves are skipped.
+MAX_ALL_PAIRS_CELLS = 2048
+
+# Baseline solves faster than this are too noisy to flag as regressions.
+MIN_COMPARED_SECONDS = 0.01
+
+# Forked workers inherit the maze instead of having it pickled to them.
+if "fork" in multiprocessing.get_all_start_methods():
+    CONTEXT = multiprocessing.get_context("fork")
+else:
+    CONTEXT = multiprocessing.get_context()
+
+
+def mazes(sizes, densities, seed):
+    """
+    Yields `(topology, density, size, grid)` for every maze in the suite. The
+    same sizes, densities and seed always give the same mazes.
+    """
+    for size in sizes:
+        yield "perfect", None, size, perfect_maze(size, size, seed=seed)
+        yield "rooms", None, size, room_grid(size, size, seed=seed)
+        for density in densities:
+            yield "open", density, size, open_field(size, density, seed)
+
+
+def open_field(size, density, seed):
+    """
+    Generates a random open field whose corners are connected, trying
+    successive seeds from `seed`.
+    """
+    for attempt in range(100):
+        grid = random_grid(size, size, density=density, seed=seed + attempt)
+        # Cheap either way: on a disconnected maze one side soon runs dry.
+        if solve(grid, (0, 0), far_corner(grid), "Bidirectional", reachability=False):
+            return grid
+    raise SystemExit(f"No connected {size}x{size} open field at density {density}")
+
+
+def far_corner(grid):
+    """
+    Returns the open cell nearest the bottom-right corner along the diagonal.
+    Perfect mazes of even size have a wall there.
+    """
+    for d in range(min(grid.height, grid.width)):
+        cell = (grid.height - 1 - d, grid.width - 1 - d)
+        if not grid.is_wall(cell):
+            return cell
+    raise ValueError("The maze has no open cell on its diagonal")
+
+
+def peak_rss():
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _solve(conn, grid, start, end, algorithm, memory, seed):
+    # Seeded so that Random Walk takes the same walk every run.
+    random.seed(seed)
+    stats = SearchStats(memory=memory == "tracemalloc")
+    if memory == "rss":
+        before = peak_rss()
+    try:
+        path = solve(grid, start, end, algorithm, stats=stats, reachability=False)
+    except Exception as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}", None))
+    else:
+        result = stats.as_dict()
+        if memory == "rss":
+            result["peak_bytes"] = peak_rss() - before
+        elif memory == "off":
+            result["peak_bytes"] = None
+        conn.send(("ok" if path else "no path", result, len(path) if path else None))
+    conn.close()
+
+
+def measure(grid, start, end, algorithm, timeout, memory="off", seed=0):
+    """
+    Solves in a child process, killing it after `timeout` seconds. `memory` is
+    "rss", "tracemalloc" or "off"; see the top of this file.
+
+    Returns:
+        tuple: `(status, stats, length)`, where status is "ok", "no path",
+        "timeout" or "error" and `stats` is a `SearchStats.as_dict()` (or the
+        error message).
+    """
+    receiver, sender = CONTEXT.Pipe(duplex=False)
+    process = CONTEXT.Process(
+        target=_solve, args=(sender, grid, start, end, algorithm, memory, seed), daemon=True
+    )
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(timeout):
+            return receiver.recv()
+        return "timeout", None, None
+    except EOFError:
+        return "error", f"worker exited with code {process.exitcode}", None
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        receiver.close()
+
+
+def run_suite(args, progress):
+    rows = []
+    for topology, density, size, grid in mazes(args.sizes, args.densities, args.seed):
+        start, end = (0, 0), far_corner(grid)
+        open_cells = grid.cells.count(0)
+        for algorithm in args.algorithms:
+            if algorithm == "Floyd-Warshall" and open_cells > MAX_ALL_PAIRS_CELLS:
+                status, stats, length = "skipped", None, None
+            else:
+                status, stats, length = measure(
+                    grid, start, end, algorithm, args.timeout, args.memory, args.seed
+                )
+            row = {
+                "topology": topology, "density": density, "size": size,
+                "algorithm": algorithm, "status": status, "seconds": None,
+                "expansions": None, "pushes": None, "peak_frontier": None,
+                "peak_bytes": None, "length": length,
+            }
+            if status == "error":
+                print(f"{algorithm} on {topology} {size}: {stats}", file=sys.stderr)
+            elif stats is not None:
+                row["seconds"] = round(stats["seconds"], 6)
+                for name in ("expansions", "pushes", "peak_frontier", "peak_bytes"):
+                    row[name] = stats[name]
+            rows.append(row)
+            print_row(row, file=progress)
+    return rows
+
+
+def maze_label(row):
+    if row["density"] is None:
+        return f"{row['topology']} {row['size']}"
+    return f"{row['topology']} {row['density']:g} {row['size']}"
+
+
+def print_row(row, file=None):
+    def cell(value, width, spec=""):
+        return f"{'-' if value is None else format(value, spec):>{width}}"
+
+    kib = None if row["peak_bytes"] is None else row["peak_bytes"] / 1024
+    print(
+        f"{maze_label(row):<16} {row['algorithm']:<18} {row['status']:<8} "
+        f"{cell(row['seconds'], 10, '.4f')} {cell(row['expansions'], 10)} "
+        f"{cell(row['pushes'], 10)} {cell(row['peak_frontier'], 10)} "
+        f"{cell(kib, 10, '.0f')} {cell(row['length'], 7)}",
+        file=file,
+    )
+
+
+def write_rows(rows, args):
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(rows, out, indent=2)
+            out.write("\n")
+        elif args.format == "csv":
+            writer = csv.DictWriter(out, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        elif args.output:
+            print(HEADER, file=out)
+            for row in rows:
+                print_row(row, file=out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def regressions(rows, baseline, max_slowdown):
+    """
+    Returns `(row, old seconds)` for every solve that took more than
+    `max_slowdown` times its baseline time, or that finished in the baseline
+    but not now.
+    """
+    def key(row):
+        return row["topology"], row["density"], row["size"], row["algorithm"]
+
+    before = {key(row): row for row in baseline}
+    slower = []
+    for row in rows:
+        old = before.get(key(row))
+        if old is None or old["seconds"] is None or old["seconds"] < MIN_COMPARED_SECONDS:
+            continue
+        if row["seconds"] is None or row["seconds"] > old["seconds"] * max_slowdown:
+            slower.append((row, old["seconds"]))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Every algorithm across maze sizes and topologies.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 1024, 4096])
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.1, 0.3],
+                        help="wall densities of the open-field mazes")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS))
+    parser.add_argument("--timeout", type=float, default=10,
+                        help="seconds each solve may take before it is killed")
+    parser.add_argument("--memory", choices=["rss", "tracemalloc", "off"],
+                        default="rss" if importlib.util.find_spec("resource") else "tracemalloc",
+                        help="how to measure peak memory")
+    parser.add_argument("--format", choices=["table", "csv", "json"], default="table")
+    parser.add_argument("-o", "--output", help="write the results here instead of stdout")
+    parser.add_argument("--baseline", help="a JSON file from an earlier run to compare against")
+    parser.add_argument("--max-slowdown", type=float, default=1.5,
+                        help="with --baseline, fail if a solve is this many times slower")
+    args = parser.parse_args()
+    for name in args.algorithms:
+        if name not in ALGORITHMS:
+            parser.error(f"unknown algorithm {name!r}")
+
+    # The table is printed as the suite runs; CSV or JSON on stdout waits for
+    # the end, so progress goes to stderr instead.
+    progress = sys.stdout if args.format == "table" or args.output else sys.stderr
+    print(HEADER, file=progress)
+    began = time.perf_counter()
+    rows = run_suite(args, progress)
+    write_rows(rows, args)
+    print(f"{len(rows)} solves in {time.perf_counter() - began:.0f} s", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            slower = regressions(rows, json.load(f), args.max_slowdown)
+        for row, seconds in slower:
+            now = "timeout" if row["seconds"] is None else f"{row['seconds']:.4f} s"
+            print(f"slower: {maze_label(row)} {row['algorithm']}: {seconds:.4f} s -> {now}")
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# benchmarks/weighted.py
+#
+# Compares the cost-aware solvers on random terrain maps.
+# Run from the repository root: python -m benchmarks.weighted
+
+import argparse
+import time
+
+from mazesolver import solve
+from mazesolver.generate import random_terrain
+
+ALGORITHMS = ["Dijkstra", "A*", "Theta*", "D*", "Fringe Search", "Bellman-Ford"]
+
+
+def path_cost(grid, path):
+    """
+    Sums the cost of every step of a 4-connected path, or returns None for paths
+    that cut corners (Theta* may skip cells along a line of sight).
+    """
+    cost = 0
+    for (ax, ay), (bx, by) in zip(path, path[1:]):
+        if abs(ax - bx) + abs(ay - by) != 1:
+            return None
+        cost += grid.cost((bx, by))
+    return cost
+
+
+def main():
+    parser = argparse.ArgumentParser(description="The cost-aware solvers on random terrain maps.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[32, 64, 128])
+    parser.add_argument("--max-cost", type=int, default=9)
+    parser.add_argument("--density", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--algorithms", nargs="+", default=ALGORITHMS)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'algorithm':<14} {'time (s)':>10} {'cells':>7} {'cost':>7}")
+    for size in args.sizes:
+        grid = random_terrain(
+            size, size, max_cost=args.max_cost, density=args.density, seed=args.seed
+        )
+        start, end = (0, 0), (size - 1, size - 1)
+        for algorithm in args.algorithms:
+            began = time.perf_counter()
+            path = solve(grid, start, end, algorithm)
+            elapsed = time.perf_counter() - began
+            if path is None:
+                cells = cost = "-"
+            else:
+                cells = len(path)
+                cost = path_cost(grid, path)
+                cost = "-" if cost is None else cost
+            print(f"{size:>6} {algorithm:<14} {elapsed:>10.4f} {cells:>7} {cost:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,13 @@
 #####################################
 # main.py
 
-import tkinter as tk
-from mazesolver.gui import MazeSolverGUI
+#
+# Opens the GUI. Any arguments are handed to the command line instead, e.g.
+# `python main.py solve maze.txt`; see `python -m mazesolver --help`.
+
+import sys
+
+from mazesolver.__main__ import main
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = MazeSolverGUI(root)
-    root.mainloop()
+    main(sys.argv[1:] or ["gui"])
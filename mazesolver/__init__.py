@@ -0,0 +1,56 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/__init__.py
+
+from .grid import Grid, WeightedGrid
+from .bitgrid import BitGrid
+from .tiled import TiledGrid
+from .engine import ALGORITHMS, Search, solve
+from .stats import SearchStats
+from .distance import distance_field, field_path
+from .allpairs import AllPairs
+from .components import ComponentIndex
+from .dstar_lite import DStarLite
+from .batch import BatchResult, solve_batch
+from .cache import PathCache
+from .trace import TraceReader, TraceWriter, record_trace
+
+__all__ = [
+    "ALGORITHMS",
+    "AllPairs",
+    "BatchResult",
+    "BitGrid",
+    "ComponentIndex",
+    "DStarLite",
+    "Grid",
+    "PathCache",
+    "Search",
+    "SearchStats",
+    "TiledGrid",
+    "TraceReader",
+    "TraceWriter",
+    "WeightedGrid",
+    "distance_field",
+    "field_path",
+    "record_trace",
+    "solve",
+    "solve_batch",
+]
+
+
+def __getattr__(name):
+    # The GUI needs tkinter, which headless installs may not have and which is
+    # slow to import, so it is only loaded when asked for (and is left out of
+    # __all__ so that star imports stay headless).
+    if name == "MazeSolverGUI":
+        from .gui import MazeSolverGUI
+
+        return MazeSolverGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,227 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/__main__.py
+#
+# Command-line interface:
+#
+#   python -m mazesolver solve maze.txt -a A* BFS
+#   python -m mazesolver bench --sizes 64 128 --format json -o bench.json
+#   python -m mazesolver convert maze.txt maze.maze
+#   python -m mazesolver gui
+
+import argparse
+import csv
+import json
+import sys
+
+from .components import ComponentIndex
+from .engine import ALGORITHMS, check_endpoints, solve
+from .stats import SearchStats
+from .files import load, save
+from .generate import random_grid
+
+# Left out of `bench` unless asked for: Random Walk has no time bound, IDA* is
+# exponential on open grids and Floyd-Warshall builds an all-pairs table.
+SLOW_ALGORITHMS = ("Random Walk", "IDA*", "Floyd-Warshall")
+FIELDS = ["size", "algorithm", "seconds", "length", "expanded"]
+
+
+def measured(grid, start, end, algorithm, diagonal=False):
+    """
+    Solves once and returns `(path, stats)`. The caller has already checked
+    that start and end are connected, so the solve skips that check.
+    """
+    stats = SearchStats()
+    path = solve(grid, start, end, algorithm, diagonal=diagonal, reachability=False, stats=stats)
+    return path, stats
+
+
+def connected(grid, start, end):
+    """
+    Returns True if a path can join start and end, using the grid's cached
+    ComponentIndex. Some algorithms (Random Walk) never give up on an
+    unreachable end, so no solver is started without this check.
+    """
+    components = grid.memo("components", lambda: ComponentIndex(grid))
+    return components.connected(start, end)
+
+
+def parse_cell(text):
+    try:
+        x, y = text.split(",")
+        return (int(x), int(y))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected a cell as row,column, e.g. 0,3; got {text!r}"
+        ) from None
+
+
+def algorithm_names(names, default):
+    if not names:
+        return default
+    if names == ["all"]:
+        return list(ALGORITHMS)
+    for name in names:
+        if name not in ALGORITHMS:
+            raise SystemExit(
+                f"Unknown algorithm {name!r}. Choose from: {', '.join(ALGORITHMS)}"
+            )
+    return names
+
+
+def load_maze_file(path):
+    try:
+        return load(path)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"Cannot load {path}: {exc}")
+
+
+def checked_endpoints(grid, start, end):
+    try:
+        check_endpoints(grid, start, end)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    return start, end
+
+
+def solve_command(args):
+    grid, start, end = load_maze_file(args.maze)
+    start, end = checked_endpoints(
+        grid, args.start or start or (0, 0), args.end or end or (grid.height - 1, grid.width - 1)
+    )
+    algorithms = algorithm_names(args.algorithms, ["A*"])
+    if not connected(grid, start, end):
+        print(f"No path from {start} to {end}: they lie in different regions")
+        return
+
+    print(f"{'algorithm':<18} {'length':>8} {'expanded':>10} {'time (s)':>10}")
+    for algorithm in algorithms:
+        path, stats = measured(grid, start, end, algorithm, args.diagonal)
+        length = len(path) if path else "-"
+        print(f"{algorithm:<18} {length:>8} {stats.expansions:>10} {stats.seconds:>10.4f}")
+
+
+def bench_maze(size, density, seed):
+    """
+    Generates a size x size random maze whose corners are connected, trying
+    successive seeds from `seed`.
+    """
+    for attempt in range(100):
+        grid = random_grid(size, size, density=density, seed=seed + attempt)
+        if connected(grid, (0, 0), (size - 1, size - 1)):
+            return grid
+    raise SystemExit(f"No connected {size}x{size} maze at density {density}")
+
+
+def bench_command(args):
+    default = [name for name in ALGORITHMS if name not in SLOW_ALGORITHMS]
+    algorithms = algorithm_names(args.algorithms, default)
+    rows = []
+    for size in args.sizes:
+        grid = bench_maze(size, args.density, args.seed)
+        start, end = (0, 0), (size - 1, size - 1)
+        for algorithm in algorithms:
+            best = None
+            for _ in range(args.repeat):
+                path, stats = measured(grid, start, end, algorithm, args.diagonal)
+                if best is None or stats.seconds < best:
+                    best = stats.seconds
+            expanded = stats.expansions
+            rows.append(
+                {
+                    "size": size,
+                    "algorithm": algorithm,
+                    "seconds": round(best, 6),
+                    "length": len(path) if path else None,
+                    "expanded": expanded,
+                }
+            )
+            print(f"{size:>6} {algorithm:<18} {best:>10.4f}", file=sys.stderr)
+
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(rows, out, indent=2)
+            out.write("\n")
+        else:
+            writer = csv.DictWriter(out, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def convert_command(args):
+    grid, start, end = load_maze_file(args.source)
+    start = args.start or start
+    end = args.end or end
+    checked_endpoints(grid, start, end)
+    save(args.target, grid, start, end)
+
+
+def gui_command(args):
+    try:
+        import tkinter as tk
+    except ImportError:
+        raise SystemExit("The GUI needs tkinter; see the README for how to install it.")
+
+    from .gui import MazeSolverGUI
+
+    root = tk.Tk()
+    MazeSolverGUI(root)
+    root.mainloop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m mazesolver")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = commands.add_parser("solve", help="solve a maze file headlessly")
+    solve_parser.add_argument(
+        "maze", help="maze file: .maze, .png, .pbm or ASCII ('#' walls, 'S'/'E' endpoints)"
+    )
+    solve_parser.add_argument("-a", "--algorithms", nargs="+", metavar="NAME",
+                              help="algorithm names, or 'all' (default: A*)")
+    solve_parser.add_argument("--start", type=parse_cell, metavar="X,Y")
+    solve_parser.add_argument("--end", type=parse_cell, metavar="X,Y")
+    solve_parser.add_argument("--diagonal", action="store_true",
+                              help="allow diagonal moves (Jump Point Search, JPS+)")
+    solve_parser.set_defaults(handler=solve_command)
+
+    bench_parser = commands.add_parser("bench", help="time algorithms on random mazes")
+    bench_parser.add_argument("-a", "--algorithms", nargs="+", metavar="NAME",
+                              help="algorithm names, or 'all'")
+    bench_parser.add_argument("--sizes", type=int, nargs="+", default=[32, 64, 128])
+    bench_parser.add_argument("--density", type=float, default=0.2)
+    bench_parser.add_argument("--seed", type=int, default=1)
+    bench_parser.add_argument("--repeat", type=int, default=3,
+                              help="runs per measurement; the fastest is kept")
+    bench_parser.add_argument("--diagonal", action="store_true")
+    bench_parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    bench_parser.add_argument("-o", "--output", help="write results here instead of stdout")
+    bench_parser.set_defaults(handler=bench_command)
+
+    convert_parser = commands.add_parser("convert", help="convert between maze file formats")
+    convert_parser.add_argument("source")
+    convert_parser.add_argument("target", help="the output format follows its extension")
+    convert_parser.add_argument("--start", type=parse_cell, metavar="X,Y")
+    convert_parser.add_argument("--end", type=parse_cell, metavar="X,Y")
+    convert_parser.set_defaults(handler=convert_command)
+
+    gui_parser = commands.add_parser("gui", help="open the Tkinter GUI")
+    gui_parser.set_defaults(handler=gui_command)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,204 +9,310 @@
 #####################################
 # mazesolver/algorithms.py
 
-import time
 import heapq
 import random
+from collections import deque
 
+from .allpairs import AllPairs
+from .dstar_lite import DStarLite
+from .hpa import CLUSTER_SIZE, AbstractGraph
+from .jps import JumpTable, OnlineJumps, jump_search
 
-def bfs(gui):
-    start = gui.start
-    end = gui.end
+# Sentinel for "no cost recorded yet" in the int32 cost arrays.
+UNREACHED = 2**31 - 1
 
-    gui.queue.put(start)
-    gui.visited.add(start)
 
-    while not gui.queue.empty():
-        current = gui.queue.get()
+def bfs(search):
+    start = search.start_id
+    end = search.end_id
+    neighbors = search.neighbors
+    visited = search.visited
+    parent = search.parent
+    reach = search.reach
+    stats = search.stats
 
-        if current == end:
-            return gui.construct_path(current)
+    frontier = deque([start])
+    visited[start] = 1
+    if stats:
+        stats.push(1)
 
-        for neighbor in gui.get_neighbors(current):
-            if neighbor not in gui.visited:
-                gui.queue.put(neighbor)
-                gui.visited.add(neighbor)
-                gui.parent[neighbor] = current
-                gui.color_cell(neighbor, "visited")
+    while frontier:
+        current = frontier.popleft()
+        if stats:
+            stats.pops += 1
 
-        gui.root.update()
-        time.sleep(0.2)
+        if current == end:
+            return search.construct_path(current)
+
+        if stats:
+            stats.expansions += 1
+        for neighbor in neighbors(current):
+            if not visited[neighbor]:
+                frontier.append(neighbor)
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                if reach:
+                    reach(neighbor)
+                if stats:
+                    stats.push(len(frontier))
 
     return None
 
 
-def dfs(gui):
-    stack = [gui.start]
-    gui.visited.add(gui.start)
+def dfs(search):
+    neighbors = search.neighbors
+    visited = search.visited
+    parent = search.parent
+    reach = search.reach
+    stats = search.stats
+
+    stack = [search.start_id]
+    visited[search.start_id] = 1
+    if stats:
+        stats.push(1)
 
     while stack:
         current = stack.pop()
+        if stats:
+            stats.pops += 1
 
-        if current == gui.end:
-            return gui.construct_path(current)
+        if current == search.end_id:
+            return search.construct_path(current)
 
-        for neighbor in gui.get_neighbors(current):
-            if neighbor not in gui.visited:
+        if stats:
+            stats.expansions += 1
+        for neighbor in neighbors(current):
+            if not visited[neighbor]:
                 stack.append(neighbor)
-                gui.visited.add(neighbor)
-                gui.parent[neighbor] = current
-                gui.color_cell(neighbor, "visited")
-
-        gui.root.update()
-        time.sleep(0.2)
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                if reach:
+                    reach(neighbor)
+                if stats:
+                    stats.push(len(stack))
 
     return None
 
 
-def astar(gui):
-    start = gui.start
-    end = gui.end
+def astar(search):
+    start = search.start_id
+    end = search.end_id
+    neighbors = search.neighbors
+    heuristic = search.heuristic
+    costs = search.costs
+    closed = search.visited
+    parent = search.parent
+    reach = search.reach
+    stats = search.stats
 
     open_set = []
-    heapq.heappush(open_set, (0, start))
-    gui.visited.add(start)
-    g_cost = {start: 0}
-    f_cost = {start: gui.heuristic(start, end)}
+    heapq.heappush(open_set, (heuristic(start, end), start))
+    g_cost = search.cell_array(UNREACHED)
+    g_cost[start] = 0
+    if stats:
+        stats.push(1)
 
     while open_set:
         _, current = heapq.heappop(open_set)
+        if stats:
+            stats.pops += 1
 
         if current == end:
-            return gui.construct_path(current)
-
-        for neighbor in gui.get_neighbors(current):
-            tentative_g_cost = g_cost[current] + 1
+            return search.construct_path(current)
 
-            if neighbor not in g_cost or tentative_g_cost < g_cost[neighbor]:
-                gui.parent[neighbor] = current
+        if closed[current]:
+            if stats:
+                stats.stale_pops += 1
+            continue
+        closed[current] = 1
+        if stats:
+            stats.expansions += 1
+
+        for neighbor in neighbors(current):
+            tentative_g_cost = g_cost[current] + (1 if costs is None else costs[neighbor])
+            if tentative_g_cost < g_cost[neighbor]:
+                parent[neighbor] = current
                 g_cost[neighbor] = tentative_g_cost
-                f_cost[neighbor] = g_cost[neighbor] + gui.heuristic(neighbor, end)
-                if neighbor not in gui.visited:
-                    heapq.heappush(open_set, (f_cost[neighbor], neighbor))
-                    gui.visited.add(neighbor)
-                    gui.color_cell(neighbor, "visited")
-
-        gui.root.update()
-        time.sleep(0.2)
+                heapq.heappush(
+                    open_set, (tentative_g_cost + heuristic(neighbor, end), neighbor)
+                )
+                if reach:
+                    reach(neighbor)
+                if stats:
+                    stats.push(len(open_set))
 
     return None
 
 
-def dijkstra(gui):
-    start = gui.start
-    end = gui.end
+def dijkstra(search):
+    start = search.start_id
+    end = search.end_id
+    neighbors = search.neighbors
+    costs = search.costs
+    visited = search.visited
+    parent = search.parent
+    reach = search.reach
+    stats = search.stats
 
     pq = [(0, start)]
-    gui.visited.add(start)
-    distances = {start: 0}
+    visited[start] = 1
+    distances = search.cell_array(UNREACHED)
+    distances[start] = 0
+    if stats:
+        stats.push(1)
 
     while pq:
         current_dist, current = heapq.heappop(pq)
+        if stats:
+            stats.pops += 1
 
         if current == end:
-            return gui.construct_path(current)
+            return search.construct_path(current)
 
         if current_dist > distances[current]:
+            if stats:
+                stats.stale_pops += 1
             continue
 
-        for neighbor in gui.get_neighbors(current):
-            distance = current_dist + 1
-
-            if neighbor not in distances or distance < distances[neighbor]:
+        if stats:
+            stats.expansions += 1
+        for neighbor in neighbors(current):
+            distance = current_dist + (1 if costs is None else costs[neighbor])
+            if distance < distances[neighbor]:
                 distances[neighbor] = distance
-                gui.parent[neighbor] = current
+                parent[neighbor] = current
                 heapq.heappush(pq, (distance, neighbor))
-                if neighbor not in gui.visited:
-                    gui.visited.add(neighbor)
-                    gui.color_cell(neighbor, "visited")
-
-        gui.root.update()
-        time.sleep(0.2)
+                if stats:
+                    stats.push(len(pq))
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    if reach:
+                        reach(neighbor)
 
     return None
 
 
-def greedy_best_first_search(gui):
-    start = gui.start
-    end = gui.end
+def greedy_best_first_search(search):
+    start = search.start_id
+    end = search.end_id
+    neighbors = search.neighbors
+    heuristic = search.heuristic
+    visited = search.visited
+    parent = search.parent
+    reach = search.reach
+    stats = search.stats
 
-    open_set = [(gui.heuristic(start, end), start)]
-    gui.visited.add(start)
+    open_set = [(heuristic(start, end), start)]
+    visited[start] = 1
+    if stats:
+        stats.push(1)
 
     while open_set:
         _, current = heapq.heappop(open_set)
+        if stats:
+            stats.pops += 1
 
         if current == end:
-            return gui.construct_path(current)
-
-        for neighbor in gui.get_neighbors(current):
-            if neighbor not in gui.visited:
-                gui.parent[neighbor] = current
-                heapq.heappush(open_set, (gui.heuristic(neighbor, end), neighbor))
-                gui.visited.add(neighbor)
-                gui.color_cell(neighbor, "visited")
-
-        gui.root.update()
-        time.sleep(0.2)
+            return search.construct_path(current)
+
+        if stats:
+            stats.expansions += 1
+        for neighbor in neighbors(current):
+            if not visited[neighbor]:
+                parent[neighbor] = current
+                heapq.heappush(open_set, (heuristic(neighbor, end), neighbor))
+                visited[neighbor] = 1
+                if reach:
+                    reach(neighbor)
+                if stats:
+                    stats.push(len(open_set))
 
     return None
 
 
-def bidirectional_search(gui):
-    start = gui.start
-    end = gui.end
-
-    forward_queue = [start]
-    backward_queue = [end]
-    forward_visited = {start: None}
-    backward_visited = {end: None}
+def bidirectional_search(search):
+    start = search.start_id
+    end = search.end_id
+    neighbors = search.neighbors
+    visit = search.visit
+    stats = search.stats
+    # The two sides would otherwise only meet one step away from the start.
+    if start == end:
+        return search.cells([start])
+
+    # Each side's root is its own parent; -1 marks cells that side has not reached.
+    forward_visited = search.cell_array(-1)
+    backward_visited = search.cell_array(-1)
+    forward_visited[start] = start
+    backward_visited[end] = end
+    forward_queue = deque([start])
+    backward_queue = deque([end])
+    if stats:
+        stats.push(1)
+        stats.push(2)
 
     while forward_queue and backward_queue:
         # Forward search
-        current = forward_queue.pop(0)
-        gui.color_cell(current, "visited")
-
-        for neighbor in gui.get_neighbors(current):
-            if neighbor not in forward_visited:
+        current = forward_queue.popleft()
+        if visit:
+            visit(current)
+        if stats:
+            stats.pops += 1
+            stats.expansions += 1
+
+        for neighbor in neighbors(current):
+            if forward_visited[neighbor] == -1:
                 forward_visited[neighbor] = current
                 forward_queue.append(neighbor)
-                if neighbor in backward_visited:
-                    return gui.construct_bidirectional_path(
+                if stats:
+                    stats.push(len(forward_queue) + len(backward_queue))
+                if backward_visited[neighbor] != -1:
+                    return search.construct_bidirectional_path(
                         forward_visited, backward_visited, neighbor
                     )
 
         # Backward search
-        current = backward_queue.pop(0)
-        gui.color_cell(current, "visited")
-
-        for neighbor in gui.get_neighbors(current):
-            if neighbor not in backward_visited:
+        current = backward_queue.popleft()
+        if visit:
+            visit(current)
+        if stats:
+            stats.pops += 1
+            stats.expansions += 1
+
+        for neighbor in neighbors(current):
+            if backward_visited[neighbor] == -1:
                 backward_visited[neighbor] = current
                 backward_queue.append(neighbor)
-                if neighbor in forward_visited:
-                    return gui.construct_bidirectional_path(
+                if stats:
+                    stats.push(len(forward_queue) + len(backward_queue))
+                if forward_visited[neighbor] != -1:
+                    return search.construct_bidirectional_path(
                         forward_visited, backward_visited, neighbor
                     )
 
-        gui.root.update()
-        time.sleep(0.2)
-
     return None
 
 
-def random_walk(gui):
-    current = gui.start
-    path = [current]
-    gui.visited.add(current)
+def random_walk(search):
+    neighbors_of = search.neighbors
+    visited = search.visited
+    visit = search.visit
+    stats = search.stats
 
-    while current != gui.end:
-        neighbors = gui.get_neighbors(current)
-        unvisited_neighbors = [n for n in neighbors if n not in gui.visited]
+    current = search.start_id
+    path = [current]
+    visited[current] = 1
+    # The walker's position is a frontier of one cell: each step pops it and
+    # pushes the next.
+    if stats:
+        stats.push(1)
+
+    while current != search.end_id:
+        if stats:
+            stats.pops += 1
+            stats.expansions += 1
+        neighbors = neighbors_of(current)
+        unvisited_neighbors = [n for n in neighbors if not visited[n]]
 
         if unvisited_neighbors:
             next_cell = random.choice(unvisited_neighbors)
@@ -216,241 +322,194 @@ def random_walk(gui):
             return None
 
         path.append(next_cell)
-        gui.visited.add(next_cell)
-        gui.color_cell(next_cell, "visited")
+        visited[next_cell] = 1
+        if visit:
+            visit(next_cell)
+        if stats:
+            stats.push(1)
         current = next_cell
 
-        gui.root.update()
-        time.sleep(0.2)
+    return search.cells(path)
 
-    return path
 
+def ida_star(search):
+    end = search.end_id
+    neighbors = search.neighbors
+    heuristic = search.heuristic
+    costs = search.costs
+    visit = search.visit
+    stats = search.stats
+    on_path = search.flag_array()
 
-def ida_star(gui):
-    def search(path, g, f_limit):
+    def probe(path, g, f_limit):
         node = path[-1]
-        f = g + gui.heuristic(node, gui.end)
+        f = g + heuristic(node, end)
 
         if f > f_limit:
             return f, None
 
-        if node == gui.end:
+        if node == end:
             return f, path
 
+        if stats:
+            stats.expansions += 1
         min_cost = float("inf")
-        for neighbor in gui.get_neighbors(node):
-            if neighbor not in path:
+        for neighbor in neighbors(node):
+            if not on_path[neighbor]:
                 path.append(neighbor)
-                gui.visited.add(neighbor)
-                gui.color_cell(neighbor, "visited")
-                gui.root.update()
-                time.sleep(0.2)
+                on_path[neighbor] = 1
+                if visit:
+                    visit(neighbor)
+                if stats:
+                    stats.push(len(path))
 
-                cost, solution = search(path, g + 1, f_limit)
+                step = 1 if costs is None else costs[neighbor]
+                cost, solution = probe(path, g + step, f_limit)
 
                 if solution is not None:
                     return cost, solution
 
                 path.pop()
+                if stats:
+                    stats.pops += 1
+                on_path[neighbor] = 0
                 min_cost = min(min_cost, cost)
 
         return min_cost, None
 
-    f_limit = gui.heuristic(gui.start, gui.end)
+    f_limit = heuristic(search.start_id, end)
+    on_path[search.start_id] = 1
     while True:
-        gui.visited.clear()
-        cost, solution = search([gui.start], 0, f_limit)
+        cost, solution = probe([search.start_id], 0, f_limit)
         if solution is not None:
-            return solution
+            return search.cells(solution)
         if cost == float("inf"):
             return None
         f_limit = cost
 
-def jump_point_search(gui):
-    def identify_successors(node):
-        successors = []
-        for direction in directions:
-            jp = jump(node, direction)
-            if jp:
-                successors.append(jp)
-        return successors
-
-    def jump(node, direction):
-        x, y = node
-        dx, dy = direction
-        nx, ny = x + dx, y + dy
-
-        if not gui.is_valid_cell((nx, ny)) or gui.is_wall((nx, ny)):
-            return None
-
-        if (nx, ny) == gui.end:
-            return (nx, ny)
-
-        # Check for forced neighbors
-        if dx != 0 and dy != 0:
-            if (gui.is_valid_cell((x + dx, y)) and gui.is_wall((x + dx, y + dy))) or \
-               (gui.is_valid_cell((x, y + dy)) and gui.is_wall((x + dx, y + dy))):
-                return (nx, ny)
-        else:
-            if dx != 0:
-                if (gui.is_valid_cell((nx + dx, ny)) and gui.is_wall((nx + dx, ny - 1))) or \
-                   (gui.is_valid_cell((nx + dx, ny)) and gui.is_wall((nx + dx, ny + 1))):
-                    return (nx, ny)
-            else:
-                if (gui.is_valid_cell((nx, ny + dy)) and gui.is_wall((nx - 1, ny + dy))) or \
-                   (gui.is_valid_cell((nx, ny + dy)) and gui.is_wall((nx + 1, ny + dy))):
-                    return (nx, ny)
-
-        return jump((nx, ny), direction)
-
-    start = gui.start
-    goal = gui.end
-    directions = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
-    open_list = {start}
-    closed_list = set()
-    parents = {start: None}
-
-    while open_list:
-        current = min(open_list, key=lambda x: gui.heuristic(x, goal))
-        open_list.remove(current)
 
-        if current == goal:
-            return gui.construct_path(goal)
-
-        closed_list.add(current)
-
-        for successor in identify_successors(current):
-            if successor in closed_list:
-                continue
-
-            if successor not in open_list:
-                open_list.add(successor)
-                parents[successor] = current
+def jump_point_search(search):
+    # Heap-based JPS: A* over jump points found by scanning straight and
+    # diagonal runs of open cells. See `mazesolver.jps`.
+    return jump_search(search, OnlineJumps(search.grid, search.diagonal), search.diagonal)
+
+
+def jps_plus(search):
+    # JPS+: the same search, with every jump read from tables built once per maze.
+    grid = search.grid
+    table = grid.memo(("jps+", search.diagonal), lambda: JumpTable(grid, search.diagonal))
+    return jump_search(search, table, search.diagonal)
+
+
+def hpa_star(search):
+    # HPA*: A* over cluster entrances, refined cluster by cluster. The abstract
+    # graph is cached on the grid and repaired in place by `set_wall`.
+    grid = search.grid
+    graph = grid.memo(("hpa*", CLUSTER_SIZE), lambda: AbstractGraph(grid))
+    path = graph.find_path(search.start_id, search.end_id, search.visit, search.stats)
+    return search.cells(path) if path else None
+
+
+def bellman_ford(search):
+    # Queue-driven Bellman-Ford (SPFA): only cells whose distance just improved
+    # are relaxed again, and the search stops as soon as nothing changes.
+    if search.sparse:
+        neighbors = search.neighbors
+    else:
+        offsets, targets = search.grid.adjacency()
+        neighbors = lambda u: targets[offsets[u]:offsets[u + 1]]
+    costs = search.costs
+    reach = search.reach
+    stats = search.stats
+    start = search.start_id
+    goal = search.end_id
+    distance = search.cell_array(UNREACHED)
+    edges = search.cell_array(0)
+    queued = search.flag_array()
+    parents = search.parent
+    # A path of as many steps as there are cells reached so far repeats a cell,
+    # which only a negative-cost cycle makes shorter.
+    reached = 1
+
+    distance[start] = 0
+    queue = deque([start])
+    queued[start] = 1
+    if stats:
+        stats.push(1)
+
+    while queue:
+        u = queue.popleft()
+        queued[u] = 0
+        if stats:
+            stats.pops += 1
+            stats.expansions += 1
+        du = distance[u]
+        for v in neighbors(u):
+            dv = du + (1 if costs is None else costs[v])
+            if dv < distance[v]:
+                if distance[v] == UNREACHED:
+                    reached += 1
+                distance[v] = dv
+                parents[v] = u
+                edges[v] = edges[u] + 1
+                if edges[v] >= reached:
+                    raise ValueError("The maze has a negative-cost cycle reachable from the start")
+                if not queued[v]:
+                    queued[v] = 1
+                    queue.append(v)
+                    if reach:
+                        reach(v)
+                    if stats:
+                        stats.push(len(queue))
+
+    if distance[goal] != UNREACHED:
+        return search.construct_path(goal)
 
     return None
 
-def bellman_ford(gui):
-    start = gui.start
-    goal = gui.end
-    distance = {start: 0}
-    parents = {start: None}
-    vertices = [(i, j) for i in range(gui.height) for j in range(gui.width) if not gui.is_wall((i, j))]
-
-    for _ in range(len(vertices) - 1):
-        for x in range(gui.height):
-            for y in range(gui.width):
-                if gui.is_wall((x, y)):
-                    continue
-                for neighbor in gui.get_neighbors((x, y)):
-                    if (x, y) not in distance:
-                        distance[(x, y)] = float('inf')
-                    if neighbor not in distance:
-                        distance[neighbor] = float('inf')
-                    if distance[(x, y)] + 1 < distance[neighbor]:
-                        distance[neighbor] = distance[(x, y)] + 1
-                        parents[neighbor] = (x, y)
-
-    if goal in parents:
-        path = []
-        current = goal
-        while current:
-            path.append(current)
-            current = parents[current]
-        return path[::-1]
 
-    return None
-
-
-def floyd_warshall(gui):
-    dist = {}
-    next_node = {}
-
-    for i in range(gui.height):
-        for j in range(gui.width):
-            if not gui.is_wall((i, j)):
-                dist[(i, j)] = {}
-                next_node[(i, j)] = {}
-                for ni in range(gui.height):
-                    for nj in range(gui.width):
-                        if not gui.is_wall((ni, nj)):
-                            dist[(i, j)][(ni, nj)] = float("inf")
-                            next_node[(i, j)][(ni, nj)] = None
-                dist[(i, j)][(i, j)] = 0
-                for neighbor in gui.get_neighbors((i, j)):
-                    dist[(i, j)][neighbor] = 1
-                    next_node[(i, j)][neighbor] = neighbor
-
-    for k in dist:
-        for i in dist:
-            for j in dist:
-                if dist[i][j] > dist[i][k] + dist[k][j]:
-                    dist[i][j] = dist[i][k] + dist[k][j]
-                    next_node[i][j] = next_node[i][k]
-
-    start = gui.start
-    goal = gui.end
-    if next_node[start][goal] is None:
-        return None
-
-    path = []
-    current = start
-    while current != goal:
-        path.append(current)
-        current = next_node[current][goal]
-    path.append(goal)
+def floyd_warshall(search):
+    grid = search.grid
+    # The table answers every start/end pair, so keep it until the maze changes.
+    # It is built with one BFS per open cell: the dense NumPy Floyd-Warshall
+    # method is O(V^3) and already slower on a 30 x 30 maze.
+    built = []
+
+    def build():
+        built.append(AllPairs(grid, method="bfs"))
+        return built[0]
+
+    table = grid.memo("all_pairs", build)
+    path = table.path(search.start, search.end)
+    stats = search.stats
+    if stats:
+        if built:
+            # One BFS per open cell, each pushing, popping and expanding every
+            # cell it reaches once: one per reachable pair in the table.
+            reached = len(table.distances) - table.distances.count(table.unreachable)
+            stats.pushes += reached
+            stats.pops += reached
+            stats.expansions += reached
+        # Answering the query steps through one next-hop entry per path cell.
+        stats.expansions += len(path) - 1 if path else 0
     return path
 
 
-def d_star(gui):
-    def expand(node):
-        return [(neighbor, 1) for neighbor in gui.get_neighbors(node)]
+def d_star(search):
+    # A one-off D* Lite plan. Keep a DStarLite planner instead to replan
+    # incrementally as the maze changes.
+    planner = DStarLite(search.grid, search.start, search.end, search.observer, search.stats)
+    return planner.plan()
 
-    start = gui.start
-    goal = gui.end
-    open_list = {start}
-    closed_list = set()
-    parents = {start: None}
-    g_scores = {start: 0}
-    f_scores = {start: gui.heuristic(start, goal)}
 
-    while open_list:
-        current = min(open_list, key=lambda x: f_scores.get(x, float("inf")))
-        if current == goal:
-            path = []
-            while current:
-                path.append(current)
-                current = parents[current]
-            return path[::-1]
-
-        open_list.remove(current)
-        closed_list.add(current)
-
-        gui.color_cell(current, "visited")
-        gui.root.update()
-        time.sleep(0.2)
-
-        for neighbor, cost in expand(current):
-            if neighbor in closed_list:
-                continue
-
-            tentative_g_score = g_scores[current] + cost
-
-            if neighbor not in open_list:
-                open_list.add(neighbor)
-            elif tentative_g_score >= g_scores.get(neighbor, float("inf")):
-                continue
-
-            parents[neighbor] = current
-            g_scores[neighbor] = tentative_g_score
-            f_scores[neighbor] = g_scores[neighbor] + gui.heuristic(neighbor, goal)
-
-    return None
-
-
-def theta_star(gui):
+def theta_star(search):
     def line_of_sight(start, end):
-        x0, y0 = start
-        x1, y1 = end
+        """
+        Walks the cells on the line from start to end. Returns the cost of moving
+        along it (the cost of every cell after start), or None if a wall blocks it.
+        """
+        x0, y0 = divmod(start, stride)
+        x1, y1 = divmod(end, stride)
         dx = abs(x1 - x0)
         dy = abs(y1 - y0)
         x = x0
@@ -461,10 +520,13 @@ def theta_star(gui):
         error = dx - dy
         dx *= 2
         dy *= 2
+        cost = 0
 
         for _ in range(n):
-            if gui.is_wall((x, y)):
-                return False
+            index = x * stride + y
+            if cells[index]:
+                return None
+            cost += 1 if costs is None else costs[index]
             if error > 0:
                 x += x_inc
                 error -= dy
@@ -472,178 +534,224 @@ def theta_star(gui):
                 y += y_inc
                 error += dx
 
-        return True
+        return cost - (1 if costs is None else costs[start])
+
+    cells = search.grid.cells
+    stride = search.grid.stride
+    neighbors = search.neighbors
+    heuristic = search.heuristic
+    costs = search.costs
+    reach = search.reach
+    stats = search.stats
 
-    start = gui.start
-    goal = gui.end
+    start = search.start_id
+    goal = search.end_id
     open_set = [(0, start)]
-    came_from = {}
-    g_score = {start: 0}
-    f_score = {start: gui.heuristic(start, goal)}
+    came_from = search.parent
+    g_score = search.cell_array(UNREACHED)
+    g_score[start] = 0
+    if stats:
+        stats.push(1)
 
     while open_set:
         current = heapq.heappop(open_set)[1]
+        if stats:
+            stats.pops += 1
 
         if current == goal:
-            path = [current]
-            while current in came_from:
-                current = came_from[current]
-                path.append(current)
-            return path[::-1]
-
-        for neighbor in gui.get_neighbors(current):
-            if neighbor in came_from and line_of_sight(came_from[current], neighbor):
-                tentative_g_score = g_score[came_from[current]] + gui.heuristic(
-                    came_from[current], neighbor
-                )
+            return search.construct_path(current)
+
+        if stats:
+            stats.expansions += 1
+        for neighbor in neighbors(current):
+            parent = came_from[current]
+            sight = None
+            if parent != -1 and came_from[neighbor] != -1:
+                sight = line_of_sight(parent, neighbor)
+            if sight is not None:
+                tentative_g_score = g_score[parent] + sight
+                source = parent
             else:
-                tentative_g_score = g_score[current] + 1
-
-            if tentative_g_score < g_score.get(neighbor, float("inf")):
-                if neighbor in came_from and line_of_sight(
-                    came_from[current], neighbor
-                ):
-                    came_from[neighbor] = came_from[current]
-                else:
-                    came_from[neighbor] = current
+                tentative_g_score = g_score[current] + (
+                    1 if costs is None else costs[neighbor]
+                )
+                source = current
+
+            if tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = source
                 g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + gui.heuristic(neighbor, goal)
-                heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                heapq.heappush(
+                    open_set, (tentative_g_score + heuristic(neighbor, goal), neighbor)
+                )
 
-                gui.color_cell(neighbor, "visited")
-                gui.root.update()
-                time.sleep(0.2)
+                if reach:
+                    reach(neighbor)
+                if stats:
+                    stats.push(len(open_set))
 
     return None
 
 
-def fringe_search(gui):
-    def expand(node):
-        return [(neighbor, 1) for neighbor in gui.get_neighbors(node)]
+def fringe_search(search):
+    neighbors = search.neighbors
+    heuristic = search.heuristic
+    costs = search.costs
+    visit = search.visit
+    stats = search.stats
+
+    start = search.start_id
+    goal = search.end_id
+    parents = search.parent
+    g_costs = search.cell_array(UNREACHED)
+    # The g-cost each cell was last expanded at, so duplicates left in the fringe
+    # by a later improvement are skipped.
+    expanded = search.cell_array(UNREACHED)
+    g_costs[start] = 0
+
+    now = [start]
+    later = []
+    flimit = heuristic(start, goal)
+    if stats:
+        stats.push(1)
+    while now:
+        next_flimit = UNREACHED
+        while now:
+            node = now.pop()
+            g = g_costs[node]
+            if stats:
+                stats.pops += 1
+            if expanded[node] <= g:
+                if stats:
+                    stats.stale_pops += 1
+                continue
 
-    start = gui.start
-    goal = gui.end
-    fringes = {0: [start]}
-    visited = set()
-    parents = {start: None}
-    costs = {start: 0}
+            f = g + heuristic(node, goal)
+            if f > flimit:
+                later.append(node)
+                next_flimit = min(next_flimit, f)
+                if stats:
+                    stats.push(len(now) + len(later))
+                continue
 
-    flimit = gui.heuristic(start, goal)
-    while True:
-        while fringes.get(flimit, []):
-            current_fringes = fringes[flimit]
-            fringes[flimit] = []
-            for node in current_fringes:
-                if node == goal:
-                    path = []
-                    while node is not None:
-                        path.append(node)
-                        node = parents[node]
-                    return path[::-1]
-
-                if node in visited:
-                    continue
-
-                visited.add(node)
-                gui.color_cell(node, "visited")
-                gui.root.update()
-                time.sleep(0.2)
-
-                for child, cost in expand(node):
-                    if child in visited:
-                        continue
-
-                    g = costs[node] + cost
-                    h = gui.heuristic(child, goal)
-                    f = g + h
-
-                    if f > flimit:
-                        if child not in fringes:
-                            fringes[f] = []
-                        fringes[f].append(child)
-                        if child not in costs:
-                            costs[child] = g
-                        if child not in parents:
-                            parents[child] = node
-                    elif child not in costs or g < costs[child]:
-                        costs[child] = g
-                        parents[child] = node
-                        if child not in fringes:
-                            fringes[flimit] = []
-                        fringes[flimit].append(child)
-
-            if not fringes[flimit]:
-                del fringes[flimit]
-        if not fringes:
-            return None
-        flimit = min(fringes.keys())
-
-
-def sma_star(gui):
-    class Node:
-        def __init__(self, state, parent=None, g=0, h=0):
-            self.state = state
-            self.parent = parent
-            self.g = g
-            self.h = h
-            self.f = g + h
-            self.children = []
-
-    def expand(node):
-        if not node.children:
-            for neighbor in gui.get_neighbors(node.state):
-                child = Node(
-                    neighbor, node, node.g + 1, gui.heuristic(neighbor, gui.end)
-                )
-                node.children.append(child)
-        return node.children
+            if node == goal:
+                return search.construct_path(node)
 
-    start_node = Node(gui.start, None, 0, gui.heuristic(gui.start, gui.end))
-    open_list = [start_node]
-    closed_set = set()
+            expanded[node] = g
+            if visit:
+                visit(node)
+            if stats:
+                stats.expansions += 1
+
+            for child in neighbors(node):
+                child_g = g + (1 if costs is None else costs[child])
+                if child_g < g_costs[child]:
+                    g_costs[child] = child_g
+                    parents[child] = node
+                    now.append(child)
+                    if stats:
+                        stats.push(len(now) + len(later))
+
+        now, later = later, []
+        flimit = next_flimit
+
+    return None
+
+
+def sma_star(search):
+    # The open list is a min-heap on f for expansion plus a max-heap on f for
+    # evicting the worst node once it outgrows `memory_limit`. Both use lazy
+    # deletion: `entry[cell]` holds the stamp of the cell's live entry (0 when
+    # the cell is not open) and entries with any other stamp are stale.
+    neighbors = search.neighbors
+    heuristic = search.heuristic
+    costs = search.costs
+    visit = search.visit
+    stats = search.stats
+    start = search.start_id
+    goal = search.end_id
+    closed_set = search.visited
+    parents = search.parent
     memory_limit = 1000  # Adjust this value based on available memory
 
-    while open_list:
-        current = min(open_list, key=lambda x: x.f)
-        open_list.remove(current)
+    g_scores = search.cell_array(UNREACHED)
+    f_scores = search.cell_array(UNREACHED)
+    entry = search.cell_array(0)
+    # Open children per cell, so a parent whose last child is evicted can be
+    # reopened with that child's f backed up into its own.
+    open_children = search.cell_array(0)
+    lowest = []
+    highest = []
+    stamp = 0
+    open_count = 0
+
+    def push(cell):
+        nonlocal stamp, open_count
+        stamp += 1
+        if not entry[cell]:
+            open_count += 1
+            if parents[cell] != -1:
+                open_children[parents[cell]] += 1
+        entry[cell] = stamp
+        heapq.heappush(lowest, (f_scores[cell], stamp, cell))
+        heapq.heappush(highest, (-f_scores[cell], -stamp, cell))
+        if stats:
+            stats.push(open_count)
+
+    def leave(cell):
+        nonlocal open_count
+        entry[cell] = 0
+        open_count -= 1
+        if parents[cell] != -1:
+            open_children[parents[cell]] -= 1
+
+    g_scores[start] = 0
+    f_scores[start] = heuristic(start, goal)
+    push(start)
+
+    while lowest:
+        _, cell_stamp, current = heapq.heappop(lowest)
+        if stats:
+            stats.pops += 1
+        if entry[current] != cell_stamp:
+            if stats:
+                stats.stale_pops += 1
+            continue
+        leave(current)
 
-        if current.state == gui.end:
-            path = []
-            while current:
-                path.append(current.state)
-                current = current.parent
-            return path[::-1]
+        if current == goal:
+            return search.construct_path(current)
 
-        closed_set.add(current.state)
-        gui.color_cell(current.state, "visited")
-        gui.root.update()
-        time.sleep(0.2)
+        closed_set[current] = 1
+        if visit:
+            visit(current)
+        if stats:
+            stats.expansions += 1
 
-        for child in expand(current):
-            if child.state in closed_set:
+        for neighbor in neighbors(current):
+            if closed_set[neighbor]:
                 continue
+            g = g_scores[current] + (1 if costs is None else costs[neighbor])
+            if g >= g_scores[neighbor]:
+                continue
+            if entry[neighbor] and parents[neighbor] != -1:
+                # Moving an open cell to a better parent.
+                open_children[parents[neighbor]] -= 1
+                open_children[current] += 1
+            parents[neighbor] = current
+            g_scores[neighbor] = g
+            f_scores[neighbor] = g + heuristic(neighbor, goal)
+            push(neighbor)
 
-            if child not in open_list:
-                open_list.append(child)
-            elif child.g < next(
-                node.g for node in open_list if node.state == child.state
-            ):
-                open_list.remove(
-                    next(node for node in open_list if node.state == child.state)
-                )
-                open_list.append(child)
-
-        if len(open_list) > memory_limit:
-            worst = max(open_list, key=lambda x: x.f)
-            open_list.remove(worst)
-            if worst.parent and all(
-                child in closed_set for child in worst.parent.children
-            ):
-                worst.parent.children.remove(worst)
-                if (
-                    worst.parent not in open_list
-                    and worst.parent.state not in closed_set
-                ):
-                    open_list.append(worst.parent)
+        while open_count > memory_limit and highest:
+            _, cell_stamp, worst = heapq.heappop(highest)
+            if entry[worst] != -cell_stamp or worst == start:
+                continue
+            leave(worst)
+            g_scores[worst] = UNREACHED
+            parent = parents[worst]
+            if parent != -1 and closed_set[parent] and not open_children[parent]:
+                closed_set[parent] = 0
+                f_scores[parent] = max(f_scores[parent], f_scores[worst])
+                push(parent)
 
     return None
@@ -0,0 +1,285 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/allpairs.py
+
+import struct
+from array import array
+
+from .distance import numpy, NONE, RIGHT, LEFT, DOWN, UP, STEPS
+
+MAGIC = b"MZAP"
+HEADER = struct.Struct("<4sHIII")  # magic, version, height, width, vertex count
+VERSION = 1
+
+
+class AllPairs:
+    """
+    All-pairs shortest paths over the open cells of a maze.
+
+    Open cells are numbered 0..V-1 in row-major order. The table holds two V x V
+    matrices, stored flat with one row per *target*:
+
+    - `distances`: uint16 (uint32 for mazes with 65535+ open cells) step counts,
+      with `unreachable` for pairs that are not connected.
+    - `next_hops`: one byte per pair, the direction code (see `mazesolver.distance`)
+      of the first step from a cell towards the target.
+
+    so `distance()` and `next_hop()` are O(1) lookups and `path()` walks next hops.
+    A table can be saved to disk with `save()` and read back with `AllPairs.load()`
+    without the grid.
+
+    Every step costs 1, so a WeightedGrid is refused with a ValueError, as is a
+    sparse grid (a huge BitGrid or a TiledGrid), whose table could never fit in
+    memory.
+
+    Args:
+        grid (Grid): An unweighted maze.
+        method (str): "bfs" runs a breadth-first search from every open cell, the
+            fastest choice for unit-cost mazes. "floyd" runs Floyd-Warshall as NumPy
+            min-plus updates on a dense int32 matrix; it is O(V^3) and only worth it
+            for small mazes.
+        workers (int, optional): With method "bfs", split the sources across this
+            many worker processes.
+    """
+
+    def __init__(self, grid, method="bfs", workers=None):
+        if getattr(grid, "costs", None) is not None:
+            raise ValueError("AllPairs needs a uniform-cost grid")
+        if getattr(grid, "sparse", False):
+            raise ValueError("AllPairs cannot index a sparse grid; use a search algorithm")
+        self.height = grid.height
+        self.width = grid.width
+        self.stride = grid.stride
+        self.ids = array("i", grid.open_indexes())
+        self._index_positions(len(grid.cells))
+
+        size = len(self.ids)
+        self.typecode = "H" if size < 0xFFFF else "I"
+        self.unreachable = 0xFFFF if self.typecode == "H" else 0xFFFFFFFF
+
+        if method == "bfs":
+            self._build_bfs(grid, workers)
+        elif method == "floyd":
+            self._build_floyd(grid)
+        else:
+            raise ValueError(f"Unknown all-pairs method: {method!r}")
+
+    def _index_positions(self, nbytes):
+        self.positions = array("i", [-1]) * nbytes
+        for position, index in enumerate(self.ids):
+            self.positions[index] = position
+
+    def _step_codes(self):
+        return {1: RIGHT, -1: LEFT, self.stride: DOWN, -self.stride: UP}
+
+    def _compact_adjacency(self, grid):
+        """
+        For every open cell, lists `(neighbor, code)` pairs where `code` is the
+        direction of the step from that neighbor back to the cell.
+        """
+        offsets, targets = grid.adjacency()
+        codes = self._step_codes()
+        positions = self.positions
+        adjacency = []
+        for index in self.ids:
+            adjacency.append(
+                [
+                    (positions[n], codes[index - n])
+                    for n in targets[offsets[index]:offsets[index + 1]]
+                ]
+            )
+        return adjacency
+
+    def _build_bfs(self, grid, workers):
+        adjacency = self._compact_adjacency(grid)
+        size = len(self.ids)
+        sources = range(size)
+        self.distances = array(self.typecode)
+        self.next_hops = bytearray()
+
+        if workers and workers > 1 and size > 1:
+            # Imported here: the process pool machinery is slow to import.
+            from concurrent.futures import ProcessPoolExecutor
+
+            chunk = max(1, size // (workers * 4))
+            chunks = [sources[i:i + chunk] for i in range(0, size, chunk)]
+            with ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(adjacency, self.typecode)
+            ) as pool:
+                for distances, next_hops in pool.map(_worker_rows, chunks):
+                    self.distances.frombytes(distances)
+                    self.next_hops += next_hops
+        else:
+            for source in sources:
+                distances, next_hops = _bfs_row(adjacency, self.typecode, source)
+                self.distances.extend(distances)
+                self.next_hops += next_hops
+
+    def _build_floyd(self, grid):
+        np = numpy()
+        if np is None:
+            raise ImportError("the floyd all-pairs method needs NumPy: pip install numpy")
+        size = len(self.ids)
+        infinity = np.iinfo(np.int32).max // 2  # so that infinity + infinity fits
+        dist = np.full((size, size), infinity, dtype=np.int32)
+        hops = np.zeros((size, size), dtype=np.uint8)
+        np.fill_diagonal(dist, 0)
+
+        # dist[i, j] and hops[i, j] describe the way from i to j. An edge u -> n
+        # starts with the step in the direction of n.
+        for u, edges in enumerate(self._compact_adjacency(grid)):
+            for n, code in edges:
+                dist[n, u] = 1
+                hops[n, u] = code
+
+        for k in range(size):
+            through = dist[:, k, None] + dist[None, k, :]
+            better = through < dist
+            np.minimum(dist, through, out=dist)
+            hops[better] = np.broadcast_to(hops[:, k, None], hops.shape)[better]
+
+        dist[dist >= infinity] = self.unreachable
+        dtype = np.uint16 if self.typecode == "H" else np.uint32
+        # Stored with one row per target, i.e. transposed.
+        self.distances = array(self.typecode, dist.T.astype(dtype).tobytes())
+        self.next_hops = bytearray(hops.T.tobytes())
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _position(self, cell):
+        x, y = cell
+        if not (0 <= x < self.height and 0 <= y < self.width):
+            return -1
+        return self.positions[(x + 1) * self.stride + y + 1]
+
+    def distance(self, a, b):
+        """
+        Returns the number of steps between cells `a` and `b`, or None if `b` cannot
+        be reached from `a` (or either cell is a wall).
+        """
+        i, j = self._position(a), self._position(b)
+        if i < 0 or j < 0:
+            return None
+        d = self.distances[j * len(self.ids) + i]
+        return None if d == self.unreachable else d
+
+    def next_hop(self, a, b):
+        """
+        Returns the cell to move to from `a` on a shortest path to `b`, or None if
+        `a` is `b` or `b` cannot be reached.
+        """
+        i, j = self._position(a), self._position(b)
+        if i < 0 or j < 0:
+            return None
+        code = self.next_hops[j * len(self.ids) + i]
+        if code == NONE:
+            return None
+        dx, dy = STEPS[code]
+        return (a[0] + dx, a[1] + dy)
+
+    def path(self, a, b):
+        """
+        Returns a shortest path from `a` to `b` as (x, y) tuples, or None.
+        """
+        if self.distance(a, b) is None:
+            return None
+        size = len(self.ids)
+        row = self._position(b) * size
+        next_hops = self.next_hops
+        positions = self.positions
+        steps = {code: dx * self.stride + dy for code, (dx, dy) in STEPS.items()}
+
+        index = self.ids[self._position(a)]
+        target = self.ids[self._position(b)]
+        path = [a]
+        while index != target:
+            index += steps[next_hops[row + positions[index]]]
+            x, y = divmod(index, self.stride)
+            path.append((x - 1, y - 1))
+        return path
+
+    def save(self, path):
+        """
+        Writes the table to `path` in a compact binary format.
+        """
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.height, self.width, len(self.ids)))
+            f.write(self.typecode.encode("ascii"))
+            self.ids.tofile(f)
+            self.distances.tofile(f)
+            f.write(self.next_hops)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a table written by `save()`.
+        """
+        table = cls.__new__(cls)
+        with open(path, "rb") as f:
+            magic, version, height, width, size = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not an all-pairs table")
+            table.height = height
+            table.width = width
+            table.stride = width + 2
+            table.typecode = f.read(1).decode("ascii")
+            table.unreachable = 0xFFFF if table.typecode == "H" else 0xFFFFFFFF
+            table.ids = array("i")
+            table.ids.fromfile(f, size)
+            table.distances = array(table.typecode)
+            table.distances.fromfile(f, size * size)
+            table.next_hops = bytearray(f.read(size * size))
+        table._index_positions((height + 2) * table.stride)
+        return table
+
+
+def _bfs_row(adjacency, typecode, source):
+    """
+    Breadth-first search from `source` over the compact adjacency lists. Returns
+    the distance from every cell to `source` and each cell's first step towards it.
+    """
+    size = len(adjacency)
+    unreachable = 0xFFFF if typecode == "H" else 0xFFFFFFFF
+    distances = array(typecode, [unreachable]) * size
+    next_hops = bytearray(size)
+    distances[source] = 0
+    frontier = [source]
+    level = 0
+    while frontier:
+        level += 1
+        reached = []
+        for u in frontier:
+            for n, code in adjacency[u]:
+                if distances[n] == unreachable:
+                    distances[n] = level
+                    next_hops[n] = code
+                    reached.append(n)
+        frontier = reached
+    return distances, next_hops
+
+
+_worker_state = None
+
+
+def _init_worker(adjacency, typecode):
+    global _worker_state
+    _worker_state = (adjacency, typecode)
+
+
+def _worker_rows(sources):
+    adjacency, typecode = _worker_state
+    distances = array(typecode)
+    next_hops = bytearray()
+    for source in sources:
+        row_distances, row_next_hops = _bfs_row(adjacency, typecode, source)
+        distances.extend(row_distances)
+        next_hops += row_next_hops
+    return distances.tobytes(), bytes(next_hops)
@@ -0,0 +1,176 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/batch.py
+
+import os
+import time
+from array import array
+from collections import namedtuple
+
+from .engine import solve
+from .grid import Grid, WeightedGrid
+from .tiled import TiledGrid
+
+BatchResult = namedtuple(
+    "BatchResult", ["index", "start", "end", "algorithm", "path", "seconds", "error"]
+)
+BatchResult.__doc__ = """
+The outcome of one batch job. `index` is the job's position in the input,
+`path` the solved path (or None), `seconds` the wall-clock solve time measured in
+the worker, and `error` the exception the job raised, if any.
+"""
+
+
+def solve_batch(jobs, workers=None, **options):
+    """
+    Solves many mazes, or many start/end pairs on the same maze, in parallel.
+
+    Jobs are fanned out over a ProcessPoolExecutor. Each distinct grid is copied
+    once into shared memory and workers map it as their grid buffer, so a large
+    maze is not pickled with every job. Workers keep the grids they attach, along
+    with anything cached on them (adjacency, JPS+ tables), for later jobs.
+
+    Results are yielded in completion order, not submission order; use
+    `BatchResult.index` to match them with their jobs. Jobs are read lazily and
+    only a few per worker are in flight at a time, so `jobs` can be a generator.
+
+    Args:
+        jobs (iterable): `(maze, start, end, algorithm)` tuples, where `maze` is a
+            Grid, a WeightedGrid, a BitGrid or a list of 0/1 rows. A TiledGrid
+            can only be solved with `workers=1`.
+        workers (int, optional): The number of worker processes. Defaults to the
+            number of CPUs; 1 solves every job in this process.
+        **options: Passed on to `solve()`, e.g. `adjacency=True` or `diagonal=True`.
+
+    Yields:
+        BatchResult: One result per job.
+
+    Raises:
+        ValueError: If a job's maze is a TiledGrid and `workers` is not 1; its
+            cells live in a file, not in a buffer that can be shared.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for index, (maze, start, end, algorithm) in enumerate(jobs):
+            yield _run(index, maze, start, end, algorithm, options)
+        return
+
+    # Imported here: the process pool machinery is slow to import, and solving
+    # a single maze should not pay for it.
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    shared = {}
+    segments = []
+    pending = set()
+    jobs = enumerate(jobs)
+    pool = ProcessPoolExecutor(workers)
+    try:
+        while True:
+            for index, (maze, start, end, algorithm) in jobs:
+                key = id(maze)
+                if key not in shared:
+                    # Holding on to the maze keeps its id from being reused.
+                    shared[key] = (maze, _share(_as_grid(maze), segments))
+                pending.add(
+                    pool.submit(_work, index, shared[key][1], start, end, algorithm, options)
+                )
+                if len(pending) >= workers * 4:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def _as_grid(maze):
+    return maze if isinstance(maze, Grid) else Grid.from_rows(maze)
+
+
+def _run(index, maze, start, end, algorithm, options):
+    began = time.perf_counter()
+    try:
+        path = solve(maze, start, end, algorithm, **options)
+        error = None
+    except Exception as exc:
+        path = None
+        error = exc
+    return BatchResult(
+        index, start, end, algorithm, path, time.perf_counter() - began, error
+    )
+
+
+def _share(grid, segments):
+    """
+    Copies a grid into shared memory and returns the spec workers attach it with.
+    """
+    if isinstance(grid, TiledGrid):
+        raise ValueError("A TiledGrid cannot be shared with worker processes; use workers=1")
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    # A BitGrid shares its packed bits; `nbytes` is the size of either buffer.
+    bits = getattr(grid, "bits", None)
+    cells = SharedMemory(create=True, size=grid.nbytes)
+    segments.append(cells)
+    cells.buf[:grid.nbytes] = grid.cells if bits is None else bits
+    if bits is not None:
+        return (grid.height, grid.width, cells.name, None, "bits")
+    costs = getattr(grid, "costs", None)
+    if costs is None:
+        return (grid.height, grid.width, cells.name, None, None)
+
+    data = memoryview(costs).cast("B")
+    weights = SharedMemory(create=True, size=len(data))
+    segments.append(weights)
+    weights.buf[:len(data)] = data
+    return (grid.height, grid.width, cells.name, weights.name, costs.typecode)
+
+
+# Grids attached by this worker process, keyed by their cells segment name.
+_attached = {}
+
+
+def _attach(spec):
+    height, width, cells_name, costs_name, typecode = spec
+    try:
+        return _attached[cells_name][0]
+    except KeyError:
+        pass
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    size = (height + 2) * (width + 2)
+    cells = SharedMemory(name=cells_name)
+    segments = [cells]
+    if typecode == "bits":
+        from .bitgrid import BitGrid
+        from .files import packed_row_bytes
+
+        nbytes = packed_row_bytes(width + 2) * (height + 2)
+        grid = BitGrid(height, width, cells.buf[:nbytes])
+    elif costs_name is None:
+        grid = Grid(height, width, cells.buf[:size])
+    else:
+        weights = SharedMemory(name=costs_name)
+        segments.append(weights)
+        costs = weights.buf[:size * array(typecode).itemsize].cast(typecode)
+        grid = WeightedGrid(height, width, cells.buf[:size], costs=costs)
+    _attached[cells_name] = (grid, segments)
+    return grid
+
+
+def _work(index, spec, start, end, algorithm, options):
+    return _run(index, _attach(spec), start, end, algorithm, options)
@@ -0,0 +1,217 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/bitgrid.py
+
+from .files import pack_row, packed_row_bytes
+from .grid import Grid
+
+# Above this many cell ids, searches on a BitGrid keep their per-cell state in
+# dicts sized by the explored region instead of arrays sized by the whole map.
+SPARSE_THRESHOLD = 1 << 26
+
+
+class BitCells:
+    """
+    A read/write view of a BitGrid's bits indexed like `Grid.cells`, so code that
+    looks cells up by id works on either grid.
+    """
+
+    __slots__ = ("bits", "stride", "row_bytes", "size")
+
+    def __init__(self, bits, stride, row_bytes, size):
+        self.bits = bits
+        self.stride = stride
+        self.row_bytes = row_bytes
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return bytes(self[i] for i in range(*index.indices(self.size)))
+        x, y = divmod(index, self.stride)
+        return self.bits[x * self.row_bytes + (y >> 3)] >> (y & 7) & 1
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            for i, v in zip(range(*index.indices(self.size)), value):
+                self[i] = v
+            return
+        x, y = divmod(index, self.stride)
+        byte = x * self.row_bytes + (y >> 3)
+        if value:
+            self.bits[byte] |= 1 << (y & 7)
+        else:
+            self.bits[byte] &= ~(1 << (y & 7)) & 0xFF
+
+
+class BitGrid(Grid):
+    """
+    A Grid stored at one bit per cell, for mazes too large for a byte per cell.
+
+    Cell ids, the wall border and the whole Grid interface are the same as for
+    Grid, so solvers run on it unchanged; `cells` is a BitCells view that reads
+    and writes single bits. Each padded row of `width + 2` bits is stored
+    little-endian and padded to whole 64-bit words, so a row can be read as one
+    Python integer (bit y + 1 is column y); see `open_mask`, which
+    `open_indexes` uses to list the open cells a row at a time.
+
+    A 100,000 x 100,000 maze takes about 1.25 GB. On grids past
+    SPARSE_THRESHOLD cells `sparse` is True and `Search` keeps visited flags,
+    parents and costs in dicts instead of arrays over every cell.
+
+    Args:
+        height (int): The number of rows.
+        width (int): The number of columns.
+        bits (bytearray, optional): Packed rows in the layout above, used as-is.
+            Defaults to an all-open maze.
+    """
+
+    def __init__(self, height, width, bits=None):
+        self.height = height
+        self.width = width
+        self.stride = width + 2
+        self.row_bytes = packed_row_bytes(self.stride)
+        size = (height + 2) * self.stride
+
+        if bits is None:
+            bits = bytearray(self.row_bytes * (height + 2))
+            self.bits = bits
+            self._fill_border()
+        elif len(bits) != self.row_bytes * (height + 2):
+            raise ValueError(
+                f"Expected {self.row_bytes * (height + 2)} bytes for a {height}x{width} "
+                f"bit grid, got {len(bits)}"
+            )
+        self.bits = bits
+        self.cells = BitCells(bits, self.stride, self.row_bytes, size)
+        self.sparse = size > SPARSE_THRESHOLD
+
+        self.offsets = (1, -1, self.stride, -self.stride)
+        self._moves = ((1, 0, 1), (-1, 0, -1), (self.stride, 1, 0), (-self.stride, -1, 0))
+        self._adjacency = None
+        self._cache = {}
+
+    @classmethod
+    def from_grid(cls, grid):
+        """
+        Packs a byte-per-cell Grid into a new BitGrid.
+        """
+        bit_grid = cls(grid.height, grid.width)
+        stride = grid.stride
+        row_bytes = bit_grid.row_bytes
+        for x in range(grid.height + 2):
+            row = grid.cells[x * stride:(x + 1) * stride]
+            bit_grid.bits[x * row_bytes:(x + 1) * row_bytes] = pack_row(row, row_bytes)
+        return bit_grid
+
+    @classmethod
+    def from_rows(cls, rows):
+        return cls.from_grid(Grid.from_rows(rows))
+
+    @classmethod
+    def from_packed(cls, height, width, data):
+        """
+        Builds a BitGrid from the bit-packed cell rows of a `.maze` file (rows of
+        `width` bits without the border, each padded to whole words).
+        """
+        grid = cls(height, width)
+        nbytes = packed_row_bytes(width)
+        border = 1 | (1 << (width + 1))
+        for x in range(height):
+            row = int.from_bytes(data[x * nbytes:(x + 1) * nbytes], "little")
+            grid._set_row(x + 1, (row << 1) | border)
+        return grid
+
+    def _row(self, x):
+        """
+        Returns padded row `x` (0 is the top border) as an integer of wall bits.
+        """
+        begin = x * self.row_bytes
+        return int.from_bytes(self.bits[begin:begin + self.row_bytes], "little")
+
+    def _set_row(self, x, value):
+        begin = x * self.row_bytes
+        self.bits[begin:begin + self.row_bytes] = value.to_bytes(self.row_bytes, "little")
+
+    def packed_row(self, x, nbytes):
+        """
+        Returns maze row `x` without its border bits, packed into `nbytes` bytes
+        as in a bit-packed `.maze` file.
+        """
+        row = self._row(x + 1) >> 1 & ((1 << self.width) - 1)
+        return row.to_bytes(nbytes, "little")
+
+    def _fill_border(self):
+        full = (1 << self.stride) - 1
+        border = 1 | (1 << (self.stride - 1))
+        self._set_row(0, full)
+        self._set_row(self.height + 1, full)
+        for x in range(1, self.height + 1):
+            self._set_row(x, border)
+
+    @property
+    def nbytes(self):
+        return len(self.bits)
+
+    def is_wall(self, cell):
+        y = cell[1] + 1
+        return bool(self.bits[(cell[0] + 1) * self.row_bytes + (y >> 3)] >> (y & 7) & 1)
+
+    def is_valid_cell(self, cell):
+        y = cell[1] + 1
+        return not self.bits[(cell[0] + 1) * self.row_bytes + (y >> 3)] >> (y & 7) & 1
+
+    def to_rows(self):
+        rows = []
+        for x in range(1, self.height + 1):
+            row = self._row(x) >> 1
+            rows.append([row >> y & 1 for y in range(self.width)])
+        return rows
+
+    def open_mask(self, x):
+        """
+        Returns maze row `x` as an integer with bit y + 1 set for each open cell.
+        """
+        full = (1 << self.stride) - 1
+        return ~self._row(x + 1) & full
+
+    def open_indexes(self):
+        stride = self.stride
+        indexes = []
+        for x in range(self.height):
+            mask = self.open_mask(x)
+            base = (x + 1) * stride
+            while mask:
+                low = mask & -mask
+                indexes.append(base + low.bit_length() - 1)
+                mask ^= low
+        return indexes
+
+    def neighbors(self, index):
+        bits = self.bits
+        stride = self.stride
+        row_bytes = self.row_bytes
+        x, y = divmod(index, stride)
+        base = x * row_bytes
+        found = []
+        right = y + 1
+        if not bits[base + (right >> 3)] >> (right & 7) & 1:
+            found.append(index + 1)
+        left = y - 1
+        if not bits[base + (left >> 3)] >> (left & 7) & 1:
+            found.append(index - 1)
+        if not bits[base + row_bytes + (y >> 3)] >> (y & 7) & 1:
+            found.append(index + stride)
+        if not bits[base - row_bytes + (y >> 3)] >> (y & 7) & 1:
+            found.append(index - stride)
+        return found
+
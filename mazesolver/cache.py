@@ -0,0 +1,178 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/cache.py
+
+import hashlib
+import weakref
+from array import array
+from collections import OrderedDict
+
+from .engine import solve
+from .grid import Grid
+from .jps import DIRECTIONS
+
+_CODES = {step: code for code, step in enumerate(DIRECTIONS)}
+
+
+class PathCache:
+    """
+    An LRU cache of solved paths, for services that ask the same questions of
+    the same mazes again and again.
+
+    Entries are keyed by a content hash of the grid (its cells, and costs for a
+    WeightedGrid) together with the endpoints, the algorithm and the solve
+    options, so equal mazes share entries whatever object holds them. A path is
+    stored as its start cell and one direction code byte per step; any-angle
+    paths (Theta*) fall back to an int32 array of their cells. Unreachable
+    queries are cached too.
+
+    The hash is cached on the grid and dropped by `set_wall` and `set_cost`, so
+    an edited maze is rehashed and misses. When the cache sees a grid whose
+    contents changed, it also evicts the entries stored for the old contents.
+
+    `hits`, `misses` and `evictions` count lookups and entries dropped to stay
+    within the limits; `nbytes` is the size of the stored paths.
+
+    Args:
+        max_entries (int): The most paths to keep.
+        max_bytes (int): The most bytes of stored paths to keep.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=16 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()
+        # The fingerprint each grid had when last seen, to spot edits.
+        self._seen = weakref.WeakKeyDictionary()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def solve(self, grid, start, end, algorithm="BFS", observer=None, stats=None, **options):
+        """
+        Returns the cached path for this query, solving and caching it on a miss.
+        Takes the same arguments as `solve()`; the observer and stats only see
+        misses.
+        """
+        if not isinstance(grid, Grid):
+            grid = Grid.from_rows(grid)
+        key = (self.fingerprint(grid), start, end, algorithm, tuple(sorted(options.items())))
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return _decode(entry)
+
+        path = solve(grid, start, end, algorithm, observer, stats=stats, **options)
+        self._store(key, _encode(path))
+        return path
+
+    def fingerprint(self, grid):
+        """
+        Returns the content hash of a grid, computing it once per edit.
+        """
+        fingerprint = grid.memo("fingerprint", lambda: _fingerprint(grid))
+        previous = self._seen.get(grid)
+        if previous != fingerprint:
+            if previous is not None:
+                self._discard(previous)
+            self._seen[grid] = fingerprint
+        return fingerprint
+
+    def discard(self, grid):
+        """
+        Drops every entry stored for the grid's current contents.
+        """
+        self._discard(self.fingerprint(grid))
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+        }
+
+    def _store(self, key, entry):
+        size = _entry_size(entry)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.nbytes += size
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.nbytes -= _entry_size(old)
+            self.evictions += 1
+
+    def _discard(self, fingerprint):
+        for key in [key for key in self._entries if key[0] == fingerprint]:
+            self.nbytes -= _entry_size(self._entries.pop(key))
+
+
+def _fingerprint(grid):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(b"%d,%d;" % (grid.height, grid.width))
+    cells = getattr(grid, "bits", grid.cells)
+    try:
+        digest.update(cells)
+    except TypeError:
+        raise TypeError(f"PathCache cannot hash a {type(grid).__name__}") from None
+    costs = getattr(grid, "costs", None)
+    if costs is not None:
+        digest.update(costs)
+    return digest.digest()
+
+
+def _encode(path):
+    """
+    Packs a path as `(start, steps)`: direction codes as bytes when every step
+    is to a neighboring cell, otherwise every cell in an int32 array.
+    """
+    if not path:
+        return None
+    try:
+        steps = bytes(
+            _CODES[(b[0] - a[0], b[1] - a[1])] for a, b in zip(path, path[1:])
+        )
+    except KeyError:
+        return (path[0], array("i", [v for cell in path for v in cell]))
+    return (path[0], steps)
+
+
+def _decode(entry):
+    if entry is None:
+        return None
+    start, steps = entry
+    if isinstance(steps, array):
+        return list(zip(steps[::2], steps[1::2]))
+    x, y = start
+    path = [start]
+    for code in steps:
+        dx, dy = DIRECTIONS[code]
+        x += dx
+        y += dy
+        path.append((x, y))
+    return path
+
+
+def _entry_size(entry):
+    if entry is None:
+        return 0
+    return len(entry[1]) * getattr(entry[1], "itemsize", 1)
@@ -0,0 +1,176 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/components.py
+
+from array import array
+from collections import deque
+
+
+class ComponentIndex:
+    """
+    Labels every open cell with its connected region, so whether two cells are
+    connected is answered in O(1).
+
+    Labels are joined with a union-find forest: opening a cell merges the
+    regions around it in near-constant time. Closing cells can split their
+    region; breadth-first searches from the open neighbors of the closed cells
+    run in lockstep and stop as soon as they all meet, so only the pieces that
+    really broke off (and never the largest one) are relabeled. Cached on a Grid with `memo()`, the
+    index is repaired automatically by `set_wall`.
+
+    Args:
+        grid (Grid): The maze.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.labels = array("i", [-1]) * len(grid.cells)
+        # Union-find parent of each label; a root is its own parent.
+        self.roots = array("i")
+        self._label_all()
+
+    def _label_all(self):
+        cells = self.grid.cells
+        labels = self.labels
+        offsets = self.grid.offsets
+        for seed in self.grid.open_indexes():
+            if labels[seed] != -1:
+                continue
+            label = self._new_label()
+            labels[seed] = label
+            frontier = deque([seed])
+            while frontier:
+                current = frontier.popleft()
+                for offset in offsets:
+                    neighbor = current + offset
+                    if labels[neighbor] == -1 and not cells[neighbor]:
+                        labels[neighbor] = label
+                        frontier.append(neighbor)
+
+    def _new_label(self):
+        self.roots.append(len(self.roots))
+        return len(self.roots) - 1
+
+    def _find(self, label):
+        roots = self.roots
+        while roots[label] != label:
+            roots[label] = roots[roots[label]]
+            label = roots[label]
+        return label
+
+    def label(self, index):
+        """
+        Returns the region label of the cell at `index`, or -1 for a wall.
+        """
+        label = self.labels[index]
+        return label if label == -1 else self._find(label)
+
+    def connected(self, a, b):
+        """
+        Returns True if a path of open cells joins the (x, y) cells `a` and `b`.
+        """
+        label = self.label(self.grid.index(a))
+        return label != -1 and label == self.label(self.grid.index(b))
+
+    def repair(self, changed):
+        """
+        Updates the labels after the changed cells were opened or walled off.
+        Called by `Grid.set_wall` when the index is cached on the grid.
+
+        Args:
+            changed (list): The (x, y) cells that changed.
+        """
+        cells = self.grid.cells
+        closed = []
+        for cell in changed:
+            index = self.grid.index(cell)
+            is_open = not cells[index]
+            if is_open and self.labels[index] == -1:
+                self._open(index)
+            elif not is_open and self.labels[index] != -1:
+                self.labels[index] = -1
+                closed.append(index)
+        if closed:
+            # Cells closed together are searched around together: a piece can
+            # be cut off by several of them and border each on one side only.
+            self._close(closed)
+
+    def _open(self, index):
+        cells = self.grid.cells
+        labels = self.labels
+        # A neighbor walled off later in the same batch still has its old label.
+        around = {
+            self._find(labels[index + offset])
+            for offset in self.grid.offsets
+            if labels[index + offset] != -1 and not cells[index + offset]
+        }
+        if not around:
+            labels[index] = self._new_label()
+            return
+        root = around.pop()
+        for other in around:
+            self.roots[other] = root
+        labels[index] = root
+
+    def _close(self, closed):
+        cells = self.grid.cells
+        labels = self.labels
+        offsets = self.grid.offsets
+        sides = list(dict.fromkeys(
+            index + offset for index in closed for offset in offsets
+            if not cells[index + offset]
+        ))
+        if len(sides) < 2:
+            return
+
+        # One search per open neighbor. `owner` maps each reached cell to the
+        # search that reached it first; `group` tracks which searches have met.
+        group = list(range(len(sides)))
+
+        def find(g):
+            while group[g] != g:
+                g = group[g]
+            return g
+
+        owner = {side: n for n, side in enumerate(sides)}
+        reached = [[side] for side in sides]
+        frontiers = [deque([side]) for side in sides]
+        active = set(range(len(sides)))
+        while len({find(n) for n in active}) > 1:
+            for n in list(active):
+                frontier = frontiers[n]
+                if not frontier:
+                    continue
+                current = frontier.popleft()
+                for offset in offsets:
+                    neighbor = current + offset
+                    if cells[neighbor]:
+                        continue
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = n
+                        reached[n].append(neighbor)
+                        frontier.append(neighbor)
+                    elif find(other) != find(n):
+                        group[find(other)] = find(n)
+
+            for n in list(active):
+                if frontiers[n]:
+                    continue
+                members = [m for m in range(len(sides)) if find(m) == find(n)]
+                if any(frontiers[m] for m in members):
+                    continue
+                # Every search in this group ran out of cells without meeting
+                # the others: what they reached is a region of its own.
+                label = self._new_label()
+                for m in members:
+                    for cell in reached[m]:
+                        labels[cell] = label
+                    active.discard(m)
@@ -0,0 +1,145 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/distance.py
+
+# NumPy is optional and slow to import, so it is loaded on first use rather
+# than when the package is imported.
+_numpy = False
+
+# Direction codes stored in the field's `directions` array. Each code names the
+# step from a cell towards its BFS parent, i.e. one step closer to the source.
+NONE, RIGHT, LEFT, DOWN, UP = range(5)
+STEPS = {RIGHT: (0, 1), LEFT: (0, -1), DOWN: (1, 0), UP: (-1, 0)}
+
+
+def numpy():
+    """
+    Returns the NumPy module, importing it on first call, or None if it is not
+    installed.
+    """
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        _numpy = module
+    return _numpy
+
+
+def _require_numpy():
+    np = numpy()
+    if np is None:
+        raise ImportError("distance fields need NumPy: pip install numpy")
+    return np
+
+
+def distance_field(grid, source):
+    """
+    Computes the BFS distance from `source` to every cell of the grid at once.
+
+    The search is level-synchronous: each level takes the whole frontier as an
+    array of cell ids, shifts it by the grid's four neighbor offsets and keeps the
+    candidates that an unvisited-cell boolean mask still allows. All of this runs
+    inside NumPy, so the Python-level cost is a handful of calls per level rather
+    than per cell. A Grid's buffer is read in place, without copying; a BitGrid's
+    bits are unpacked to a byte per cell first.
+
+    Args:
+        grid (Grid): The maze, a Grid, WeightedGrid or BitGrid.
+        source (tuple): The (x, y) coordinate the distances are measured from.
+
+    Returns:
+        tuple: `(distances, directions)`, two (height, width) arrays. `distances`
+        is int32 with -1 for cells that cannot be reached. `directions` is uint8
+        and holds, for every reached cell, the code (RIGHT, LEFT, DOWN or UP) of
+        the step towards its parent; it is NONE for the source and unreached cells.
+
+    Raises:
+        ValueError: If the grid has no cell buffer in memory, as for a TiledGrid.
+    """
+    np = _require_numpy()
+    rows = grid.height + 2
+    cells = _cell_bytes(np, grid)
+    unvisited = cells == 0
+    distances = np.full(cells.shape, -1, dtype=np.int32)
+    directions = np.zeros(cells.shape, dtype=np.uint8)
+
+    start = grid.index(source)
+    if unvisited[start]:
+        frontier = np.array([start], dtype=np.intp)
+        unvisited[start] = False
+        distances[start] = 0
+    else:
+        frontier = np.empty(0, dtype=np.intp)
+
+    # A child reached through offset k points back with the opposite direction:
+    # right <-> left and down <-> up.
+    back = (LEFT, RIGHT, UP, DOWN)
+    level = 0
+    while frontier.size:
+        level += 1
+        reached = []
+        for offset, code in zip(grid.offsets, back):
+            candidates = frontier + offset
+            candidates = candidates[unvisited[candidates]]
+            unvisited[candidates] = False
+            distances[candidates] = level
+            directions[candidates] = code
+            reached.append(candidates)
+        frontier = np.concatenate(reached)
+
+    shape = (rows, grid.stride)
+    return (
+        distances.reshape(shape)[1:-1, 1:-1],
+        directions.reshape(shape)[1:-1, 1:-1],
+    )
+
+
+def _cell_bytes(np, grid):
+    """
+    Returns the grid's cells as a flat uint8 array indexed by cell id.
+    """
+    bits = getattr(grid, "bits", None)
+    if bits is not None:
+        packed = np.frombuffer(bits, dtype=np.uint8).reshape(grid.height + 2, grid.row_bytes)
+        return np.unpackbits(packed, axis=1, bitorder="little")[:, :grid.stride].ravel()
+    if not isinstance(grid.cells, (bytes, bytearray, memoryview)):
+        raise ValueError(
+            f"distance_field needs a grid held in memory, not a {type(grid).__name__}"
+        )
+    return np.frombuffer(grid.cells, dtype=np.uint8)
+
+
+def field_path(distances, directions, cell):
+    """
+    Follows a distance field's `directions` from `cell` back to its source.
+
+    Args:
+        distances (ndarray): The distances array returned by `distance_field`.
+        directions (ndarray): The directions array returned by `distance_field`.
+        cell (tuple): The (x, y) coordinate to start from.
+
+    Returns:
+        list: The path from the source to `cell` as (x, y) tuples, or None if
+        `cell` was not reached. A cell that is its own source gives `[cell]`.
+    """
+    x, y = cell
+    if distances[x, y] < 0:
+        return None
+    path = [cell]
+    code = int(directions[x, y])
+    while code != NONE:
+        dx, dy = STEPS[code]
+        x, y = x + dx, y + dy
+        path.append((x, y))
+        code = int(directions[x, y])
+    path.reverse()
+    return path
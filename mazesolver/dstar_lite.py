@@ -0,0 +1,249 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/dstar_lite.py
+
+import heapq
+import math
+from array import array
+
+from .grid import SparseCells
+
+INFINITY = math.inf
+
+
+class DStarLite:
+    """
+    Incremental shortest paths with D* Lite (Koenig & Likhachev, 2002).
+
+    The planner searches backwards from the goal and keeps, for every cell, its
+    cost-to-goal `g` and the one-step lookahead `rhs` between calls. After the maze
+    changes, `update()` re-examines only the changed cells and their neighbors, and
+    the next `plan()` repairs just the part of the search those changes made
+    inconsistent, so replanning cost scales with the change rather than the map.
+    With `move_to()` the start can follow an agent along the path; the key
+    modifier `km` keeps queued priorities valid without reordering the queue.
+
+    Steps cost 1 on a Grid and the entered cell's cost on a WeightedGrid; costs
+    must not be negative.
+
+    Args:
+        grid (Grid): The maze. Change it with `set_wall`/`set_cost`, then pass the
+            changed cells to `update()`.
+        start (tuple): The (x, y) coordinate of the start cell.
+        goal (tuple): The (x, y) coordinate of the goal cell.
+        observer (callable, optional): Called as `observer(cell, "expanded")` for
+            every cell the planner expands.
+        stats (SearchStats, optional): Counts the planner's expansions and queue
+            operations, across every `plan()`.
+    """
+
+    def __init__(self, grid, start, goal, observer=None, stats=None):
+        self.grid = grid
+        self.start_id = grid.index(start)
+        self.goal_id = grid.index(goal)
+        self.last_id = self.start_id
+        self.observer = observer
+        self.stats = stats
+        self.costs = getattr(grid, "costs", None)
+        self.scale = max(grid.min_cost, 0) if self.costs is not None else 1
+        self.km = 0
+        self.expanded = 0
+
+        if getattr(grid, "sparse", False):
+            self.g = SparseCells(INFINITY)
+            self.rhs = SparseCells(INFINITY)
+        else:
+            size = len(grid.cells)
+            self.g = array("d", [INFINITY]) * size
+            self.rhs = array("d", [INFINITY]) * size
+        # Priority queue with lazy deletion: `queued` maps each queued cell to its
+        # current key, and heap entries whose key no longer matches are skipped.
+        self.queue = []
+        self.queued = {}
+
+        self.rhs[self.goal_id] = 0
+        self._insert(self.goal_id, self._key(self.goal_id))
+
+    @property
+    def start(self):
+        return self.grid.cell(self.start_id)
+
+    @property
+    def goal(self):
+        return self.grid.cell(self.goal_id)
+
+    def _heuristic(self, a, b):
+        stride = self.grid.stride
+        ax, ay = divmod(a, stride)
+        bx, by = divmod(b, stride)
+        return (abs(ax - bx) + abs(ay - by)) * self.scale
+
+    def _key(self, cell):
+        k = min(self.g[cell], self.rhs[cell])
+        return (k + self._heuristic(self.start_id, cell) + self.km, k)
+
+    def _insert(self, cell, key):
+        self.queued[cell] = key
+        heapq.heappush(self.queue, (key, cell))
+        if self.stats:
+            self.stats.push(len(self.queued))
+
+    def _top(self):
+        queue = self.queue
+        queued = self.queued
+        while queue:
+            key, cell = queue[0]
+            if queued.get(cell) == key:
+                return key, cell
+            heapq.heappop(queue)
+            if self.stats:
+                self.stats.pops += 1
+                self.stats.stale_pops += 1
+        return (INFINITY, INFINITY), -1
+
+    def _step_cost(self, cell):
+        return 1 if self.costs is None else self.costs[cell]
+
+    def _lookahead(self, cell):
+        """
+        Recomputes rhs: the cheapest step to a neighbor plus that neighbor's g.
+        """
+        if self.grid.cells[cell]:
+            return INFINITY
+        g = self.g
+        costs = self.costs
+        best = INFINITY
+        for n in self.grid.neighbors(cell):
+            value = g[n] + (1 if costs is None else costs[n])
+            if value < best:
+                best = value
+        return best
+
+    def _update_vertex(self, cell):
+        if self.g[cell] != self.rhs[cell]:
+            self._insert(cell, self._key(cell))
+        else:
+            self.queued.pop(cell, None)
+
+    def _compute_shortest_path(self):
+        g = self.g
+        rhs = self.rhs
+        queued = self.queued
+        neighbors = self.grid.neighbors
+        goal = self.goal_id
+        start = self.start_id
+        observer = self.observer
+        stats = self.stats
+        cell_of = self.grid.cell
+
+        while True:
+            top_key, u = self._top()
+            if not (top_key < self._key(start) or rhs[start] > g[start]):
+                break
+            new_key = self._key(u)
+            if top_key < new_key:
+                self._insert(u, new_key)
+                continue
+
+            # u's entry is the top of the heap; take it off now rather than
+            # leaving it to be skipped as stale.
+            heapq.heappop(self.queue)
+            self.expanded += 1
+            if observer is not None:
+                observer(cell_of(u), "expanded")
+            if stats:
+                stats.pops += 1
+                stats.expansions += 1
+
+            if g[u] > rhs[u]:
+                # Overconsistent: settle u and offer it to its neighbors.
+                g[u] = rhs[u]
+                del queued[u]
+                for s in neighbors(u):
+                    if s != goal:
+                        value = g[u] + self._step_cost(u)
+                        if value < rhs[s]:
+                            rhs[s] = value
+                    self._update_vertex(s)
+            else:
+                # Underconsistent: u got more expensive, so everything that
+                # relied on it has to look for a new best neighbor.
+                old = g[u]
+                g[u] = INFINITY
+                for s in neighbors(u) + [u]:
+                    if s != goal and (
+                        s == u or rhs[s] == old + self._step_cost(u)
+                    ):
+                        rhs[s] = self._lookahead(s)
+                    self._update_vertex(s)
+
+    def update(self, cells):
+        """
+        Tells the planner which cells changed (walls placed or removed, costs
+        changed) since the last plan. Only those cells and their neighbors are
+        re-examined; the next `plan()` propagates the effects.
+
+        Args:
+            cells (iterable): The (x, y) coordinates of the changed cells.
+        """
+        grid = self.grid
+        goal = self.goal_id
+        lowered = False
+        for cell in cells:
+            index = grid.index(cell)
+            if self.costs is not None and not grid.cells[index]:
+                if self.costs[index] < self.scale:
+                    self.scale = max(self.costs[index], 0)
+                    lowered = True
+            for u in grid.neighbors(index) + [index]:
+                if u != goal:
+                    self.rhs[u] = self._lookahead(u)
+                self._update_vertex(u)
+        if lowered:
+            # A cheaper step shrinks the heuristic, and with it queued keys.
+            for cell in list(self.queued):
+                self._insert(cell, self._key(cell))
+
+    def move_to(self, cell):
+        """
+        Moves the start to `cell`, typically the next step of the current path.
+        """
+        self.start_id = self.grid.index(cell)
+        self.km += self._heuristic(self.last_id, self.start_id)
+        self.last_id = self.start_id
+
+    def plan(self):
+        """
+        Brings the search up to date and returns the current shortest path.
+
+        Returns:
+            list: The path from start to goal as (x, y) tuples, or None if the goal
+            cannot be reached.
+        """
+        self.expanded = 0
+        cells = self.grid.cells
+        if cells[self.start_id] or cells[self.goal_id]:
+            return None
+        self._compute_shortest_path()
+
+        # The start's rhs is exact once the search stops, even when its g lags.
+        g = self.g
+        if self.rhs[self.start_id] == INFINITY:
+            return None
+        neighbors = self.grid.neighbors
+        current = self.start_id
+        path = [current]
+        while current != self.goal_id:
+            current = min(neighbors(current), key=lambda n: g[n] + self._step_cost(n))
+            path.append(current)
+            if len(path) > len(cells):
+                return None
+        cell_of = self.grid.cell
+        return [cell_of(i) for i in path]
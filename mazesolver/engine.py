@@ -0,0 +1,271 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/engine.py
+
+from array import array
+from contextlib import nullcontext
+
+from .algorithms import (
+    bfs,
+    dfs,
+    astar,
+    dijkstra,
+    greedy_best_first_search,
+    bidirectional_search,
+    random_walk,
+    ida_star,
+    jump_point_search,
+    jps_plus,
+    hpa_star,
+    bellman_ford,
+    floyd_warshall,
+    d_star,
+    theta_star,
+    fringe_search,
+    sma_star,
+)
+from .components import ComponentIndex
+from .grid import Grid, SparseCells
+
+
+ALGORITHMS = {
+    "BFS": bfs,
+    "DFS": dfs,
+    "A*": astar,
+    "Dijkstra": dijkstra,
+    "Greedy Best-First": greedy_best_first_search,
+    "Bidirectional": bidirectional_search,
+    "Random Walk": random_walk,
+    "IDA*": ida_star,
+    "Jump Point Search": jump_point_search,
+    "JPS+": jps_plus,
+    "HPA*": hpa_star,
+    "Bellman-Ford": bellman_ford,
+    "Floyd-Warshall": floyd_warshall,
+    "D*": d_star,
+    "Theta*": theta_star,
+    "Fringe Search": fringe_search,
+    "SMA*": sma_star,
+}
+
+
+class Search:
+    """
+    The state of a single solve: the grid, its endpoints and the bookkeeping the
+    algorithms share.
+
+    Algorithms work on integer cell ids (the grid's buffer indexes) rather than
+    (x, y) tuples. `visited` is a bytearray of flags and `parent` an int32 array,
+    both indexed by id and preallocated for the whole grid; ids are turned back
+    into tuples only when the finished path is built. `costs` is the grid's
+    per-cell cost array for a WeightedGrid, or None when every step costs 1;
+    `heuristic` is scaled by the grid's cheapest step so it stays admissible.
+
+    Args:
+        grid (Grid): The maze to solve.
+        start (tuple): The (x, y) coordinate of the start cell.
+        end (tuple): The (x, y) coordinate of the end cell.
+        observer (callable, optional): Called as `observer(cell, "pushed")` when a
+            cell joins the open list and `observer(cell, "expanded")` when it is
+            expanded; which of the two an algorithm reports differs per
+            algorithm, see `mazesolver.trace`. Leave it out to solve at full speed.
+        adjacency (bool): Look neighbors up in the grid's cached CSR adjacency
+            index instead of checking the four candidates on every call. Pays off
+            when the same static maze is solved many times.
+        diagonal (bool): Allow diagonal steps, costing sqrt(2), where both cells
+            beside the step are open. Only Jump Point Search and JPS+ use it; the
+            other algorithms always move in four directions.
+        stats (SearchStats, optional): Counters the algorithm reports its
+            expansions and open-list pushes and pops into.
+    """
+
+    def __init__(
+        self, grid, start, end, observer=None, adjacency=False, diagonal=False, stats=None,
+    ):
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self.start_id = grid.index(start)
+        self.end_id = grid.index(end)
+        self.size = len(grid.cells)
+        # Huge bit-packed grids get per-cell state that grows with the search
+        # rather than arrays over every cell.
+        self.sparse = getattr(grid, "sparse", False)
+        self.visited = self.flag_array()
+        self.parent = self.cell_array(-1)
+        self.costs = getattr(grid, "costs", None)
+        self.scale = max(grid.min_cost, 0) if self.costs is not None else 1
+        self.diagonal = diagonal
+
+        # Algorithms report expansions through `visit` and open-list pushes
+        # through `reach`, testing `if visit:` or `if reach:` so that solving
+        # without an observer costs nothing beyond that check.
+        self.observer = observer
+        self.visit = self._expanded if observer is not None else None
+        self.reach = self._pushed if observer is not None else None
+        # Likewise `if stats:` guards every counter update.
+        self.stats = stats
+
+        if adjacency:
+            offsets, targets = grid.adjacency()
+            self.neighbors = lambda i: targets[offsets[i]:offsets[i + 1]]
+        else:
+            self.neighbors = grid.neighbors
+
+    def cell_array(self, fill):
+        """
+        Returns an int32 array with one slot per cell id, all set to `fill`, or a
+        SparseCells defaulting to `fill` when the grid is sparse.
+        """
+        if self.sparse:
+            return SparseCells(fill)
+        return array("i", [fill]) * self.size
+
+    def flag_array(self):
+        """
+        Returns a zeroed bytearray with one slot per cell id, or a SparseCells
+        defaulting to 0 when the grid is sparse.
+        """
+        if self.sparse:
+            return SparseCells(0)
+        return bytearray(self.size)
+
+    def _expanded(self, index):
+        self.observer(self.grid.cell(index), "expanded")
+
+    def _pushed(self, index):
+        self.observer(self.grid.cell(index), "pushed")
+
+    def heuristic(self, a, b):
+        """
+        Heuristic function for A* algorithm. Uses the Manhattan distance between two
+        cell ids, times the cheapest step cost.
+        """
+        ax, ay = divmod(a, self.grid.stride)
+        bx, by = divmod(b, self.grid.stride)
+        return (abs(ax - bx) + abs(ay - by)) * self.scale
+
+    def cells(self, ids):
+        """
+        Converts a sequence of cell ids into a list of (x, y) tuples.
+        """
+        cell = self.grid.cell
+        return [cell(i) for i in ids]
+
+    def construct_path(self, end):
+        """
+        Constructs the path from the start to the end of the maze.
+
+        The path is rebuilt from the end cell back to the start cell by following the
+        parent ids stored in `self.parent`; the start cell has no parent.
+
+        Args:
+            end (int): The id of the end cell.
+
+        Returns:
+            list: A list of (x, y) coordinate tuples representing the path from the start to the end cell.
+        """
+        parent = self.parent
+        path = []
+        current = end
+        while current != -1:
+            path.append(current)
+            current = parent[current]
+        path.reverse()
+        return self.cells(path)
+
+    def construct_bidirectional_path(
+        self, forward_visited, backward_visited, meet_point
+    ):
+        """
+        Joins the two halves of a bidirectional search at `meet_point`. Each parent
+        array's root (the start or the end) is its own parent.
+        """
+        path = []
+        current = meet_point
+        while True:
+            path.append(current)
+            if forward_visited[current] == current:
+                break
+            current = forward_visited[current]
+        path.reverse()
+
+        current = meet_point
+        while backward_visited[current] != current:
+            current = backward_visited[current]
+            path.append(current)
+
+        return self.cells(path)
+
+
+def check_endpoints(grid, start, end):
+    """
+    Raises ValueError unless `start` and `end` are open cells inside the maze.
+    An endpoint given as None is not checked.
+    """
+    for name, cell in (("start", start), ("end", end)):
+        if cell is None:
+            continue
+        x, y = cell
+        if not (0 <= x < grid.height and 0 <= y < grid.width):
+            raise ValueError(
+                f"The {name} cell {tuple(cell)} is outside the {grid.height}x{grid.width} maze"
+            )
+        if grid.is_wall(cell):
+            raise ValueError(f"The {name} cell {tuple(cell)} is a wall")
+
+
+def solve(
+    grid, start, end, algorithm="BFS", observer=None, adjacency=False, diagonal=False,
+    reachability=True, stats=None,
+):
+    """
+    Solves a maze headlessly with one of the algorithms in `ALGORITHMS`.
+
+    Args:
+        grid (Grid or list): The maze, either a Grid or a list of 0/1 rows.
+        start (tuple): The (x, y) coordinate of the start cell.
+        end (tuple): The (x, y) coordinate of the end cell.
+        algorithm (str): The name of the algorithm, e.g. "BFS" or "A*".
+        observer (callable, optional): Called as `observer(cell, event)`, with
+            event "pushed" or "expanded", as the algorithm explores the maze.
+        adjacency (bool): Use the grid's cached CSR adjacency index for neighbor
+            lookups. See `Grid.adjacency`.
+        diagonal (bool): Let Jump Point Search and JPS+ move diagonally.
+        reachability (bool): Return None at once when start and end lie in
+            different regions, using a ComponentIndex cached on the grid (and
+            repaired by `set_wall`). Skipped for lists of rows and sparse grids,
+            where building the index would cost more than it saves.
+        stats (SearchStats, optional): Filled in with the solve's counters and
+            wall time (and peak memory, if it was created with `memory=True`).
+
+    Returns:
+        list: The path from start to end as (x, y) tuples, or None if there is no path.
+
+    Raises:
+        ValueError: If the algorithm is unknown, or start or end is a wall or
+            lies outside the maze.
+    """
+    if not isinstance(grid, Grid):
+        grid = Grid.from_rows(grid)
+        reachability = False
+    check_endpoints(grid, start, end)
+    try:
+        solver = ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm: {algorithm!r}") from None
+    with stats.measure() if stats is not None else nullcontext():
+        if reachability and not getattr(grid, "sparse", False):
+            components = grid.memo("components", lambda: ComponentIndex(grid))
+            a = components.label(grid.index(start))
+            b = components.label(grid.index(end))
+            if a != -1 and b != -1 and a != b:
+                return None
+        return solver(Search(grid, start, end, observer, adjacency, diagonal, stats))
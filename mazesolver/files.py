@@ -0,0 +1,451 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/files.py
+
+import mmap
+import os
+import struct
+import zlib
+
+from .grid import Grid, OPEN, WALL
+
+# ASCII mazes: one line per row. '#' (or '1') is a wall, '.' (or '0' or a space)
+# is open, and 'S' and 'E' mark an open start and end cell.
+WALL_CHARS = "#1"
+OPEN_CHARS = ". 0"
+START_CHAR = "S"
+END_CHAR = "E"
+
+
+# Byte translation from ASCII maze characters to cell values; anything that is
+# not a maze character maps to INVALID.
+INVALID = 0xFF
+_ASCII_CELLS = bytearray([INVALID]) * 256
+for _char in WALL_CHARS:
+    _ASCII_CELLS[ord(_char)] = WALL
+for _char in OPEN_CHARS + START_CHAR + END_CHAR:
+    _ASCII_CELLS[ord(_char)] = OPEN
+_ASCII_CELLS = bytes(_ASCII_CELLS)
+
+
+def parse_ascii(text):
+    """
+    Parses an ASCII maze.
+
+    Args:
+        text (str): The maze, one line per row. Short rows are padded with walls.
+
+    Returns:
+        tuple: `(grid, start, end)`, where `start` and `end` are the (x, y) cells
+        marked 'S' and 'E', or None when the maze does not mark them.
+    """
+    lines = [line.rstrip("\r\n") for line in text.splitlines()]
+    while lines and not lines[-1].strip():
+        lines.pop()
+    height = len(lines)
+    width = max((len(line) for line in lines), default=0)
+    grid = Grid(height, width)
+    cells = grid.cells
+    start = end = None
+
+    for x, line in enumerate(lines):
+        row = line.ljust(width, "#").encode("latin-1", "replace").translate(_ASCII_CELLS)
+        if INVALID in row:
+            y = row.index(INVALID)
+            raise ValueError(f"Unexpected character {line[y]!r} at row {x}, column {y}")
+        i = (x + 1) * grid.stride + 1
+        cells[i:i + width] = row
+        if START_CHAR in line:
+            start = (x, line.index(START_CHAR))
+        if END_CHAR in line:
+            end = (x, line.index(END_CHAR))
+    return grid, start, end
+
+
+def format_ascii(grid, start=None, end=None):
+    """
+    Formats a grid as an ASCII maze that `parse_ascii` reads back.
+    """
+    lines = []
+    for x, row in enumerate(grid.to_rows()):
+        chars = ["#" if value != OPEN else "." for value in row]
+        if start is not None and start[0] == x:
+            chars[start[1]] = START_CHAR
+        if end is not None and end[0] == x:
+            chars[end[1]] = END_CHAR
+        lines.append("".join(chars))
+    return "\n".join(lines) + "\n"
+
+
+def read_ascii(path):
+    """
+    Reads an ASCII maze file. See `parse_ascii`.
+    """
+    with open(path, encoding="utf-8") as f:
+        return parse_ascii(f.read())
+
+
+def write_ascii(path, grid, start=None, end=None):
+    """
+    Writes a grid to `path` as an ASCII maze.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(format_ascii(grid, start, end))
+
+
+# Binary mazes: a 32-byte header followed by the cells, either as bytes in the
+# exact padded layout of `Grid.cells` (so the file can be memory-mapped and used
+# as the grid buffer) or packed one bit per cell.
+MAGIC = b"MAZE"
+VERSION = 1
+HEADER = struct.Struct("<4sHBxIIiiii")  # magic, version, encoding, height, width, start, end
+BYTES, BITS = 0, 1
+WORD_BITS = 64  # packed rows are padded to whole 64-bit words
+
+_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def packed_row_bytes(width):
+    """
+    Returns the size of one packed row: `width` bits rounded up to whole words.
+    """
+    return (width + WORD_BITS - 1) // WORD_BITS * WORD_BITS // 8
+
+
+def pack_row(row, nbytes, order="little"):
+    """
+    Packs a row of 0/1 cell bytes into `nbytes` bytes. With the "little" order,
+    cell y is bit y of the row read as a little-endian integer; with "big", the
+    first cell is the most significant bit (the PBM and PNG order).
+    """
+    digits = bytes(row).translate(_DIGITS)
+    if order == "little":
+        digits = digits[::-1]
+        return int(digits or b"0", 2).to_bytes(nbytes, "little")
+    digits = digits.ljust(nbytes * 8, b"0")
+    return int(digits or b"0", 2).to_bytes(nbytes, "big")
+
+
+def unpack_row(data, width, order="little"):
+    """
+    The inverse of `pack_row`: returns `width` 0/1 cell bytes.
+    """
+    nbits = len(data) * 8
+    digits = format(int.from_bytes(data, order), f"0{nbits}b").encode("ascii")
+    if order == "little":
+        digits = digits[::-1]
+    return digits[:width].translate(_FROM_DIGITS)
+
+
+def _endpoint(cell):
+    return (-1, -1) if cell is None else cell
+
+
+def save_maze(path, grid, start=None, end=None, packed=False):
+    """
+    Writes a grid in the binary maze format.
+
+    Args:
+        path (str): The file to write, conventionally with a `.maze` extension.
+        grid (Grid): The maze.
+        start (tuple, optional): The start cell to store with it.
+        end (tuple, optional): The end cell to store with it.
+        packed (bool): Store one bit per cell instead of one byte. The file is
+            about 8x smaller but has to be unpacked when loaded.
+    """
+    with open(path, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC, VERSION, BITS if packed else BYTES, grid.height, grid.width,
+                *_endpoint(start), *_endpoint(end),
+            )
+        )
+        stride = grid.stride
+        packed_row = getattr(grid, "packed_row", None)
+        if not packed:
+            if packed_row is None:
+                f.write(grid.cells)
+                return
+            for x in range(grid.height + 2):
+                f.write(grid.cells[x * stride:(x + 1) * stride])
+            return
+        nbytes = packed_row_bytes(grid.width)
+        for x in range(grid.height):
+            if packed_row is not None:
+                f.write(packed_row(x, nbytes))
+                continue
+            i = (x + 1) * stride + 1
+            f.write(pack_row(grid.cells[i:i + grid.width], nbytes))
+
+
+def load_maze(path, mode="r", bitgrid=False):
+    """
+    Opens a binary maze file.
+
+    Byte-encoded files are memory-mapped and the mapping becomes the grid's cell
+    buffer, so opening takes the same time whatever the maze size and pages are
+    read from disk only as the solver touches them. Bit-packed files are read and
+    unpacked into a new grid, or kept packed in a BitGrid if `bitgrid` is set.
+
+    Args:
+        path (str): The `.maze` file.
+        mode (str): For byte-encoded files, "r" maps the file read-only, "c" maps
+            it copy-on-write (edits stay in memory) and "r+" writes edits through
+            to the file.
+        bitgrid (bool): Load bit-packed files as a BitGrid, for mazes too large
+            to unpack to a byte per cell.
+
+    Returns:
+        tuple: `(grid, start, end)`; `start` and `end` are None if not stored.
+    """
+    access = {"r": mmap.ACCESS_READ, "c": mmap.ACCESS_COPY, "r+": mmap.ACCESS_WRITE}
+    if mode not in access:
+        raise ValueError(f"Unknown mode {mode!r}; use 'r', 'c' or 'r+'")
+
+    with open(path, "r+b" if mode == "r+" else "rb") as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is not a maze file")
+        magic, version, encoding, height, width, sx, sy, ex, ey = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a maze file")
+        start = None if sx < 0 else (sx, sy)
+        end = None if ex < 0 else (ex, ey)
+
+        if encoding == BYTES:
+            size = (height + 2) * (width + 2)
+            mapping = mmap.mmap(f.fileno(), 0, access=access[mode])
+            cells = memoryview(mapping)[HEADER.size:HEADER.size + size]
+            return Grid(height, width, cells), start, end
+
+        nbytes = packed_row_bytes(width)
+        data = f.read(nbytes * height)
+        if bitgrid:
+            from .bitgrid import BitGrid
+
+            return BitGrid.from_packed(height, width, data), start, end
+
+        grid = Grid(height, width)
+        stride = grid.stride
+        for x in range(height):
+            i = (x + 1) * stride + 1
+            grid.cells[i:i + width] = unpack_row(data[x * nbytes:(x + 1) * nbytes], width)
+        return grid, start, end
+
+
+def save_pbm(path, grid):
+    """
+    Writes a grid as a binary PBM (P4) bitmap: one pixel per cell, black walls.
+    """
+    nbytes = (grid.width + 7) // 8
+    stride = grid.stride
+    with open(path, "wb") as f:
+        f.write(f"P4\n{grid.width} {grid.height}\n".encode("ascii"))
+        for x in range(grid.height):
+            i = (x + 1) * stride + 1
+            f.write(pack_row(grid.cells[i:i + grid.width], nbytes, "big"))
+
+
+def load_pbm(path):
+    """
+    Reads a PBM bitmap, plain (P1) or binary (P4), where black pixels are walls.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    # The header is the magic number, then width and height, separated by
+    # whitespace with optional '#' comments.
+    fields = []
+    pos = 0
+    while len(fields) < 3:
+        while data[pos:pos + 1].isspace():
+            pos += 1
+        if data[pos:pos + 1] == b"#":
+            pos = data.index(b"\n", pos)
+            continue
+        begin = pos
+        while pos < len(data) and not data[pos:pos + 1].isspace():
+            pos += 1
+        fields.append(data[begin:pos])
+    magic, width, height = fields[0], int(fields[1]), int(fields[2])
+
+    grid = Grid(height, width)
+    stride = grid.stride
+    if magic == b"P4":
+        pos += 1  # the single whitespace byte before the raster
+        nbytes = (width + 7) // 8
+        for x in range(height):
+            row = data[pos + x * nbytes:pos + (x + 1) * nbytes]
+            i = (x + 1) * stride + 1
+            grid.cells[i:i + width] = unpack_row(row, width, "big")
+    elif magic == b"P1":
+        bits = bytes(c for c in data[pos:] if c in b"01").translate(_FROM_DIGITS)
+        for x in range(height):
+            i = (x + 1) * stride + 1
+            grid.cells[i:i + width] = bits[x * width:(x + 1) * width]
+    else:
+        raise ValueError(f"{path} is not a PBM bitmap")
+    return grid
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(kind, payload):
+    chunk = kind + payload
+    return struct.pack(">I", len(payload)) + chunk + struct.pack(">I", zlib.crc32(chunk))
+
+
+def save_png(path, grid):
+    """
+    Writes a grid as a 1-bit grayscale PNG: one pixel per cell, black walls.
+    """
+    nbytes = (grid.width + 7) // 8
+    stride = grid.stride
+    # PNG grayscale has 1 for white, so open cells are the set bits.
+    invert = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+    raw = bytearray()
+    for x in range(grid.height):
+        i = (x + 1) * stride + 1
+        raw.append(0)  # filter type: none
+        raw += pack_row(bytes(grid.cells[i:i + grid.width]).translate(invert), nbytes, "big")
+    with open(path, "wb") as f:
+        f.write(PNG_SIGNATURE)
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", grid.width, grid.height, 1, 0, 0, 0, 0)))
+        f.write(_png_chunk(b"IDAT", zlib.compress(bytes(raw), 9)))
+        f.write(_png_chunk(b"IEND", b""))
+
+
+def load_png(path, threshold=128):
+    """
+    Reads a non-interlaced PNG, any color type, at 8 bits per channel or less.
+    Pixels darker than `threshold` (after alpha is ignored) become walls.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError(f"{path} is not a PNG image")
+
+    pos = len(PNG_SIGNATURE)
+    idat = bytearray()
+    palette = None
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos:pos + 4])
+        kind = data[pos + 4:pos + 8]
+        payload = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b"IHDR":
+            width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", payload)
+        elif kind == b"PLTE":
+            palette = payload
+        elif kind == b"IDAT":
+            idat += payload
+        elif kind == b"IEND":
+            break
+    if interlace or depth > 8:
+        raise ValueError(f"{path}: only non-interlaced PNGs up to 8 bits per channel are supported")
+
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[color]
+    bits = depth * channels
+    row_bytes = (width * bits + 7) // 8
+    bpp = max(1, bits // 8)
+    raw = zlib.decompress(bytes(idat))
+
+    grid = Grid(height, width)
+    stride = grid.stride
+    previous = bytearray(row_bytes)
+    maximum = (1 << depth) - 1
+    for x in range(height):
+        start = x * (row_bytes + 1)
+        row = _unfilter(raw[start], bytearray(raw[start + 1:start + 1 + row_bytes]), previous, bpp)
+        previous = row
+
+        if depth < 8:
+            # Gray or palette samples packed several to a byte, high bits first.
+            bits = unpack_row(row, width * depth, "big")
+            samples = [
+                sum(bit << (depth - 1 - k) for k, bit in enumerate(bits[j:j + depth]))
+                for j in range(0, width * depth, depth)
+            ]
+        else:
+            samples = row
+        cells = bytearray(width)
+        for y in range(width):
+            if color == 3:
+                r, g, b = palette[3 * samples[y]:3 * samples[y] + 3]
+                level = (r * 299 + g * 587 + b * 114) // 1000
+            elif color in (2, 6):
+                r, g, b = samples[y * channels:y * channels + 3]
+                level = (r * 299 + g * 587 + b * 114) // 1000
+            else:
+                level = samples[y * channels] * 255 // maximum
+            cells[y] = WALL if level < threshold else OPEN
+        i = (x + 1) * stride + 1
+        grid.cells[i:i + width] = cells
+    return grid
+
+
+def _unfilter(kind, row, previous, bpp):
+    """
+    Undoes a PNG scanline filter in place and returns the row.
+    """
+    if kind == 1:  # Sub
+        for i in range(bpp, len(row)):
+            row[i] = (row[i] + row[i - bpp]) & 0xFF
+    elif kind == 2:  # Up
+        for i in range(len(row)):
+            row[i] = (row[i] + previous[i]) & 0xFF
+    elif kind == 3:  # Average
+        for i in range(len(row)):
+            left = row[i - bpp] if i >= bpp else 0
+            row[i] = (row[i] + (left + previous[i]) // 2) & 0xFF
+    elif kind == 4:  # Paeth
+        for i in range(len(row)):
+            a = row[i - bpp] if i >= bpp else 0
+            b = previous[i]
+            c = previous[i - bpp] if i >= bpp else 0
+            p = a + b - c
+            pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+            row[i] = (row[i] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xFF
+    return row
+
+
+def load(path, mode="r"):
+    """
+    Loads a maze from any supported file, chosen by extension: `.maze` (binary,
+    see `load_maze`), `.pbm`, `.png`, or ASCII for anything else.
+
+    Returns:
+        tuple: `(grid, start, end)`; bitmaps never store endpoints.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".maze":
+        return load_maze(path, mode)
+    if extension == ".pbm":
+        return load_pbm(path), None, None
+    if extension == ".png":
+        return load_png(path), None, None
+    return read_ascii(path)
+
+
+def save(path, grid, start=None, end=None):
+    """
+    Saves a maze in the format its extension names; see `load`.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".maze":
+        save_maze(path, grid, start, end)
+    elif extension == ".pbm":
+        save_pbm(path, grid)
+    elif extension == ".png":
+        save_png(path, grid)
+    else:
+        write_ascii(path, grid, start, end)
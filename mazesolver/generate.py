@@ -0,0 +1,148 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/generate.py
+
+import random
+
+from .grid import Grid, WeightedGrid, WALL
+
+
+def random_grid(height, width, density=0.3, seed=None):
+    """
+    Generates a reproducible maze with walls scattered at random. The top-left and
+    bottom-right corners are always left open.
+
+    Args:
+        height (int): The number of rows.
+        width (int): The number of columns.
+        density (float): The chance of each cell being a wall.
+        seed (int, optional): Seed for the random generator.
+
+    Returns:
+        Grid: The generated maze.
+    """
+    rng = random.Random(seed)
+    grid = Grid(height, width)
+    _scatter_walls(grid, rng, density)
+    return grid
+
+
+def perfect_maze(height, width, seed=None):
+    """
+    Generates a reproducible perfect maze: corridors one cell wide with exactly
+    one route between any two of them, carved by a randomized depth-first
+    search. Corridor cells sit on even rows and columns, so with an even height
+    or width the last row or column is all wall. The top-left corner is always
+    open.
+
+    Returns:
+        Grid: The generated maze.
+    """
+    rng = random.Random(seed)
+    stride = width + 2
+    size = (height + 2) * stride
+    grid = Grid(height, width, bytearray([WALL]) * size)
+    cells = grid.cells
+
+    # Flags the cells corridors can be carved into. The padding past the end also
+    # catches steps off the top, whose negative ids index from the end.
+    room = bytearray(size + 2 * stride + 2)
+    for x in range(0, height, 2):
+        row = (x + 1) * stride + 1
+        room[row:row + width:2] = b"\x01" * len(range(0, width, 2))
+
+    steps = (2, -2, 2 * stride, -2 * stride)
+    start = grid.index((0, 0))
+    cells[start] = 0
+    stack = [start]
+    while stack:
+        current = stack[-1]
+        options = [n for n in (current + step for step in steps) if room[n] and cells[n]]
+        if not options:
+            stack.pop()
+            continue
+        chosen = rng.choice(options)
+        cells[(current + chosen) // 2] = 0
+        cells[chosen] = 0
+        stack.append(chosen)
+    grid.invalidate()
+    return grid
+
+
+def room_grid(height, width, room_size=16, seed=None):
+    """
+    Generates a reproducible floor plan: open rooms of `room_size` x `room_size`
+    cells separated by one-cell walls, with a door at a random spot in every
+    wall between two neighboring rooms. The top-left and bottom-right corners
+    are always open.
+
+    Returns:
+        Grid: The generated maze.
+    """
+    rng = random.Random(seed)
+    grid = Grid(height, width)
+    cells = grid.cells
+    stride = grid.stride
+    period = room_size + 1
+    # A wall on the last row or column would only seal off the corner.
+    wall_rows = range(room_size, height - 1, period)
+    wall_cols = range(room_size, width - 1, period)
+
+    for x in wall_rows:
+        row = (x + 1) * stride + 1
+        cells[row:row + width] = bytes([WALL]) * width
+    for x in range(height):
+        row = (x + 1) * stride + 1
+        for y in wall_cols:
+            cells[row + y] = WALL
+
+    def spans(length, walls):
+        edges = [-1, *walls, length]
+        return [(a + 1, b) for a, b in zip(edges, edges[1:])]
+
+    for x in wall_rows:
+        for begin, end in spans(width, wall_cols):
+            cells[grid.index((x, rng.randrange(begin, end)))] = 0
+    for y in wall_cols:
+        for begin, end in spans(height, wall_rows):
+            cells[grid.index((rng.randrange(begin, end), y))] = 0
+    grid.invalidate()
+    return grid
+
+
+def random_terrain(height, width, max_cost=9, density=0.2, seed=None, typecode="B"):
+    """
+    Generates a reproducible terrain map: walls scattered at random and every open
+    cell given a step cost between 1 and `max_cost`.
+
+    Returns:
+        WeightedGrid: The generated map.
+    """
+    rng = random.Random(seed)
+    grid = WeightedGrid(height, width, typecode=typecode)
+    _scatter_walls(grid, rng, density)
+    costs = grid.costs
+    for i in grid.open_indexes():
+        costs[i] = rng.randint(1, max_cost)
+    grid.invalidate()
+    return grid
+
+
+def _scatter_walls(grid, rng, density):
+    cells = grid.cells
+    stride = grid.stride
+    for x in range(grid.height):
+        row = (x + 1) * stride + 1
+        for y in range(grid.width):
+            if rng.random() < density:
+                cells[row + y] = WALL
+    cells[grid.index((0, 0))] = 0
+    cells[grid.index((grid.height - 1, grid.width - 1))] = 0
+    grid.invalidate()
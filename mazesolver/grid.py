@@ -0,0 +1,316 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/grid.py
+
+from array import array
+
+OPEN = 0
+WALL = 1
+
+
+class Grid:
+    """
+    A rectangular maze that can be solved without a GUI.
+
+    Cells are addressed as (row, column) tuples. A value of 0 is an open cell and
+    a value of 1 is a wall.
+
+    The maze is stored row-major in one flat buffer, one byte per cell, surrounded
+    by a border of wall cells. Thanks to the border every in-bounds cell has four
+    neighbors in the buffer, so wall and neighbor checks are plain index lookups
+    with no bounds checks. Cells are also addressed by their integer `index` into
+    that buffer; `offsets` holds the index steps to the right, left, down and up
+    neighbors.
+
+    For static mazes `adjacency()` builds a compressed sparse row (CSR) index of
+    every open cell's open neighbors once and caches it on the grid, and `memo()`
+    caches any other structure derived from the cells. `set_wall` drops these
+    caches, or repairs the ones that can be updated for a single changed cell;
+    code that writes to `cells` directly must call `invalidate()` itself.
+
+    Args:
+        height (int): The number of rows.
+        width (int): The number of columns.
+        cells (bytes-like, optional): A buffer of `(height + 2) * (width + 2)` bytes
+            in the layout described above, used as-is without copying. Defaults to
+            an all-open maze.
+    """
+
+    def __init__(self, height, width, cells=None):
+        self.height = height
+        self.width = width
+        self.stride = width + 2
+        size = (height + 2) * self.stride
+
+        if cells is None:
+            cells = bytearray(size)
+            self.cells = cells
+            self._fill_border()
+        else:
+            if not isinstance(cells, bytearray):
+                cells = memoryview(cells).cast("B")
+            if len(cells) != size:
+                raise ValueError(
+                    f"Expected {size} bytes for a {height}x{width} grid, got {len(cells)}"
+                )
+            self.cells = cells
+
+        # right, left, down, up
+        self.offsets = (1, -1, self.stride, -self.stride)
+        self._moves = ((1, 0, 1), (-1, 0, -1), (self.stride, 1, 0), (-self.stride, -1, 0))
+        self._adjacency = None
+        self._cache = {}
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds a grid from a list of rows, each a list of 0/1 ints.
+        """
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+        grid = cls(height, width)
+        cells = grid.cells
+        for x, row in enumerate(rows):
+            i = (x + 1) * grid.stride + 1
+            cells[i:i + width] = bytes(WALL if value else OPEN for value in row)
+        return grid
+
+    def to_rows(self):
+        """
+        Returns the maze as a list of rows of 0/1 ints.
+        """
+        return [
+            list(self.cells[(x + 1) * self.stride + 1:(x + 1) * self.stride + 1 + self.width])
+            for x in range(self.height)
+        ]
+
+    def _fill_border(self):
+        cells = self.cells
+        stride = self.stride
+        last_row = (self.height + 1) * stride
+        cells[0:stride] = b"\x01" * stride
+        cells[last_row:last_row + stride] = b"\x01" * stride
+        for i in range(stride, last_row, stride):
+            cells[i] = WALL
+            cells[i + stride - 1] = WALL
+
+    @property
+    def nbytes(self):
+        return len(self.cells)
+
+    def index(self, cell):
+        """
+        Returns the buffer index of the (x, y) cell.
+        """
+        return (cell[0] + 1) * self.stride + cell[1] + 1
+
+    def cell(self, index):
+        """
+        Returns the (x, y) cell at a buffer index.
+        """
+        x, y = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    def is_wall(self, cell):
+        """
+        Returns True if the cell is a wall. Cells one step outside the maze read as
+        walls because of the border.
+        """
+        return self.cells[(cell[0] + 1) * self.stride + cell[1] + 1] != OPEN
+
+    def is_valid_cell(self, cell):
+        return self.cells[(cell[0] + 1) * self.stride + cell[1] + 1] == OPEN
+
+    def set_wall(self, cell, wall=True):
+        """
+        Turns a cell into a wall, or back into an open cell when `wall` is False.
+        """
+        x, y = cell
+        if not (0 <= x < self.height and 0 <= y < self.width):
+            raise IndexError(f"Cell {cell} is outside the {self.height}x{self.width} grid")
+        self.cells[(x + 1) * self.stride + y + 1] = WALL if wall else OPEN
+        self.invalidate([cell])
+
+    def invalidate(self, changed=None):
+        """
+        Drops indexes cached from the cell contents. Called whenever the maze changes.
+
+        Args:
+            changed (list, optional): The (x, y) cells that changed, if known.
+                Cached values with a `repair(changed)` method are then repaired
+                in place instead of dropped.
+        """
+        self._adjacency = None
+        if changed is None:
+            self._cache.clear()
+            return
+        for key, value in list(self._cache.items()):
+            if hasattr(value, "repair"):
+                value.repair(changed)
+            else:
+                del self._cache[key]
+
+    def memo(self, key, build):
+        """
+        Returns the value cached under `key`, calling `build()` to create it if the
+        maze has changed since it was last cached.
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build()
+            return value
+
+    def open_indexes(self):
+        """
+        Returns the buffer indexes of all open cells, in row-major order.
+        """
+        cells = self.cells
+        return [i for i in range(len(cells)) if not cells[i]]
+
+    def adjacency(self):
+        """
+        Returns the cached CSR adjacency index of the maze, building it on first use.
+
+        Returns:
+            tuple: `(offsets, targets)` int arrays. The open neighbors of the cell at
+            buffer index `i` are `targets[offsets[i]:offsets[i + 1]]`.
+        """
+        if self._adjacency is None:
+            cells = self.cells
+            size = len(cells)
+            s = self.stride
+            offsets = array("i", bytes(4 * (size + 1)))
+            targets = array("i")
+            count = 0
+            for i in range(size):
+                offsets[i] = count
+                if cells[i]:
+                    continue
+                for n in (i + 1, i - 1, i + s, i - s):
+                    if not cells[n]:
+                        targets.append(n)
+                        count += 1
+            offsets[size] = count
+            self._adjacency = (offsets, targets)
+        return self._adjacency
+
+    def neighbors(self, index):
+        """
+        Returns the buffer indexes of the open cells next to the cell at `index`.
+        """
+        cells = self.cells
+        s = self.stride
+        return [n for n in (index + 1, index - 1, index + s, index - s) if not cells[n]]
+
+    def get_neighbors(self, cell):
+        """
+        Returns the open cells next to `cell`, in right, left, down, up order.
+
+        Args:
+            cell (tuple): The (x, y) coordinate of the current cell.
+
+        Returns:
+            list: A list of (x, y) coordinate tuples of the open neighboring cells.
+        """
+        x, y = cell
+        cells = self.cells
+        i = (x + 1) * self.stride + y + 1
+        return [(x + dx, y + dy) for off, dx, dy in self._moves if not cells[i + off]]
+
+
+class WeightedGrid(Grid):
+    """
+    A Grid whose open cells also carry the cost of stepping onto them.
+
+    Moving from a cell to a neighbor costs the neighbor's entry in `costs`, an
+    array indexed like `cells`. Costs default to 1, which makes the grid behave
+    like a plain Grid. The default signed typecode allows negative costs, which
+    only Bellman-Ford supports; terrain maps built with `from_costs` use compact
+    unsigned "B" (uint8) or "H" (uint16) costs.
+
+    Args:
+        height (int): The number of rows.
+        width (int): The number of columns.
+        cells (bytes-like, optional): The wall buffer, as for Grid.
+        costs (array, optional): Per-cell costs in the same layout as `cells`.
+        typecode (str): The array typecode for the default costs.
+    """
+
+    def __init__(self, height, width, cells=None, costs=None, typecode="i"):
+        super().__init__(height, width, cells)
+        if costs is None:
+            costs = array(typecode, [1]) * self.nbytes
+        elif len(costs) != self.nbytes:
+            raise ValueError(f"Expected {self.nbytes} costs, got {len(costs)}")
+        self.costs = costs
+
+    @classmethod
+    def from_costs(cls, rows, typecode="B"):
+        """
+        Builds a terrain grid from rows of per-cell costs, where 0 marks a wall.
+        """
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+        grid = cls(height, width, typecode=typecode)
+        cells = grid.cells
+        costs = grid.costs
+        for x, row in enumerate(rows):
+            i = (x + 1) * grid.stride + 1
+            for y, cost in enumerate(row):
+                if cost:
+                    costs[i + y] = cost
+                else:
+                    cells[i + y] = WALL
+        return grid
+
+    @property
+    def min_cost(self):
+        """
+        The cheapest step onto any open cell. Heuristics are scaled by it so that
+        they never overestimate.
+        """
+        costs = self.costs
+        return self.memo(
+            "min_cost", lambda: min((costs[i] for i in self.open_indexes()), default=1)
+        )
+
+    def cost(self, cell):
+        return self.costs[(cell[0] + 1) * self.stride + cell[1] + 1]
+
+    def set_cost(self, cell, cost):
+        """
+        Sets the cost of stepping onto `cell`.
+        """
+        x, y = cell
+        if not (0 <= x < self.height and 0 <= y < self.width):
+            raise IndexError(f"Cell {cell} is outside the {self.height}x{self.width} grid")
+        self.costs[(x + 1) * self.stride + y + 1] = cost
+        self.invalidate([cell])
+
+
+class SparseCells(dict):
+    """
+    Per-cell search state stored only for the cells a search touches, for
+    grids too large for an array over every cell (see `sparse`). Cells not
+    written read as `fill`.
+    """
+
+    def __init__(self, fill):
+        super().__init__()
+        self.fill = fill
+
+    def __missing__(self, index):
+        return self.fill
+
+    def count(self, value):
+        if value == self.fill:
+            raise ValueError("SparseCells cannot count unwritten cells")
+        return sum(1 for v in self.values() if v == value)
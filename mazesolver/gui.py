@@ -10,13 +10,26 @@
 # mazesolver/gui.py
 
 import tkinter as tk
-import time
-import queue
+from tkinter import filedialog
 import threading
-from .algorithms import *
+from collections import deque
+from .engine import ALGORITHMS, check_endpoints, solve
+from .stats import SearchStats
+from .cache import PathCache
+from .dstar_lite import DStarLite
+from .grid import Grid
+from .files import save
+from .trace import TraceReader, TraceWriter
 from .visualization import color_gradient, animate_path
 from .builder import enable_maze_builder
 
+# Milliseconds between canvas updates, and the speed slider's settings in
+# events painted per update; None paints everything queued at once.
+FRAME_MS = 16
+SPEEDS = (1, 2, 5, 20, 100, 1000, None)
+# Trace events decoded per frame when replaying at the instant setting.
+REPLAY_CHUNK = 10000
+
 
 class MazeSolverGUI:
     def __init__(self, root):
@@ -69,13 +82,35 @@ class MazeSolverGUI:
                 [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
             ],
         }
+        self.mazes = {name: Grid.from_rows(rows) for name, rows in self.mazes.items()}
 
         self.start = (0, 0)
         self.end = (8, 9)
         self.maze = self.mazes["Maze 1"]
-
-        self.width = len(self.maze[0])
-        self.height = len(self.maze)
+        # The D* Lite planner from the last "D*" solve, kept so that walls placed
+        # afterwards only repair the affected part of the search. The solver
+        # thread publishes it under `planner_lock`, and only if no wall was
+        # placed while it was planning.
+        self.planner = None
+        self.planner_lock = threading.Lock()
+        # Paths already solved, keyed by maze contents, endpoints and algorithm.
+        # Placing a wall changes the contents, so edited mazes are solved afresh.
+        self.path_cache = PathCache()
+
+        # Solving runs at full speed in a worker thread that only appends
+        # (generation, kind, a, b) events here; `drain_events` paints them on
+        # the Tk thread. Bumping `generation` discards events already queued.
+        self.events = deque()
+        self.generation = 0
+        self.events_per_frame = SPEEDS[2]
+        self.solver = None
+        # The trace opened with "Replay", and the (cell, color) steps still to
+        # play from it; see `replay_from`.
+        self.trace = None
+        self.replay = None
+
+        self.width = self.maze.width
+        self.height = self.maze.height
 
         # Create canvas for maze visualization...
         self.cell_width = 50
@@ -86,6 +121,11 @@ class MazeSolverGUI:
             height=self.height * self.cell_height,
         )
         self.canvas.pack()
+        # Canvas rectangle ids and current fill colors, one per cell in row-major
+        # order, for the maze shape in `cell_shape`; see `create_cells`.
+        self.cell_items = []
+        self.cell_fills = []
+        self.cell_shape = None
 
         # Dropdown menu to select maze...
         self.maze_var = tk.StringVar(self.root)
@@ -119,36 +159,18 @@ class MazeSolverGUI:
             "end": "green",
             "path_found": "orange",
             "path_traversed": "yellow",
-            "visited": "gray",
+            "expanded": "gray",
+            "pushed": "#d0d0d0",
             "wall": "black",
             "open": "white",
         }
 
-        # Initialize BFS variables...
-        self.queue = queue.Queue()
-        self.visited = set()
-        self.parent = {}
-
         self.algorithm_var = tk.StringVar(self.root)
         self.algorithm_var.set("BFS")
         self.algorithm_menu = tk.OptionMenu(
             self.root,
             self.algorithm_var,
-            "BFS",
-            "DFS",
-            "A*",
-            "Dijkstra",
-            "Greedy Best-First",
-            "Bidirectional",
-            "Random Walk",
-            "IDA*",
-            "Jump Point Search",
-            "Bellman-Ford",
-            "Floyd-Warshall",
-            "D*",
-            "Theta*",
-            "Fringe Search",
-            "SMA*",
+            *ALGORITHMS.keys(),
         )
         self.algorithm_menu.pack(side=tk.LEFT, padx=10)
 
@@ -159,6 +181,26 @@ class MazeSolverGUI:
         )
         self.visualization_menu.pack(side=tk.LEFT, padx=10)
 
+        self.speed_scale = tk.Scale(
+            self.root, from_=0, to=len(SPEEDS) - 1, orient=tk.HORIZONTAL,
+            showvalue=False, command=self.set_speed,
+        )
+        self.speed_scale.set(SPEEDS.index(self.events_per_frame))
+        self.speed_scale.pack(side=tk.LEFT, padx=10)
+        self.set_speed(self.speed_scale.get())
+
+        # Recording and replaying search traces; see `mazesolver.trace`.
+        self.record_var = tk.BooleanVar(self.root, value=False)
+        self.record_check = tk.Checkbutton(self.root, text="Record", variable=self.record_var)
+        self.record_check.pack(side=tk.LEFT, padx=10)
+        self.replay_button = tk.Button(self.root, text="Replay", command=self.open_trace)
+        self.replay_button.pack(side=tk.LEFT, padx=10)
+        self.scrub_scale = tk.Scale(
+            self.root, from_=0, to=0, orient=tk.HORIZONTAL, label="Trace", command=self.scrub
+        )
+        self.scrub_scale.pack(side=tk.LEFT, padx=10)
+        self.root.after(FRAME_MS, self.drain_events)
+
     def select_maze(self, maze_name):
         """
         Selects a maze from the available mazes and draws it on the canvas.
@@ -167,97 +209,211 @@ class MazeSolverGUI:
             maze_name (str): The name of the maze to select.
         """
         self.maze = self.mazes[maze_name]
+        self.planner = None
+        self.replay = None
         self.draw_maze()
 
     def draw_maze(self):
         """
         Draws the current maze on the canvas.
 
-        This method first clears the canvas, then iterates through the maze matrix and draws a rectangle for each cell. The color of the rectangle is determined by the value in the maze matrix:
+        Each cell is one rectangle, created the first time a maze of this size is
+        drawn and recolored in place afterwards, so redrawing never adds canvas
+        items. The color of a cell is determined by the cell:
         - 0 (open path) is drawn as white
         - 1 (wall) is drawn as black
         - The start cell is drawn as blue
         - The end cell is drawn as green
 
-        The rectangles are drawn using the `create_rectangle()` method of the canvas, with the coordinates calculated based on the cell width and height.
+        Solver events still queued are dropped, since they were meant for the
+        old drawing.
         """
-        self.canvas.delete("all")
-
-        for i in range(len(self.maze)):
-            for j in range(len(self.maze[0])):
-                x1 = j * self.cell_width
-                y1 = i * self.cell_height
-                x2 = x1 + self.cell_width
-                y2 = y1 + self.cell_height
+        self.generation += 1
+        self.events.clear()
+        if self.cell_shape != (self.maze.height, self.maze.width):
+            self.create_cells()
+
+        width = self.maze.width
+        for i in range(self.maze.height):
+            for j in range(width):
                 color = "white"  # Default color for open paths
 
-                if self.maze[i][j] == 1:
+                if self.maze.is_wall((i, j)):
                     color = "black"  # Walls
                 elif (i, j) == self.start:
                     color = "blue"  # Start point
                 elif (i, j) == self.end:
                     color = "green"  # End point
 
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray")
+                self.fill_cell(i * width + j, color)
+
+    def create_cells(self):
+        """
+        Replaces the canvas contents with one rectangle per cell of the current
+        maze and records their item ids in `cell_items`, row by row.
+        """
+        self.canvas.delete("all")
+        self.cell_items = []
+        for i in range(self.maze.height):
+            for j in range(self.maze.width):
+                x1 = j * self.cell_width
+                y1 = i * self.cell_height
+                self.cell_items.append(
+                    self.canvas.create_rectangle(
+                        x1, y1, x1 + self.cell_width, y1 + self.cell_height,
+                        fill="white", outline="gray",
+                    )
+                )
+        self.cell_fills = ["white"] * len(self.cell_items)
+        self.cell_shape = (self.maze.height, self.maze.width)
+
+    def fill_cell(self, slot, color):
+        """
+        Recolors the rectangle of cell number `slot` (row-major), skipping the
+        Tk call when it already has that color.
+        """
+        if self.cell_fills[slot] != color:
+            self.cell_fills[slot] = color
+            self.canvas.itemconfig(self.cell_items[slot], fill=color)
 
     def start_solving(self):
         """
-        Starts the maze-solving process in a separate thread.
+        Starts the maze-solving process in a separate thread, unless one is still
+        running.
+
+        The Tk variables are read here, on the Tk thread; the worker thread never
+        touches Tk.
         """
-        threading.Thread(target=self.solve_maze).start()
+        if self.solver is not None and self.solver.is_alive():
+            return
+        try:
+            check_endpoints(self.maze, self.start, self.end)
+        except ValueError as exc:
+            self.status_label.config(text=str(exc), fg="red")
+            return
+        trace_path = None
+        if self.record_var.get():
+            trace_path = filedialog.asksaveasfilename(
+                defaultextension=".trace", filetypes=[("Trace", "*.trace")]
+            )
+            if not trace_path:
+                return
+        self.replay = None
+        self.planner = None
+        self.clear_path()
+        self.status_label.config(text="Finding path...", fg="blue")
+        self.solver = threading.Thread(
+            target=self.solve_maze,
+            args=(
+                self.generation, self.algorithm_var.get(), self.visualization_var.get(),
+                trace_path,
+            ),
+            daemon=True,
+        )
+        self.solver.start()
 
-    def solve_maze(self):
+    def solve_maze(self, generation, algorithm, visualization, trace_path=None):
         """
         Attempts to solve the current maze using the selected algorithm.
 
-        This method first clears any existing path, updates the status label to indicate that a path
-        is being found, and then calls the appropriate algorithm method based on the selected algorithm.
+        Runs at full speed: every cell the algorithm visits, then every step of
+        the path in the selected visualization style and finally the status text
+        are queued as events for `drain_events` to paint.
 
-        If a path is found, it is highlighted on the canvas and the status label is updated to indicate
-        that a path has been found. If no path is found, the status label is updated to indicate that no path was found.
+        Args:
+            generation (int): Tags the queued events; see `draw_maze`.
+            algorithm (str): The algorithm name.
+            visualization (str): "Normal", "Color Gradient" or "Animation".
+            trace_path (str, optional): Also record the solve into this trace
+                file, solving afresh rather than from the path cache.
         """
-        self.clear_path()
-        self.status_label.config(text="Finding path...", fg="blue")
-        self.root.update()
-
-        algorithm = self.algorithm_var.get()
-
-        if algorithm == "BFS":
-            path_found = bfs(self)
-        elif algorithm == "DFS":
-            path_found = dfs(self)
-        elif algorithm == "A*":
-            path_found = astar(self)
-        elif algorithm == "Dijkstra":
-            path_found = dijkstra(self)
-        elif algorithm == "Greedy Best-First":
-            path_found = greedy_best_first_search(self)
-        elif algorithm == "Bidirectional":
-            path_found = bidirectional_search(self)
-        elif algorithm == "Random Walk":
-            path_found = random_walk(self)
-        elif algorithm == "IDA*":
-            path_found = ida_star(self)
-        elif algorithm == "Jump Point Search":
-            path_found = jump_point_search(self)
-        elif algorithm == "Bellman-Ford":
-            path_found = bellman_ford(self)
-        elif algorithm == "Floyd-Warshall":
-            path_found = floyd_warshall(self)
-        elif algorithm == "D*":
-            path_found = d_star(self)
-        elif algorithm == "Theta*":
-            path_found = theta_star(self)
-        elif algorithm == "Fringe Search":
-            path_found = fringe_search(self)
-        elif algorithm == "SMA*":
-            path_found = sma_star(self)
+        events = self.events
+        writer = TraceWriter(trace_path, self.maze) if trace_path else None
+
+        def show_visited(cell, event):
+            events.append((generation, "cell", cell, event))
+            if writer:
+                writer(cell, event)
+
+        cached = False
+        stats = SearchStats()
+        if algorithm == "D*":
+            planner = DStarLite(
+                self.maze, self.start, self.end, observer=show_visited, stats=stats
+            )
+            with stats.measure():
+                path_found = planner.plan()
+            # Later replans run on the Tk thread and draw only the new path.
+            planner.observer = planner.stats = None
+            with self.planner_lock:
+                if generation == self.generation:
+                    self.planner = planner
+        elif writer:
+            path_found = solve(
+                self.maze, self.start, self.end, algorithm, show_visited, stats=stats
+            )
+        else:
+            hits = self.path_cache.hits
+            path_found = self.path_cache.solve(
+                self.maze, self.start, self.end, algorithm, observer=show_visited, stats=stats
+            )
+            cached = self.path_cache.hits > hits
+
+        if writer:
+            for cell in path_found or ():
+                writer(cell, "path")
+            writer.close()
 
         if path_found:
-            self.highlight_path(path_found)
-            self.status_label.config(text="Path found!", fg="green")
+            for cell, color in self.path_steps(path_found, visualization):
+                events.append((generation, "cell", cell, color))
+            text = "Path found! (cached)" if cached else f"Path found! {stats.summary()}"
+            events.append((generation, "status", text, "green"))
+        elif cached:
+            events.append((generation, "status", "No path found! (cached)", "red"))
         else:
-            self.status_label.config(text="No path found!", fg="red")
+            events.append((generation, "status", f"No path found! {stats.summary()}", "red"))
+
+    def drain_events(self):
+        """
+        Paints queued solver events, at most `events_per_frame` cells per call,
+        and schedules the next call with `root.after()`.
+        """
+        events = self.events
+        if self.replay is not None:
+            wanted = self.events_per_frame or REPLAY_CHUNK
+            while len(events) < wanted:
+                step = next(self.replay, None)
+                if step is None:
+                    self.replay = None
+                    events.append((self.generation, "status", "Replay finished", "green"))
+                    break
+                events.append((self.generation, "cell", step[0], step[1]))
+
+        budget = self.events_per_frame
+        if budget is None:
+            budget = len(events)
+        while events and budget > 0:
+            generation, kind, a, b = events.popleft()
+            if generation != self.generation:
+                continue
+            if kind == "cell":
+                self.color_cell(a, b)
+                budget -= 1
+            else:
+                self.status_label.config(text=a, fg=b)
+        self.root.after(FRAME_MS, self.drain_events)
+
+    def set_speed(self, value):
+        """
+        Speed slider callback: picks the events painted per frame from SPEEDS.
+        """
+        self.events_per_frame = SPEEDS[int(float(value))]
+        if self.events_per_frame is None:
+            label = "Speed: instant"
+        else:
+            label = f"Speed: {self.events_per_frame}/frame"
+        self.speed_scale.config(label=label)
 
     def color_cell(self, cell, color):
         """
@@ -271,38 +427,97 @@ class MazeSolverGUI:
             None
         """
         x, y = cell
-        x1, y1 = y * self.cell_width, x * self.cell_height
-        x2, y2 = x1 + self.cell_width, y1 + self.cell_height
         if color in self.colors:
             fill_color = self.colors[color]
         else:
             fill_color = color  # Assuming color is a hex color string
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill=fill_color, outline="gray")
+        self.fill_cell(x * self.maze.width + y, fill_color)
+
+    def open_trace(self):
+        """
+        Asks for a trace file recorded on a maze of the current size and replays
+        it from the start.
+        """
+        path = filedialog.askopenfilename(filetypes=[("Trace", "*.trace")])
+        if not path:
+            return
+        try:
+            trace = TraceReader(path)
+        except (OSError, ValueError) as exc:
+            self.status_label.config(text=f"Cannot open trace: {exc}", fg="red")
+            return
+        if (trace.height, trace.width) != (self.maze.height, self.maze.width):
+            self.status_label.config(
+                text=f"The trace is for a {trace.height}x{trace.width} maze", fg="red"
+            )
+            return
+        self.trace = trace
+        self.scrub_scale.config(to=len(trace))
+        self.replay_from(0)
+
+    def scrub(self, value):
+        """
+        Trace slider callback: jumps the replay to the chosen event.
+        """
+        if self.trace is not None:
+            self.replay_from(int(float(value)))
 
-    def highlight_path(self, path):
+    def replay_from(self, position):
         """
-        Highlights the path found in the maze based on the selected visualization style.
+        Redraws the maze as it looked after the first `position` events of the
+        open trace, then plays the rest through the event queue at the selected
+        speed and in the selected visualization style.
         """
+        self.draw_maze()
         visualization = self.visualization_var.get()
+        painted = {}
+        path = []
+        for _, (event, cell) in zip(range(position), self.trace.events()):
+            if event == "path":
+                path.append(cell)
+            else:
+                painted[cell] = event
+        for cell, event in painted.items():
+            self.color_cell(cell, event)
+        if path:
+            # Every style ends by marking the end cell, which the path has not
+            # reached yet.
+            for cell, color in list(self.path_steps(path, visualization))[:-1]:
+                self.color_cell(cell, color)
+        self.status_label.config(text="Replaying trace...", fg="blue")
+        self.replay = self.replay_steps(position, visualization, path)
+
+    def replay_steps(self, position, visualization, path):
+        """
+        Yields the (cell, color) steps of the open trace from event `position`
+        on. Path events are gathered into `path`, which holds the path cells
+        already painted, and drawn in the visualization style at the end.
+        """
+        painted = len(path)
+        for event, cell in self.trace.events(position):
+            if event == "path":
+                path.append(cell)
+            else:
+                yield cell, event
+        if path:
+            yield from list(self.path_steps(path, visualization))[painted:]
+
+    def path_steps(self, path, visualization):
+        """
+        Returns the (cell, color) steps that highlight the path in the given
+        visualization style.
+        """
         if visualization == "Color Gradient":
-            color_gradient(self, path)
-        elif visualization == "Animation":
-            animate_path(self, path)
-        else:
-            for x, y in path:
-                self.color_cell((x, y), "path_traversed")
-                self.root.update()
-                time.sleep(0.2)
-            self.color_cell(self.end, "path_found")
+            return color_gradient(self, path)
+        if visualization == "Animation":
+            return animate_path(self, path)
+        return [(cell, "path_traversed") for cell in path] + [(self.end, "path_found")]
 
     def clear_path(self):
         """
-        Clears the path in the maze solver by resetting the queue, visited set, and parent dictionary.
-        It then redraws the maze and updates the status label to indicate that a new path should be selected.
+        Clears the path by redrawing the maze, then updates the status label to indicate
+        that a new path should be selected.
         """
-        self.queue = queue.Queue()
-        self.visited = set()
-        self.parent = {}
         self.draw_maze()
         self.status_label.config(
             text="Select a maze and click 'Start' to find path", fg="blue"
@@ -332,8 +547,32 @@ class MazeSolverGUI:
         Places a wall at the clicked cell position on the canvas.
         """
         x, y = event.x // self.cell_width, event.y // self.cell_height
-        self.maze[y][x] = 1
-        self.draw_maze()
+        with self.planner_lock:
+            self.maze.set_wall((y, x))
+            self.draw_maze()
+            if self.solver is not None and self.solver.is_alive():
+                # Never replan while the solver thread may still be using the
+                # planner; the new generation keeps it from being published.
+                self.planner = None
+        if self.planner is not None:
+            self.replan([(y, x)])
+
+    def replan(self, changed):
+        """
+        Repairs the D* Lite plan after `changed` cells were edited and draws the
+        new path without animation.
+        """
+        self.planner.update(changed)
+        path = self.planner.plan()
+        if path:
+            for cell in path:
+                self.color_cell(cell, "path_traversed")
+            self.color_cell(self.end, "path_found")
+            self.status_label.config(
+                text=f"Replanned: {self.planner.expanded} cells expanded", fg="green"
+            )
+        else:
+            self.status_label.config(text="No path found!", fg="red")
 
     def set_start_end(self, event):
         """
@@ -344,13 +583,21 @@ class MazeSolverGUI:
             self.start = (y, x)
         else:
             self.end = (y, x)
+        self.planner = None
         self.draw_maze()
 
     def save_custom_maze(self):
         """
-        Saves the custom maze configuration.
+        Saves the custom maze configuration, and to a file if the user picks one
+        (.maze, .png, .pbm or ASCII .txt).
         """
         self.mazes["Custom Maze"] = self.maze
+        path = filedialog.asksaveasfilename(
+            defaultextension=".maze",
+            filetypes=[("Maze", "*.maze"), ("PNG", "*.png"), ("PBM", "*.pbm"), ("ASCII", "*.txt")],
+        )
+        if path:
+            save(path, self.maze, self.start, self.end)
         self.maze_var.set("Custom Maze")
         self.maze_menu["menu"].add_command(
             label="Custom Maze", command=lambda: self.select_maze("Custom Maze")
@@ -360,93 +607,6 @@ class MazeSolverGUI:
             text="Custom maze saved. Click 'Start' to find path", fg="green"
         )
 
-    def heuristic(self, cell, goal):
-        """
-        Heuristic function for A* algorithm. Uses Manhattan distance.
-        """
-        return abs(cell[0] - goal[0]) + abs(cell[1] - goal[1])
-
-    def get_neighbors(self, cell):
-        """
-        Returns a list of neighboring cells that are valid and unvisited in the current maze.
-
-        This method takes a cell coordinate as input and returns a list of all neighboring cells
-        that are within the bounds of the maze and have a value of 0 (i.e. are unvisited).
-        The possible movements are right, left, down, and up.
-
-        Args:
-            cell (tuple): The (x, y) coordinate of the current cell.
-
-        Returns:
-            list: A list of (x, y) coordinate tuples representing the valid, unvisited neighboring cells.
-        """
-        x, y = cell
-        neighbors = []
-
-        # Define possible movements (right, left, down, up)
-        movements = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-
-        for dx, dy in movements:
-            nx, ny = x + dx, y + dy
-            if (
-                0 <= nx < len(self.maze)
-                and 0 <= ny < len(self.maze[0])
-                and self.maze[nx][ny] == 0
-            ):
-                neighbors.append((nx, ny))
-
-        return neighbors
-
-    def construct_bidirectional_path(
-        self, forward_visited, backward_visited, meet_point
-    ):
-        path = []
-        current = meet_point
-        while current:
-            path.append(current)
-            current = forward_visited[current]
-        path.reverse()
-
-        current = backward_visited[meet_point]
-        while current:
-            path.append(current)
-            current = backward_visited[current]
-
-        return path
-
-    def is_valid_cell(self, cell):
-        x, y = cell
-        return 0 <= x < self.height and 0 <= y < self.width and not self.is_wall(cell)
-
-    def is_wall(self, cell):
-        x, y = cell
-        if x < 0 or y < 0 or x >= self.height or y >= self.width:
-            return True
-        return self.maze[x][y] == 1
-
-    def construct_path(self, end):
-        """
-        Constructs the path from the start to the end of the maze.
-
-        This method takes the end cell as input and reconstructs the path from the end cell back
-        to the start cell by following the parent pointers stored in the `self.parent` dictionary.
-        The path is returned as a list of cell coordinates in the order they should be traversed.
-
-        Args:
-            end (tuple): The (x, y) coordinate of the end cell.
-
-        Returns:
-            list: A list of (x, y) coordinate tuples representing the path from the start to the end cell.
-        """
-        path = []
-        current = end
-        while current in self.parent:
-            path.append(current)
-            current = self.parent[current]
-        path.append(self.start)
-        path.reverse()
-        return path
-
 
 if __name__ == "__main__":
     root = tk.Tk()
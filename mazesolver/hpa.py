@@ -0,0 +1,372 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/hpa.py
+#
+# Hierarchical path-finding A* (Botea, Müller and Schaeffer, 2004). The maze is
+# cut into square clusters; entrances are the open cell pairs chosen along each
+# shared cluster edge, and every cluster stores the distances between its own
+# entrance cells. A query connects its endpoints to the entrances of their
+# clusters, runs A* over that small abstract graph and then expands each
+# abstract step into cells with a search confined to one cluster.
+
+import heapq
+from collections import deque
+
+CLUSTER_SIZE = 16
+
+# Open runs along a cluster edge shorter than this get one entrance in their
+# middle; longer runs get one at each end.
+WIDE_ENTRANCE = 6
+
+
+class AbstractGraph:
+    """
+    The cluster and entrance graph HPA* searches, built lazily and cached.
+
+    Cluster edges and intra-cluster distances are computed the first time a
+    query reaches a cluster and kept until the maze changes there; `repair()`
+    drops only the clusters (and their neighbors, when a cluster edge changed)
+    that contain the edited cells. Cached on a Grid with `memo()`, the graph is
+    repaired automatically by `set_wall`.
+
+    Paths are near-optimal rather than optimal: they are shortest over the
+    abstract graph, which only crosses cluster edges at the chosen entrances.
+
+    Args:
+        grid (Grid): An unweighted maze.
+        cluster_size (int): The side of each square cluster, in cells.
+    """
+
+    def __init__(self, grid, cluster_size=CLUSTER_SIZE):
+        if getattr(grid, "costs", None) is not None:
+            raise ValueError("HPA* needs a uniform-cost grid")
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.clusters_down = -(-grid.height // cluster_size)
+        self.clusters_across = -(-grid.width // cluster_size)
+        # Entrance pairs per cluster edge, keyed by (cluster, side) with side 0
+        # for the edge below the cluster and 1 for the edge to its right.
+        self._edges = {}
+        # Per cluster: (distances between its entrances, links to the entrances
+        # across its edges), both keyed by entrance cell id.
+        self._clusters = {}
+
+    def cluster_of(self, index):
+        x, y = divmod(index, self.grid.stride)
+        size = self.cluster_size
+        return (x - 1) // size * self.clusters_across + (y - 1) // size
+
+    def _bounds(self, cluster):
+        """
+        Returns the cluster's `(top, bottom, left, right)` cell id rows and
+        columns, bottom and right exclusive.
+        """
+        size = self.cluster_size
+        cx, cy = divmod(cluster, self.clusters_across)
+        top = cx * size + 1
+        left = cy * size + 1
+        return (
+            top, min(top + size, self.grid.height + 1),
+            left, min(left + size, self.grid.width + 1),
+        )
+
+    def _edge(self, cluster, side):
+        """
+        Returns the entrance pairs `(inside, outside)` on the cluster's bottom
+        (side 0) or right (side 1) edge; empty where the maze ends.
+        """
+        key = (cluster, side)
+        pairs = self._edges.get(key)
+        if pairs is not None:
+            return pairs
+
+        cells = self.grid.cells
+        stride = self.grid.stride
+        top, bottom, left, right = self._bounds(cluster)
+        if side == 0:
+            step = stride
+            line = [(bottom - 1) * stride + y for y in range(left, right)]
+            exists = bottom <= self.grid.height
+        else:
+            step = 1
+            line = [x * stride + right - 1 for x in range(top, bottom)]
+            exists = right <= self.grid.width
+
+        pairs = []
+        run = []
+        for index in line + [None]:
+            if exists and index is not None and not cells[index] and not cells[index + step]:
+                run.append(index)
+                continue
+            if run:
+                if len(run) < WIDE_ENTRANCE:
+                    ends = [run[len(run) // 2]]
+                else:
+                    ends = [run[0], run[-1]]
+                pairs.extend((i, i + step) for i in ends)
+                run = []
+        self._edges[key] = pairs
+        return pairs
+
+    def _cluster(self, cluster, stats=None):
+        """
+        Returns the cluster's `(distances, links)`, computing them on first use.
+        """
+        cached = self._clusters.get(cluster)
+        if cached is not None:
+            return cached
+
+        across = self.clusters_across
+        cx, cy = divmod(cluster, across)
+        links = {}
+        for inside, outside in self._edge(cluster, 0) + self._edge(cluster, 1):
+            links.setdefault(inside, []).append(outside)
+        if cx > 0:
+            for outside, inside in self._edge(cluster - across, 0):
+                links.setdefault(inside, []).append(outside)
+        if cy > 0:
+            for outside, inside in self._edge(cluster - 1, 1):
+                links.setdefault(inside, []).append(outside)
+
+        cached = self._clusters[cluster] = (self._distances(cluster, list(links), stats), links)
+        return cached
+
+    def _distances(self, cluster, nodes, stats=None):
+        """
+        Returns `{node: [(other, distance), ...]}` between the given cells of one
+        cluster, with one breadth-first search per node over a walled copy of
+        the cluster.
+        """
+        stride = self.grid.stride
+        cells = self.grid.cells
+        top, bottom, left, right = self._bounds(cluster)
+        local_stride = right - left + 2
+        local = bytearray(b"\x01") * (local_stride * (bottom - top + 2))
+        for x in range(top, bottom):
+            begin = (x - top + 1) * local_stride + 1
+            local[begin:begin + right - left] = cells[x * stride + left:x * stride + right]
+
+        def to_local(index):
+            x, y = divmod(index, stride)
+            return (x - top + 1) * local_stride + y - left + 1
+
+        ids = [to_local(node) for node in nodes]
+        targets = set(ids)
+        offsets = (1, -1, local_stride, -local_stride)
+        distances = {}
+        for node, source in zip(nodes, ids):
+            depth = [-1] * len(local)
+            depth[source] = 0
+            remaining = len(ids) - 1
+            frontier = deque([source])
+            if stats:
+                stats.push(1)
+            while frontier and remaining:
+                current = frontier.popleft()
+                if stats:
+                    stats.pops += 1
+                    stats.expansions += 1
+                step = depth[current] + 1
+                for offset in offsets:
+                    neighbor = current + offset
+                    if depth[neighbor] < 0 and not local[neighbor]:
+                        depth[neighbor] = step
+                        frontier.append(neighbor)
+                        if stats:
+                            stats.push(len(frontier))
+                        if neighbor in targets:
+                            remaining -= 1
+            distances[node] = [
+                (other, depth[i]) for other, i in zip(nodes, ids) if i != source and depth[i] >= 0
+            ]
+        return distances
+
+    def _local_search(self, cluster, source, targets=None, goal=None, stats=None):
+        """
+        Breadth-first search from `source` that never leaves `cluster`. Stops
+        once every id in `targets`, or `goal`, has been reached.
+
+        Returns:
+            tuple: `(parent, depth)` dicts over the cells reached.
+        """
+        stride = self.grid.stride
+        neighbors = self.grid.neighbors
+        top, bottom, left, right = self._bounds(cluster)
+        parent = {source: -1}
+        depth = {source: 0}
+        remaining = len(targets) - (source in targets) if targets else 0
+        frontier = deque([source])
+        if stats:
+            stats.push(1)
+        while frontier:
+            current = frontier.popleft()
+            if stats:
+                stats.pops += 1
+            if current == goal:
+                break
+            if stats:
+                stats.expansions += 1
+            for neighbor in neighbors(current):
+                if neighbor in parent:
+                    continue
+                x, y = divmod(neighbor, stride)
+                if top <= x < bottom and left <= y < right:
+                    parent[neighbor] = current
+                    depth[neighbor] = depth[current] + 1
+                    frontier.append(neighbor)
+                    if stats:
+                        stats.push(len(frontier))
+                    if targets and neighbor in targets:
+                        remaining -= 1
+            if targets and not remaining:
+                break
+        return parent, depth
+
+    def repair(self, changed):
+        """
+        Drops the cached clusters and cluster edges that the changed cells can
+        affect. Called by `Grid.set_wall` when the graph is cached on the grid.
+
+        Args:
+            changed (list): The (x, y) cells that changed.
+        """
+        size = self.cluster_size
+        across = self.clusters_across
+        for x, y in changed:
+            cluster = x // size * across + y // size
+            # The cluster edges the cell lies on: entrances are chosen from the
+            # cells on both sides of an edge.
+            edges = []
+            if x % size == size - 1:
+                edges.append((cluster, 0))
+            if x % size == 0 and x:
+                edges.append((cluster - across, 0))
+            if y % size == size - 1:
+                edges.append((cluster, 1))
+            if y % size == 0 and y:
+                edges.append((cluster - 1, 1))
+
+            self._clusters.pop(cluster, None)
+            for owner, side in edges:
+                self._edges.pop((owner, side), None)
+                self._clusters.pop(owner, None)
+                self._clusters.pop(owner + (across if side == 0 else 1), None)
+
+    def find_path(self, start, goal, visit=None, stats=None):
+        """
+        Finds a path between two cell ids.
+
+        Args:
+            start (int): The start cell id.
+            goal (int): The goal cell id.
+            visit (callable, optional): Called with each abstract node expanded.
+            stats (SearchStats, optional): Counts the nodes and open-list
+                operations of every search the query runs: the breadth-first
+                searches that build clusters, join the endpoints and refine the
+                route, and the abstract search itself.
+
+        Returns:
+            list: The cell ids from start to goal, or None if there is no path.
+        """
+        cells = self.grid.cells
+        if cells[start] or cells[goal]:
+            return None
+        if start == goal:
+            return [start]
+
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        start_links = self._cluster(start_cluster, stats)[1]
+        goal_links = self._cluster(goal_cluster, stats)[1]
+
+        # Temporary edges joining the endpoints to their clusters' entrances.
+        depth = self._local_search(start_cluster, start, start_links, stats=stats)[1]
+        start_edges = [(node, depth[node]) for node in start_links if node in depth]
+        if start_cluster == goal_cluster:
+            depth = self._local_search(start_cluster, start, goal=goal, stats=stats)[1]
+            if goal in depth:
+                start_edges.append((goal, depth[goal]))
+        depth = self._local_search(goal_cluster, goal, goal_links, stats=stats)[1]
+        goal_edges = {node: depth[node] for node in goal_links if node in depth}
+
+        route = self._abstract_search(start, goal, start_edges, goal_edges, visit, stats)
+        if route is None:
+            return None
+        return self._refine(route, stats)
+
+    def _abstract_search(self, start, goal, start_edges, goal_edges, visit, stats):
+        stride = self.grid.stride
+        gx, gy = divmod(goal, stride)
+        g_cost = {start: 0}
+        parent = {start: -1}
+        closed = set()
+        open_set = [(0, start)]
+        if stats:
+            stats.push(1)
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            if stats:
+                stats.pops += 1
+            if current == goal:
+                route = []
+                while current != -1:
+                    route.append(current)
+                    current = parent[current]
+                route.reverse()
+                return route
+            if current in closed:
+                if stats:
+                    stats.stale_pops += 1
+                continue
+            closed.add(current)
+            if visit:
+                visit(current)
+            if stats:
+                stats.expansions += 1
+
+            distances, links = self._cluster(self.cluster_of(current), stats)
+            edges = list(distances.get(current, ()))
+            edges.extend((other, 1) for other in links.get(current, ()))
+            if current == start:
+                edges.extend(start_edges)
+            if current in goal_edges:
+                edges.append((goal, goal_edges[current]))
+
+            base = g_cost[current]
+            for neighbor, cost in edges:
+                tentative = base + cost
+                if tentative < g_cost.get(neighbor, tentative + 1):
+                    g_cost[neighbor] = tentative
+                    parent[neighbor] = current
+                    nx, ny = divmod(neighbor, stride)
+                    heapq.heappush(open_set, (tentative + abs(nx - gx) + abs(ny - gy), neighbor))
+                    if stats:
+                        stats.push(len(open_set))
+        return None
+
+    def _refine(self, route, stats=None):
+        """
+        Expands consecutive abstract nodes into the cells between them.
+        """
+        path = [route[0]]
+        for a, b in zip(route, route[1:]):
+            cluster = self.cluster_of(a)
+            if cluster != self.cluster_of(b):
+                path.append(b)
+                continue
+            parent = self._local_search(cluster, a, goal=b, stats=stats)[0]
+            steps = []
+            current = b
+            while current != a:
+                steps.append(current)
+                current = parent[current]
+            path.extend(reversed(steps))
+        return path
@@ -0,0 +1,326 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/jps.py
+#
+# Jump Point Search on uniform-cost grids, for 4-connected movement and for
+# 8-connected movement without corner cutting (a diagonal step needs both of the
+# orthogonal cells next to it to be open).
+#
+# Both the online search and JPS+ describe a jump as a signed distance: from a
+# cell, moving in a direction, a positive k means a jump point k steps away and
+# -k (or 0) means k steps are possible before a wall. JPS scans the grid to get
+# that distance; JPS+ looks it up in tables precomputed once per maze.
+
+import heapq
+import math
+from array import array
+
+from .grid import SparseCells
+
+# (row, column) steps. The first four are straight, the last four diagonal.
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1))
+RIGHT, LEFT, DOWN, UP = 0, 1, 2, 3
+SQRT2 = math.sqrt(2)
+
+
+def _direction(dr, dc):
+    return DIRECTIONS.index((dr, dc))
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+def _search_directions(diagonal):
+    """
+    For every arrival direction (plus None for the start), the directions worth
+    jumping in next. Anything else is reached at least as cheaply another way.
+    """
+    table = {None: range(8) if diagonal else range(4)}
+    for d, (dr, dc) in enumerate(DIRECTIONS[:4]):
+        if diagonal:
+            # forward, both sides, and the two forward diagonals
+            sides = [(dc, dr), (-dc, -dr)]
+            table[d] = [d] + [_direction(*side) for side in sides] + [
+                _direction(dr + sr, dc + sc) for sr, sc in sides
+            ]
+        else:
+            table[d] = [e for e in range(4) if DIRECTIONS[e] != (-dr, -dc)]
+    if diagonal:
+        for d, (dr, dc) in enumerate(DIRECTIONS[4:], 4):
+            table[d] = [_direction(0, dc), _direction(dr, 0), d]
+    return table
+
+
+class OnlineJumps:
+    """
+    Computes jump distances on demand by scanning the grid, as classic JPS does.
+    """
+
+    def __init__(self, grid, diagonal):
+        self.cells = grid.cells
+        self.stride = grid.stride
+        self.diagonal = diagonal
+        self.offsets = [dr * grid.stride + dc for dr, dc in DIRECTIONS]
+
+    def __call__(self, cell, d):
+        if d < 4:
+            return self.straight(cell, d)
+        return self.diagonal_jump(cell, d)
+
+    def straight(self, cell, d):
+        cells = self.cells
+        stride = self.stride
+        step = self.offsets[d]
+        # The cells beside the line, and the ones just behind them.
+        side = stride if d < DOWN else 1
+        behind = -step
+
+        n = cell
+        k = 0
+        while True:
+            if cells[n + step]:
+                return -k
+            n += step
+            k += 1
+            # A side cell that is open while the one behind it is a wall is a
+            # forced neighbor: paths around that wall have to turn here.
+            if (not cells[n - side] and cells[n - side + behind]) or (
+                not cells[n + side] and cells[n + side + behind]
+            ):
+                return k
+            # Without diagonals, vertical runs also stop where a horizontal run
+            # would find a jump point.
+            if not self.diagonal and d >= DOWN and (
+                self.straight(n, RIGHT) > 0 or self.straight(n, LEFT) > 0
+            ):
+                return k
+
+    def diagonal_jump(self, cell, d):
+        cells = self.cells
+        dr, dc = DIRECTIONS[d]
+        step = self.offsets[d]
+        horizontal = RIGHT if dc > 0 else LEFT
+        vertical = DOWN if dr > 0 else UP
+
+        n = cell
+        k = 0
+        while True:
+            if cells[n + step] or cells[n + dr * self.stride] or cells[n + dc]:
+                return -k
+            n += step
+            k += 1
+            if self.straight(n, horizontal) > 0 or self.straight(n, vertical) > 0:
+                return k
+
+
+class JumpTable:
+    """
+    Precomputed jump distances for JPS+: one compact int array per direction,
+    indexed by cell id, filled in a single sweep per direction.
+
+    Args:
+        grid (Grid): The maze.
+        diagonal (bool): Whether to build the four diagonal tables too.
+    """
+
+    def __init__(self, grid, diagonal):
+        self.diagonal = diagonal
+        cells = grid.cells
+        stride = grid.stride
+        size = len(cells)
+        typecode = "h" if max(grid.height, grid.width) < 0x7FFF else "i"
+        offsets = [dr * stride + dc for dr, dc in DIRECTIONS]
+        self.tables = [array(typecode, bytes(array(typecode).itemsize * size))
+                       for _ in range(8 if diagonal else 4)]
+
+        def sweep(d, is_jump_point, blocked):
+            table = self.tables[d]
+            step = offsets[d]
+            # Each cell's distance builds on the next cell's, so visit the cells
+            # against the direction of travel.
+            order = range(size - 1, -1, -1) if step > 0 else range(size)
+            for c in order:
+                if cells[c]:
+                    continue
+                n = c + step
+                if blocked(c, n):
+                    continue
+                if is_jump_point(n):
+                    table[c] = 1
+                else:
+                    k = table[n]
+                    table[c] = k + 1 if k > 0 else k - 1
+
+        def straight_rule(d):
+            side = stride if d < DOWN else 1
+            behind = -offsets[d]
+            horizontal = self.tables[RIGHT], self.tables[LEFT]
+
+            def is_jump_point(n):
+                if (not cells[n - side] and cells[n - side + behind]) or (
+                    not cells[n + side] and cells[n + side + behind]
+                ):
+                    return True
+                return not diagonal and d >= DOWN and (
+                    horizontal[0][n] > 0 or horizontal[1][n] > 0
+                )
+
+            return is_jump_point
+
+        def open_step(c, n):
+            return cells[n]
+
+        # Horizontal tables first: without diagonals the vertical ones use them.
+        for d in (RIGHT, LEFT, DOWN, UP):
+            sweep(d, straight_rule(d), open_step)
+
+        if diagonal:
+            for d in range(4, 8):
+                dr, dc = DIRECTIONS[d]
+                side_h = self.tables[RIGHT if dc > 0 else LEFT]
+                side_v = self.tables[DOWN if dr > 0 else UP]
+
+                def is_jump_point(n, side_h=side_h, side_v=side_v):
+                    return side_h[n] > 0 or side_v[n] > 0
+
+                def blocked(c, n, dr=dr, dc=dc):
+                    return cells[n] or cells[c + dr * stride] or cells[c + dc]
+
+                sweep(d, is_jump_point, blocked)
+
+    def __call__(self, cell, d):
+        return self.tables[d][cell]
+
+    @property
+    def nbytes(self):
+        return sum(table.itemsize * len(table) for table in self.tables)
+
+
+def jump_search(search, jumps, diagonal):
+    """
+    A* over jump points. `jumps(cell, direction)` returns the signed jump distance
+    described at the top of this module.
+
+    Returns:
+        list: The full path from start to end, every cell included, or None.
+    """
+    if search.costs is not None:
+        raise ValueError("Jump Point Search needs a uniform-cost grid")
+
+    stride = search.grid.stride
+    start = search.start_id
+    goal = search.end_id
+    goal_row, goal_col = divmod(goal, stride)
+    parent = search.parent
+    closed = search.visited
+    visit = search.visit
+    stats = search.stats
+    directions = _search_directions(diagonal)
+    offsets = [dr * stride + dc for dr, dc in DIRECTIONS]
+
+    def heuristic(cell):
+        dr, dc = divmod(cell, stride)
+        dr = abs(dr - goal_row)
+        dc = abs(dc - goal_col)
+        if diagonal:
+            return max(dr, dc) + (SQRT2 - 1) * min(dr, dc)
+        return dr + dc
+
+    if search.sparse:
+        g_cost = SparseCells(math.inf)
+    else:
+        g_cost = array("d", [math.inf]) * search.size
+    arrival = {start: None}
+    g_cost[start] = 0
+    open_set = [(heuristic(start), start)]
+    if stats:
+        stats.push(1)
+
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        if stats:
+            stats.pops += 1
+        if closed[current]:
+            if stats:
+                stats.stale_pops += 1
+            continue
+        if current == goal:
+            return _expand_path(search, current)
+        closed[current] = 1
+        if visit:
+            visit(current)
+        if stats:
+            stats.expansions += 1
+
+        row, col = divmod(current, stride)
+        to_row = goal_row - row
+        to_col = goal_col - col
+        for d in directions[arrival[current]]:
+            k = jumps(current, d)
+            if k == 0:
+                continue
+            dr, dc = DIRECTIONS[d]
+            reach = abs(k)
+            steps = 0
+
+            if d >= 4:
+                # Stop level with the goal when it lies ahead within reach; a
+                # straight jump from there can finish the path.
+                if _sign(to_row) == dr and _sign(to_col) == dc:
+                    m = min(abs(to_row), abs(to_col))
+                    if m <= reach:
+                        steps = m
+            elif dr == 0:
+                if to_row == 0 and _sign(to_col) == dc and abs(to_col) <= reach:
+                    steps = abs(to_col)
+            else:
+                if _sign(to_row) == dr and abs(to_row) <= reach:
+                    if to_col == 0 or not diagonal:
+                        steps = abs(to_row)
+            if not steps:
+                if k < 0:
+                    continue
+                steps = k
+
+            successor = current + steps * offsets[d]
+            g = g_cost[current] + (steps * SQRT2 if d >= 4 else steps)
+            if g < g_cost[successor]:
+                g_cost[successor] = g
+                parent[successor] = current
+                arrival[successor] = d
+                heapq.heappush(open_set, (g + heuristic(successor), successor))
+                if stats:
+                    stats.push(len(open_set))
+
+    return None
+
+
+def _expand_path(search, end):
+    """
+    Turns the chain of jump points ending at `end` into the full cell path.
+    """
+    stride = search.grid.stride
+    parent = search.parent
+    points = []
+    current = end
+    while current != -1:
+        points.append(current)
+        current = parent[current]
+    points.reverse()
+
+    path = [points[0]]
+    for a, b in zip(points, points[1:]):
+        ar, ac = divmod(a, stride)
+        br, bc = divmod(b, stride)
+        step = _sign(br - ar) * stride + _sign(bc - ac)
+        for _ in range(max(abs(br - ar), abs(bc - ac))):
+            path.append(path[-1] + step)
+    return search.cells(path)
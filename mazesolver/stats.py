@@ -0,0 +1,111 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/stats.py
+
+import time
+from contextlib import contextmanager
+
+
+class SearchStats:
+    """
+    Counters an algorithm reports into while it solves. Pass one to `solve()`
+    (or `Search`) and read it afterwards; without one the algorithms skip the
+    counting behind a single `if stats:` check.
+
+    `expansions` counts cells whose neighbors were generated. `pushes` and
+    `pops` count open-list insertions and removals, and `stale_pops` the
+    removals skipped because a better entry for the cell had been pushed since
+    (lazy deletion). `peak_frontier` is the largest the open list grew.
+
+    A few solvers count differently. HPA* adds up all its searches: the
+    abstract search over entrances (counting abstract nodes) and the
+    breadth-first searches that build clusters and refine the route. Random
+    Walk's frontier is the walker's single cell. Floyd-Warshall has no open
+    list; the solve that builds its table counts one push, pop and expansion
+    per reachable pair of cells, and every solve counts one expansion per path
+    step it looks up. Its `peak_frontier` and `stale_pops` stay 0.
+
+    `seconds` and `peak_bytes` are filled in by `measure()`, which `solve()`
+    wraps around the search; `peak_bytes` is the most memory allocated at once
+    and is only tracked with `memory=True`, since tracemalloc slows the search
+    down several times.
+
+    Args:
+        memory (bool): Track peak memory with tracemalloc.
+    """
+
+    FIELDS = (
+        "expansions", "pushes", "pops", "stale_pops", "peak_frontier", "seconds", "peak_bytes",
+    )
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.reset()
+
+    def reset(self):
+        self.expansions = 0
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.peak_frontier = 0
+        self.seconds = 0.0
+        self.peak_bytes = 0
+
+    def push(self, frontier):
+        """
+        Counts one push onto an open list that now holds `frontier` entries.
+        """
+        self.pushes += 1
+        if frontier > self.peak_frontier:
+            self.peak_frontier = frontier
+
+    @contextmanager
+    def measure(self):
+        """
+        Adds the wall time of the `with` block to `seconds` and, with `memory`,
+        raises `peak_bytes` to the most it allocated at once.
+        """
+        if self.memory:
+            import tracemalloc
+
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        began = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.seconds += time.perf_counter() - began
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                self.peak_bytes = max(self.peak_bytes, peak)
+                if started:
+                    tracemalloc.stop()
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def summary(self):
+        """
+        Returns a one-line description, e.g. for a status bar.
+        """
+        text = (
+            f"{self.expansions} expanded, {self.pushes} pushed, "
+            f"peak open {self.peak_frontier}, {self.seconds * 1000:.1f} ms"
+        )
+        if self.memory:
+            text += f", {self.peak_bytes / 1024:.0f} KiB"
+        return text
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items())
+        return f"SearchStats({fields})"
@@ -0,0 +1,266 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/tiled.py
+
+import struct
+from collections import OrderedDict
+
+from .grid import Grid, WALL
+
+# Tile files: a 16-byte header (magic, version, tile size, height, width), then
+# the tiles in row-major order, each `tile_size * tile_size` cell bytes. Tiles
+# on the bottom and right edges are padded with walls to the full size.
+HEADER = struct.Struct("<4sHHII")
+MAGIC = b"MZTL"
+VERSION = 1
+
+
+class TileCells:
+    """
+    A read/write view of a TiledGrid indexed like `Grid.cells`, so code that
+    looks cells up by id works on either grid.
+    """
+
+    __slots__ = ("grid", "size")
+
+    def __init__(self, grid, size):
+        self.grid = grid
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return bytes(self[i] for i in range(*index.indices(self.size)))
+        tile, offset = self.grid._locate(index)
+        return WALL if tile is None else tile[offset]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            for i, v in zip(range(*index.indices(self.size)), value):
+                self[i] = v
+            return
+        tile, offset = self.grid._locate(index, write=True)
+        if tile is None:
+            raise IndexError(f"Cell id {index} is on the grid border")
+        tile[offset] = value
+
+
+class TiledGrid(Grid):
+    """
+    A Grid kept on disk in square tiles, for mazes that do not fit in memory.
+
+    Tiles are read on demand into an LRU cache of `cache_tiles` tiles; edited
+    tiles are written back when they are evicted or on `flush()`. Cell ids and
+    the Grid interface are the same as for Grid, so the solvers run on it
+    unchanged, and `sparse` is always True so that a search keeps its per-cell
+    state only for the cells it reaches.
+
+    `hits`, `misses` and `evictions` count tile cache lookups, for tuning the
+    tile and cache sizes; `reset_stats()` zeroes them.
+
+    Open an existing tile file with `TiledGrid.open`, or write a new one with
+    `TiledGrid.create` or `TiledGrid.from_grid`. Use the grid as a context
+    manager, or call `close()`, to write back edits and close the file.
+    """
+
+    sparse = True
+
+    def __init__(self, file, height, width, tile_size, cache_tiles=64, writable=False):
+        self.height = height
+        self.width = width
+        self.stride = width + 2
+        self.tile_size = tile_size
+        self.tiles_across = -(-width // tile_size)
+        self.tiles_down = -(-height // tile_size)
+        self.cache_tiles = max(cache_tiles, 1)
+        self.writable = writable
+        self.cells = TileCells(self, (height + 2) * self.stride)
+
+        self._file = file
+        self._tiles = OrderedDict()
+        self._dirty = set()
+        self.hits = self.misses = self.evictions = 0
+
+        self.offsets = (1, -1, self.stride, -self.stride)
+        self._moves = ((1, 0, 1), (-1, 0, -1), (self.stride, 1, 0), (-self.stride, -1, 0))
+        self._adjacency = None
+        self._cache = {}
+
+    @classmethod
+    def open(cls, path, cache_tiles=64, mode="r"):
+        """
+        Opens a tile file.
+
+        Args:
+            path (str): The tile file.
+            cache_tiles (int): How many tiles to keep in memory.
+            mode (str): "r" for read-only, "r+" to allow `set_wall`.
+        """
+        if mode not in ("r", "r+"):
+            raise ValueError(f"Unknown mode {mode!r}; use 'r' or 'r+'")
+        file = open(path, "r+b" if mode == "r+" else "rb")
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            file.close()
+            raise ValueError(f"{path} is not a tile file")
+        magic, version, tile_size, height, width = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            file.close()
+            raise ValueError(f"{path} is not a tile file")
+        return cls(file, height, width, tile_size, cache_tiles, writable=mode == "r+")
+
+    @classmethod
+    def create(cls, path, height, width, tile_size=256, cache_tiles=64):
+        """
+        Writes an all-open tile file of the given size and opens it for editing.
+        """
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, tile_size, height, width))
+            for tx in range(-(-height // tile_size)):
+                for ty in range(-(-width // tile_size)):
+                    f.write(_blank_tile(tx, ty, height, width, tile_size))
+        return cls.open(path, cache_tiles, "r+")
+
+    @classmethod
+    def from_grid(cls, path, grid, tile_size=256, cache_tiles=64):
+        """
+        Writes an in-memory grid to a tile file and opens it for editing.
+        """
+        stride = grid.stride
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, tile_size, grid.height, grid.width))
+            for tx in range(-(-grid.height // tile_size)):
+                for ty in range(-(-grid.width // tile_size)):
+                    tile = _blank_tile(tx, ty, grid.height, grid.width, tile_size)
+                    top, left = tx * tile_size, ty * tile_size
+                    across = min(tile_size, grid.width - left)
+                    for ox in range(min(tile_size, grid.height - top)):
+                        i = (top + ox + 1) * stride + left + 1
+                        tile[ox * tile_size:ox * tile_size + across] = grid.cells[i:i + across]
+                    f.write(tile)
+        return cls.open(path, cache_tiles, "r+")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _tile(self, key):
+        """
+        Returns tile `key` (row-major tile number), reading it from disk if it is
+        not cached.
+        """
+        tiles = self._tiles
+        tile = tiles.get(key)
+        if tile is not None:
+            self.hits += 1
+            tiles.move_to_end(key)
+            return tile
+
+        self.misses += 1
+        area = self.tile_size * self.tile_size
+        self._file.seek(HEADER.size + key * area)
+        tile = bytearray(self._file.read(area))
+        tiles[key] = tile
+        if len(tiles) > self.cache_tiles:
+            old_key, old_tile = tiles.popitem(last=False)
+            self.evictions += 1
+            if old_key in self._dirty:
+                self._write_tile(old_key, old_tile)
+        return tile
+
+    def _write_tile(self, key, tile):
+        self._file.seek(HEADER.size + key * self.tile_size * self.tile_size)
+        self._file.write(tile)
+        self._dirty.discard(key)
+
+    def _locate(self, index, write=False):
+        """
+        Returns `(tile, offset)` for a cell id, or `(None, None)` on the border.
+        """
+        x, y = divmod(index, self.stride)
+        x -= 1
+        y -= 1
+        if not (0 <= x < self.height and 0 <= y < self.width):
+            return None, None
+        tx, ox = divmod(x, self.tile_size)
+        ty, oy = divmod(y, self.tile_size)
+        key = tx * self.tiles_across + ty
+        if write:
+            if not self.writable:
+                raise PermissionError("The tile file was opened read-only")
+            self._dirty.add(key)
+        return self._tile(key), ox * self.tile_size + oy
+
+    def neighbors(self, index):
+        stride = self.stride
+        size = self.tile_size
+        x, y = divmod(index, stride)
+        tx, ox = divmod(x - 1, size)
+        ty, oy = divmod(y - 1, size)
+        if 0 < ox < size - 1 and 0 < oy < size - 1:
+            # All four neighbors are in the same tile.
+            tile = self._tile(tx * self.tiles_across + ty)
+            i = ox * size + oy
+            found = []
+            if not tile[i + 1]:
+                found.append(index + 1)
+            if not tile[i - 1]:
+                found.append(index - 1)
+            if not tile[i + size]:
+                found.append(index + stride)
+            if not tile[i - size]:
+                found.append(index - stride)
+            return found
+        cells = self.cells
+        return [n for n in (index + 1, index - 1, index + stride, index - stride) if not cells[n]]
+
+    @property
+    def nbytes(self):
+        """
+        The memory held by cached tiles.
+        """
+        return len(self._tiles) * self.tile_size * self.tile_size
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def flush(self):
+        """
+        Writes edited tiles back to the file.
+        """
+        for key in sorted(self._dirty):
+            self._write_tile(key, self._tiles[key])
+        self._file.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self.writable:
+            self.flush()
+        self._file.close()
+
+
+def _blank_tile(tx, ty, height, width, tile_size):
+    """
+    Returns an open tile whose cells past the maze's bottom and right edges are
+    walls.
+    """
+    tile = bytearray(tile_size * tile_size)
+    rows = min(tile_size, height - tx * tile_size)
+    across = min(tile_size, width - ty * tile_size)
+    if across < tile_size:
+        for ox in range(rows):
+            tile[ox * tile_size + across:(ox + 1) * tile_size] = b"\x01" * (tile_size - across)
+    tile[rows * tile_size:] = b"\x01" * ((tile_size - rows) * tile_size)
+    return tile
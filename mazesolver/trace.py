@@ -0,0 +1,188 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# mazesolver/trace.py
+#
+# Search traces: the cells a solve reported, in order, followed by its path, in
+# a compact binary file that can be replayed or scrubbed without solving again.
+#
+# A trace file is a 24-byte header (magic, version, maze height and width, event
+# count) followed by one varint per event. Each varint holds the zigzag-encoded
+# difference between the event's cell id and the previous event's, shifted left
+# two bits, with the event kind (an index into KINDS) in the low bits. Searches
+# mostly move between nearby cells, so most events take one or two bytes.
+#
+# A trace holds the events the solver reported to its observer, "pushed" or
+# "expanded", then a "path" event for each cell of the path it found. Which
+# events a solve produces is up to the algorithm:
+#
+#   - BFS, DFS, Greedy Best-First, A*, Theta*, Dijkstra and Bellman-Ford report
+#     "pushed" when a cell is first reached or its cost improves, as it joins
+#     the open list or queue, so the frontier shows ahead of the search.
+#   - Bidirectional, Fringe Search, SMA*, Jump Point Search, JPS+, D* and HPA*
+#     report "expanded" when a cell is expanded. JPS and JPS+ report only jump
+#     points and HPA* only the entrances of its abstract search.
+#   - IDA* reports "expanded" each time a depth-first probe steps onto a cell,
+#     so cells repeat once per deepening pass.
+#   - Random Walk reports "expanded" for each cell it steps onto.
+#   - Floyd-Warshall reports nothing; it looks the path up in a table.
+
+import struct
+
+from .engine import solve
+
+HEADER = struct.Struct("<4sHxxIIQ")
+MAGIC = b"MZTR"
+VERSION = 3
+
+# Event kinds, in the order of their codes.
+KINDS = ("expanded", "pushed", "path")
+
+FLUSH_BYTES = 1 << 20
+READ_BYTES = 1 << 16
+# Readers remember where every CHECKPOINT-th event starts, so seeking into a
+# trace they have read once does not decode it from the beginning again.
+CHECKPOINT = 4096
+
+
+class TraceWriter:
+    """
+    Writes a trace file. Call it as an observer, `writer(cell, event)`, or use
+    `write(event, index)` with cell ids; `close()` (or leaving a `with` block)
+    flushes the events and records their count in the header.
+
+    Args:
+        path (str): The file to write, conventionally with a `.trace` extension.
+        grid (Grid): The maze being solved.
+    """
+
+    def __init__(self, path, grid):
+        self.grid = grid
+        self.count = 0
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, grid.height, grid.width, 0))
+        self._buffer = bytearray()
+        self._last = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __call__(self, cell, event):
+        self.write(event, self.grid.index(cell))
+
+    def write(self, event, index):
+        delta = index - self._last
+        self._last = index
+        value = ((delta << 1) if delta >= 0 else (-delta << 1) - 1) << 2 | KINDS.index(event)
+        buffer = self._buffer
+        while value > 0x7F:
+            buffer.append(value & 0x7F | 0x80)
+            value >>= 7
+        buffer.append(value)
+        self.count += 1
+        if len(buffer) >= FLUSH_BYTES:
+            self._file.write(buffer)
+            buffer.clear()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.write(self._buffer)
+        self._buffer.clear()
+        self._file.seek(0)
+        grid = self.grid
+        self._file.write(HEADER.pack(MAGIC, VERSION, grid.height, grid.width, self.count))
+        self._file.close()
+
+
+class TraceReader:
+    """
+    Reads a trace file lazily: `events()` decodes it in small blocks as it is
+    iterated, so traces larger than memory can be replayed.
+
+    Args:
+        path (str): The trace file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is not a trace file")
+        magic, version, self.height, self.width, self.count = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a trace file")
+        self.stride = self.width + 2
+        # (byte offset, previous cell id) of every CHECKPOINT-th event seen so far.
+        self._checkpoints = [(HEADER.size, 0)]
+
+    def __len__(self):
+        return self.count
+
+    def events(self, start=0):
+        """
+        Yields `(event, cell)` pairs from event number `start` on.
+        """
+        checkpoints = self._checkpoints
+        block = min(start // CHECKPOINT, len(checkpoints) - 1)
+        offset, last = checkpoints[block]
+        number = block * CHECKPOINT
+        stride = self.stride
+
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            value = shift = 0
+            while number < self.count:
+                data = f.read(READ_BYTES)
+                if not data:
+                    raise ValueError(f"{self.path} is truncated")
+                for position, byte in enumerate(data):
+                    value |= (byte & 0x7F) << shift
+                    if byte & 0x80:
+                        shift += 7
+                        continue
+                    kind = value & 3
+                    zigzag = value >> 2
+                    last += -(zigzag + 1 >> 1) if zigzag & 1 else zigzag >> 1
+                    value = shift = 0
+                    number += 1
+                    if number % CHECKPOINT == 0 and number // CHECKPOINT == len(checkpoints):
+                        checkpoints.append((offset + position + 1, last))
+                    if number > start:
+                        x, y = divmod(last, stride)
+                        yield KINDS[kind], (x - 1, y - 1)
+                    if number == self.count:
+                        return
+                offset += len(data)
+
+
+def record_trace(path, grid, start, end, algorithm="BFS", **options):
+    """
+    Solves a maze and records the solve into a trace file.
+
+    Args:
+        path (str): The trace file to write.
+        grid (Grid): The maze.
+        start (tuple): The (x, y) coordinate of the start cell.
+        end (tuple): The (x, y) coordinate of the end cell.
+        algorithm (str): The algorithm name.
+        **options: Passed on to `solve()`.
+
+    Returns:
+        list: The path found, or None.
+    """
+    with TraceWriter(path, grid) as writer:
+        found = solve(grid, start, end, algorithm, writer, **options)
+        for cell in found or ():
+            writer.write("path", grid.index(cell))
+    return found
@@ -8,21 +8,18 @@
 #                                   #
 #####################################
 # mazesolver/visualization.py
-
-import time
+#
+# Each style yields the (cell, color) steps that draw a path. The GUI queues
+# them and paints them at the speed its slider sets.
 
 def color_gradient(gui, path):
     gradient_colors = ["#ff0000", "#ff4000", "#ff8000", "#ffbf00", "#ffff00", "#bfff00", "#80ff00", "#40ff00", "#00ff00"]
     for i, (x, y) in enumerate(path):
         color = gradient_colors[i % len(gradient_colors)]
-        gui.color_cell((x, y), color)
-        gui.root.update()
-        time.sleep(0.1)
-    gui.color_cell(gui.end, "path_found")
+        yield (x, y), color
+    yield gui.end, "path_found"
 
 def animate_path(gui, path):
     for (x, y) in path:
-        gui.color_cell((x, y), "path_traversed")
-        gui.root.update()
-        time.sleep(0.05)
-    gui.color_cell(gui.end, "path_found")
+        yield (x, y), "path_traversed"
+    yield gui.end, "path_found"
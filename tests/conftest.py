@@ -0,0 +1,94 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/conftest.py
+#
+# Run the suite from the repository root: python -m pytest
+
+import random
+
+import pytest
+
+
+def is_path(grid, path, start, end, diagonal=False):
+    """
+    Returns True if `path` runs from `start` to `end` over open cells, one
+    step at a time.
+    """
+    if not path or path[0] != tuple(start) or path[-1] != tuple(end):
+        return False
+    for (ax, ay), (bx, by) in zip(path, path[1:]):
+        dx, dy = abs(ax - bx), abs(ay - by)
+        if dx + dy != 1 and not (diagonal and dx == dy == 1):
+            return False
+    return not any(grid.is_wall(cell) for cell in path)
+
+
+def line_cells(a, b):
+    """
+    Returns the cells on the line from `a` to `b` that Theta*'s line of sight
+    walks: one row or column step at a time, so no corner is cut.
+    """
+    (x, y), (x1, y1) = a, b
+    dx, dy = abs(x1 - x), abs(y1 - y)
+    x_inc = 1 if x1 > x else -1
+    y_inc = 1 if y1 > y else -1
+    error = dx - dy
+    cells = []
+    for _ in range(1 + dx + dy):
+        cells.append((x, y))
+        if error > 0:
+            x += x_inc
+            error -= 2 * dy
+        else:
+            y += y_inc
+            error += 2 * dx
+    return cells
+
+
+def is_any_angle_path(grid, path, start, end):
+    """
+    Returns True if `path` runs from `start` to `end` through waypoints joined
+    by straight lines of open cells, as Theta* returns them.
+    """
+    if not path or path[0] != tuple(start) or path[-1] != tuple(end):
+        return False
+    cells = [path[0]] + [cell for a, b in zip(path, path[1:]) for cell in line_cells(a, b)]
+    return not any(grid.is_wall(cell) for cell in cells)
+
+
+def path_cost(grid, path):
+    """
+    Returns the cost of walking `path`: the cost of every cell stepped onto.
+    """
+    costs = getattr(grid, "costs", None)
+    if costs is None:
+        return len(path) - 1
+    return sum(costs[grid.index(cell)] for cell in path[1:])
+
+
+def open_cells(grid):
+    return [
+        (x, y) for x in range(grid.height) for y in range(grid.width) if not grid.is_wall((x, y))
+    ]
+
+
+def endpoint_pairs(grid, count, seed):
+    """
+    Returns `count` seeded (start, end) pairs of open cells.
+    """
+    rng = random.Random(seed)
+    cells = open_cells(grid)
+    return [(rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def seeded_random():
+    # Random Walk draws from the module-level generator.
+    random.seed(0)
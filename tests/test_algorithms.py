@@ -0,0 +1,167 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_algorithms.py
+#
+# Cross-checks every algorithm against BFS and Dijkstra on seeded mazes.
+
+import pytest
+
+from conftest import endpoint_pairs, is_any_angle_path, is_path, path_cost
+
+from mazesolver import ALGORITHMS, BitGrid, SearchStats, TiledGrid, solve
+from mazesolver import bitgrid
+from mazesolver.generate import perfect_maze, random_grid, random_terrain, room_grid
+
+# Algorithms that find a path whenever there is one, but not always a shortest one.
+ANY_PATH = {"DFS", "Greedy Best-First", "Random Walk", "HPA*", "SMA*", "Theta*"}
+# Algorithms that refuse weighted grids.
+UNIFORM_ONLY = {"Jump Point Search", "JPS+", "HPA*", "Floyd-Warshall"}
+# Algorithms that count steps and ignore cell costs.
+COST_BLIND = {"BFS", "DFS", "Greedy Best-First", "Bidirectional", "Random Walk"}
+# Algorithms whose paths jump between waypoints in line of sight of each other.
+ANY_ANGLE = {"Theta*"}
+
+def is_solution(grid, path, start, end, algorithm):
+    if algorithm in ANY_ANGLE:
+        return is_any_angle_path(grid, path, start, end)
+    return is_path(grid, path, start, end)
+
+
+MAZES = {
+    "perfect": lambda seed: perfect_maze(15, 15, seed=seed),
+    "rooms": lambda seed: room_grid(20, 20, room_size=6, seed=seed),
+    "open": lambda seed: random_grid(12, 12, density=0.25, seed=seed),
+}
+
+
+@pytest.mark.parametrize("algorithm", list(ALGORITHMS))
+@pytest.mark.parametrize("topology", list(MAZES))
+@pytest.mark.parametrize("seed", [1, 2])
+def test_matches_bfs(algorithm, topology, seed):
+    grid = MAZES[topology](seed)
+    for start, end in endpoint_pairs(grid, 6, seed):
+        expected = solve(grid, start, end, "BFS", reachability=False)
+        # Random Walk wanders forever when the end cannot be reached.
+        if expected is None and algorithm == "Random Walk":
+            continue
+        path = solve(grid, start, end, algorithm, reachability=False)
+        if expected is None:
+            assert path is None
+            continue
+        assert is_solution(grid, path, start, end, algorithm)
+        if algorithm not in ANY_PATH:
+            assert len(path) == len(expected)
+
+
+@pytest.mark.parametrize("algorithm", sorted(set(ALGORITHMS) - UNIFORM_ONLY - COST_BLIND))
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_weighted_matches_dijkstra(algorithm, seed):
+    grid = random_terrain(10, 10, seed=seed)
+    for start, end in endpoint_pairs(grid, 6, seed):
+        expected = solve(grid, start, end, "Dijkstra", reachability=False)
+        path = solve(grid, start, end, algorithm, reachability=False)
+        if expected is None:
+            assert path is None
+            continue
+        assert is_solution(grid, path, start, end, algorithm)
+        if algorithm not in ANY_PATH:
+            assert path_cost(grid, path) == path_cost(grid, expected)
+
+
+@pytest.mark.parametrize("algorithm", sorted(UNIFORM_ONLY))
+def test_uniform_only_refuses_weighted(algorithm):
+    grid = random_terrain(6, 6, density=0, seed=1)
+    with pytest.raises(ValueError):
+        solve(grid, (0, 0), (5, 5), algorithm)
+
+
+@pytest.mark.parametrize("algorithm", ["Jump Point Search", "JPS+"])
+def test_diagonal_jump_point_search(algorithm):
+    grid = random_grid(16, 16, density=0.2, seed=4)
+    for start, end in endpoint_pairs(grid, 8, 4):
+        expected = solve(grid, start, end, "BFS", reachability=False)
+        path = solve(grid, start, end, algorithm, diagonal=True, reachability=False)
+        assert (path is None) == (expected is None)
+        if path:
+            assert is_path(grid, path, start, end, diagonal=True)
+            assert len(path) <= len(expected)
+
+
+@pytest.mark.parametrize("algorithm", sorted(set(ALGORITHMS) - {"Floyd-Warshall"}))
+def test_sparse_grids(algorithm, monkeypatch, tmp_path):
+    monkeypatch.setattr(bitgrid, "SPARSE_THRESHOLD", 0)
+    grid = random_grid(12, 12, density=0.25, seed=5)
+    packed = BitGrid.from_rows(grid.to_rows())
+    assert packed.sparse
+    with TiledGrid.from_grid(str(tmp_path / "maze.tiles"), grid, tile_size=4) as tiled:
+        for start, end in endpoint_pairs(grid, 4, 5):
+            expected = solve(grid, start, end, algorithm, reachability=False)
+            if expected is None and algorithm == "Random Walk":
+                continue
+            for other in (packed, tiled):
+                path = solve(other, start, end, algorithm, reachability=False)
+                assert (path is None) == (expected is None)
+                if path and algorithm not in ANY_PATH:
+                    assert len(path) == len(expected)
+
+
+def test_floyd_warshall_refuses_sparse_grids(tmp_path):
+    grid = random_grid(8, 8, density=0, seed=1)
+    with TiledGrid.from_grid(str(tmp_path / "maze.tiles"), grid, tile_size=4) as tiled:
+        with pytest.raises(ValueError):
+            solve(tiled, (0, 0), (7, 7), "Floyd-Warshall")
+
+
+@pytest.mark.parametrize("algorithm", list(ALGORITHMS))
+def test_stats(algorithm):
+    grid = random_grid(12, 12, density=0.2, seed=6)
+    start, end = (0, 0), (11, 11)
+    grid.set_wall(start, False)
+    grid.set_wall(end, False)
+    stats = SearchStats()
+    path = solve(grid, start, end, algorithm, stats=stats, reachability=False)
+    assert path
+    assert stats.expansions > 0
+    assert stats.pushes > 0
+    assert stats.seconds > 0
+
+
+@pytest.mark.parametrize("algorithm", list(ALGORITHMS))
+def test_start_is_end(algorithm):
+    grid = random_grid(6, 6, density=0, seed=1)
+    assert solve(grid, (2, 3), (2, 3), algorithm) == [(2, 3)]
+    # A start cell walled in on every side.
+    rows = [
+        [0, 1, 0],
+        [1, 1, 0],
+    ]
+    assert solve(rows, (0, 0), (0, 0), algorithm) == [(0, 0)]
+
+
+def test_reachability():
+    grid = random_grid(12, 12, density=0.4, seed=7)
+    for start, end in endpoint_pairs(grid, 20, 7):
+        expected = solve(grid, start, end, "BFS", reachability=False)
+        assert (solve(grid, start, end, "A*") is None) == (expected is None)
+
+
+@pytest.mark.parametrize("start, end", [
+    ((0, 1), (2, 2)),
+    ((0, 0), (3, 0)),
+    ((-1, 0), (2, 2)),
+])
+def test_rejects_bad_endpoints(start, end):
+    rows = [
+        [0, 1, 0],
+        [0, 0, 0],
+        [1, 0, 0],
+    ]
+    with pytest.raises(ValueError):
+        solve(rows, start, end)
@@ -0,0 +1,76 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_batch.py
+#
+# solve_batch in worker processes against solve() in this one.
+
+import pytest
+
+from conftest import endpoint_pairs
+
+from mazesolver import BitGrid, TiledGrid, solve, solve_batch
+from mazesolver import bitgrid
+from mazesolver.generate import random_grid, random_terrain
+
+
+def solve_all(jobs, workers):
+    results = sorted(solve_batch(jobs, workers=workers), key=lambda result: result.index)
+    assert [result.index for result in results] == list(range(len(jobs)))
+    return results
+
+
+def test_matches_serial_solves(monkeypatch):
+    monkeypatch.setattr(bitgrid, "SPARSE_THRESHOLD", 0)
+    grid = random_grid(14, 14, density=0.25, seed=1)
+    terrain = random_terrain(10, 10, seed=2)
+    # Each maze with the grid its endpoints are drawn from.
+    mazes = [
+        (grid, grid),
+        (grid.to_rows(), grid),
+        (BitGrid.from_rows(grid.to_rows()), grid),
+        (terrain, terrain),
+    ]
+    jobs = [
+        (maze, start, end, algorithm)
+        for maze, source in mazes
+        for start, end in endpoint_pairs(source, 4, 3)
+        for algorithm in ("BFS", "A*", "Dijkstra")
+    ]
+    for result in solve_all(jobs, workers=2):
+        maze, start, end, algorithm = jobs[result.index]
+        assert (result.start, result.end, result.algorithm) == (start, end, algorithm)
+        assert result.error is None
+        assert result.path == solve(maze, start, end, algorithm)
+
+
+def test_errors_come_back_per_job():
+    grid = random_grid(8, 8, density=0, seed=1)
+    jobs = [
+        (grid, (0, 0), (7, 7), "BFS"),
+        (grid, (0, 0), (9, 9), "BFS"),
+        (grid, (0, 0), (7, 7), "No Such Search"),
+        (grid, (0, 0), (7, 0), "A*"),
+    ]
+    for workers in (1, 2):
+        results = solve_all(jobs, workers)
+        assert [result.error is None for result in results] == [True, False, False, True]
+        assert all(isinstance(results[i].error, ValueError) for i in (1, 2))
+        assert len(results[0].path) == 15
+        assert results[1].path is None
+
+
+def test_refuses_to_share_tiled_grids(tmp_path):
+    grid = random_grid(8, 8, density=0, seed=1)
+    with TiledGrid.from_grid(str(tmp_path / "maze.tiles"), grid, tile_size=4) as tiled:
+        jobs = [(tiled, (0, 0), (7, 7), "BFS")]
+        with pytest.raises(ValueError):
+            list(solve_batch(jobs, workers=2))
+        assert len(solve_all(jobs, workers=1)[0].path) == 15
+
@@ -0,0 +1,86 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_cache.py
+#
+# PathCache hits, misses, eviction and invalidation on edits.
+
+import pytest
+
+from conftest import endpoint_pairs
+
+from mazesolver import Grid, PathCache, solve
+from mazesolver.generate import random_grid, random_terrain
+
+
+@pytest.mark.parametrize("algorithm", ["BFS", "A*", "Theta*", "Jump Point Search"])
+def test_returns_the_solved_path(algorithm):
+    grid = random_grid(16, 16, density=0.25, seed=1)
+    cache = PathCache()
+    for start, end in endpoint_pairs(grid, 10, 1):
+        expected = solve(grid, start, end, algorithm)
+        assert cache.solve(grid, start, end, algorithm) == expected
+        assert cache.solve(grid, start, end, algorithm) == expected
+    assert cache.hits == cache.misses == 10
+
+
+def test_keys_on_contents_and_options():
+    rows = random_grid(8, 8, density=0, seed=1).to_rows()
+    first, second = Grid.from_rows(rows), Grid.from_rows(rows)
+    cache = PathCache()
+    cache.solve(first, (0, 0), (7, 7), "Jump Point Search")
+    cache.solve(second, (0, 0), (7, 7), "Jump Point Search")
+    assert cache.hits == 1
+    diagonal = cache.solve(second, (0, 0), (7, 7), "Jump Point Search", diagonal=True)
+    assert cache.misses == 2
+    assert len(diagonal) == 8
+
+
+def test_edits_miss_and_evict():
+    grid = random_grid(8, 8, density=0, seed=1)
+    cache = PathCache()
+    assert len(cache.solve(grid, (0, 0), (0, 7))) == 8
+    grid.set_wall((0, 3))
+    assert len(cache.solve(grid, (0, 0), (0, 7))) == 10
+    assert cache.hits == 0
+    # The entry for the old contents went with the edit.
+    assert len(cache) == 1
+
+    terrain = random_terrain(6, 6, density=0, seed=1)
+    before = cache.solve(terrain, (0, 0), (5, 5), "Dijkstra")
+    for cell in before[2:-2]:
+        terrain.set_cost(cell, 200)
+    after = cache.solve(terrain, (0, 0), (5, 5), "Dijkstra")
+    assert after == solve(terrain, (0, 0), (5, 5), "Dijkstra")
+    assert after != before
+
+
+def test_caches_unreachable_queries():
+    grid = Grid.from_rows([[0, 1, 0]])
+    cache = PathCache()
+    assert cache.solve(grid, (0, 0), (0, 2)) is None
+    assert cache.solve(grid, (0, 0), (0, 2)) is None
+    assert cache.hits == 1
+
+
+def test_limits():
+    grid = random_grid(12, 12, density=0.2, seed=2)
+    pairs = [pair for pair in endpoint_pairs(grid, 40, 2) if solve(grid, *pair)]
+    cache = PathCache(max_entries=5)
+    for start, end in pairs:
+        cache.solve(grid, start, end)
+    assert len(cache) == 5
+    assert cache.evictions == len(set(pairs)) - 5
+
+    cache = PathCache(max_bytes=200)
+    for start, end in pairs:
+        cache.solve(grid, start, end)
+    assert 0 < cache.nbytes <= 200
+    cache.clear()
+    assert len(cache) == cache.nbytes == 0
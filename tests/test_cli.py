@@ -0,0 +1,89 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_cli.py
+#
+# The python -m mazesolver command line.
+
+import json
+
+import pytest
+
+from mazesolver.__main__ import main
+from mazesolver.files import load
+
+MAZE = "S.#\n#..\n#.E\n"
+
+
+@pytest.fixture
+def maze_file(tmp_path):
+    path = tmp_path / "maze.txt"
+    path.write_text(MAZE)
+    return str(path)
+
+
+def test_solve(maze_file, capsys):
+    main(["solve", maze_file, "-a", "BFS", "A*"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split()[:2] == ["algorithm", "length"]
+    assert [line.split()[:2] for line in lines[1:]] == [["BFS", "5"], ["A*", "5"]]
+
+
+def test_solve_with_endpoints(maze_file, capsys):
+    main(["solve", maze_file, "-a", "BFS", "--start", "1,1", "--end", "2,1"])
+    assert capsys.readouterr().out.splitlines()[1].split()[:2] == ["BFS", "2"]
+
+
+def test_solve_unreachable(tmp_path, capsys):
+    # Random Walk would wander forever; no solver may be started.
+    path = tmp_path / "walled.txt"
+    path.write_text("S.#.\n##..\n#..E\n")
+    main(["solve", str(path), "-a", "all"])
+    assert capsys.readouterr().out.startswith("No path from (0, 0) to (2, 3)")
+
+
+@pytest.mark.parametrize("start", ["0,2", "3,0", "-1,0"])
+def test_solve_rejects_bad_endpoints(maze_file, start):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["solve", maze_file, f"--start={start}"])
+    assert "cell" in str(excinfo.value.code)
+
+
+@pytest.mark.parametrize("text", ["1", "a,b", "1,2,3"])
+def test_rejects_malformed_cells(maze_file, text, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["solve", maze_file, "--start", text])
+    assert excinfo.value.code == 2
+    assert "expected a cell" in capsys.readouterr().err
+
+
+def test_unloadable_maze(tmp_path):
+    path = tmp_path / "maze.maze"
+    path.write_bytes(b"nonsense")
+    with pytest.raises(SystemExit):
+        main(["solve", str(path)])
+
+
+@pytest.mark.parametrize("extension", [".maze", ".png"])
+def test_convert(maze_file, extension, tmp_path):
+    target = str(tmp_path / f"maze{extension}")
+    main(["convert", maze_file, target])
+    grid, _, _ = load(target)
+    assert grid.to_rows() == load(maze_file)[0].to_rows()
+    with pytest.raises(SystemExit):
+        main(["convert", maze_file, target, "--end", "0,2"])
+
+
+def test_bench(tmp_path):
+    output = tmp_path / "bench.json"
+    main(["bench", "-a", "BFS", "A*", "--sizes", "8", "--repeat", "1",
+          "--format", "json", "-o", str(output)])
+    rows = json.loads(output.read_text())
+    assert [row["algorithm"] for row in rows] == ["BFS", "A*"]
+    assert rows[0]["length"] == rows[1]["length"]
@@ -0,0 +1,105 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_components.py
+#
+# ComponentIndex repairs against labels computed afresh.
+
+import random
+
+import pytest
+
+from conftest import open_cells
+
+from mazesolver import ComponentIndex, Grid
+from mazesolver.generate import random_grid
+
+
+def assert_same_regions(index, grid):
+    """
+    Asserts that `index` groups the open cells exactly as a fresh index does.
+    """
+    fresh = ComponentIndex(grid)
+    cells = [grid.index(cell) for cell in open_cells(grid)]
+    pairs = {}
+    for i in cells:
+        label = index.label(i)
+        assert label != -1
+        # Both labelings must map one-to-one onto each other.
+        assert pairs.setdefault(label, fresh.label(i)) == fresh.label(i)
+    assert len(set(pairs.values())) == len(pairs)
+    walls = set(range(len(grid.cells))) - set(cells)
+    assert all(index.label(i) == -1 for i in walls)
+
+
+@pytest.mark.parametrize("density", [0.2, 0.4, 0.6])
+@pytest.mark.parametrize("seed", range(4))
+def test_repairs_on_set_wall(density, seed):
+    rng = random.Random(seed)
+    grid = random_grid(14, 14, density=density, seed=seed)
+    index = grid.memo("components", lambda: ComponentIndex(grid))
+    for _ in range(60):
+        cell = (rng.randrange(grid.height), rng.randrange(grid.width))
+        grid.set_wall(cell, not grid.is_wall(cell))
+        assert grid.memo("components", None) is index
+        assert_same_regions(index, grid)
+
+
+def test_split_and_merge():
+    # A corridor cut in the middle, then rejoined.
+    grid = Grid.from_rows([[0] * 9])
+    index = grid.memo("components", lambda: ComponentIndex(grid))
+    assert index.connected((0, 0), (0, 8))
+    grid.set_wall((0, 4))
+    assert not index.connected((0, 0), (0, 8))
+    assert index.connected((0, 0), (0, 3))
+    assert index.connected((0, 5), (0, 8))
+    assert not index.connected((0, 4), (0, 4))
+    grid.set_wall((0, 4), False)
+    assert index.connected((0, 0), (0, 8))
+
+
+def test_closing_neighbors_together():
+    # Neither closed cell has open cells on two sides, yet together they cut
+    # the corridor in two.
+    grid = Grid.from_rows([[0], [0], [0], [0]])
+    index = ComponentIndex(grid)
+    grid.cells[grid.index((1, 0))] = grid.cells[grid.index((2, 0))] = 1
+    index.repair([(2, 0), (1, 0)])
+    assert not index.connected((0, 0), (3, 0))
+
+
+def test_closing_a_cell_of_a_loop_keeps_it_whole():
+    grid = Grid.from_rows([
+        [0, 0, 0],
+        [0, 1, 0],
+        [0, 0, 0],
+    ])
+    index = grid.memo("components", lambda: ComponentIndex(grid))
+    grid.set_wall((0, 1))
+    assert index.connected((0, 0), (0, 2))
+    grid.set_wall((2, 1))
+    assert not index.connected((0, 0), (0, 2))
+    assert_same_regions(index, grid)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_batch_repair(seed):
+    # Several cells changed at once, as by code that writes `cells` directly
+    # and then calls `invalidate(changed)`.
+    rng = random.Random(seed)
+    grid = random_grid(10, 10, density=rng.choice([0.2, 0.4]), seed=seed)
+    index = ComponentIndex(grid)
+    changed = []
+    for _ in range(rng.randint(2, 15)):
+        cell = (rng.randrange(grid.height), rng.randrange(grid.width))
+        grid.cells[grid.index(cell)] ^= 1
+        changed.append(cell)
+    index.repair(changed)
+    assert_same_regions(index, grid)
@@ -0,0 +1,42 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_distance.py
+#
+# NumPy distance fields against BFS, on every grid kind that has them.
+
+import pytest
+
+from conftest import endpoint_pairs, is_path
+
+from mazesolver import BitGrid, TiledGrid, distance_field, field_path, solve
+from mazesolver.generate import random_grid
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_matches_bfs(packed):
+    grid = random_grid(13, 29, density=0.25, seed=3)
+    maze = BitGrid.from_grid(grid) if packed else grid
+    for source, cell in endpoint_pairs(grid, 8, 3):
+        distances, directions = distance_field(maze, source)
+        expected = solve(grid, source, cell, "BFS", reachability=False)
+        path = field_path(distances, directions, cell)
+        assert (path is None) == (expected is None)
+        if path:
+            assert is_path(grid, path, source, cell)
+            assert len(path) == len(expected) == distances[cell] + 1
+
+
+def test_refuses_tiled_grids(tmp_path):
+    grid = random_grid(8, 8, density=0, seed=1)
+    with TiledGrid.from_grid(str(tmp_path / "maze.tiles"), grid, tile_size=4) as tiled:
+        with pytest.raises(ValueError):
+            distance_field(tiled, (0, 0))
@@ -0,0 +1,97 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_dstar_lite.py
+#
+# D* Lite replanning against fresh searches of the edited maze.
+
+import random
+
+import pytest
+
+from conftest import is_path, open_cells, path_cost
+
+from mazesolver import DStarLite, solve
+from mazesolver.generate import random_grid, random_terrain
+
+
+def edit_walls(grid, rng, count, keep):
+    changed = []
+    for _ in range(count):
+        cell = (rng.randrange(grid.height), rng.randrange(grid.width))
+        if cell in keep:
+            continue
+        grid.set_wall(cell, not grid.is_wall(cell))
+        changed.append(cell)
+    return changed
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_replans_after_wall_edits(seed):
+    rng = random.Random(seed)
+    grid = random_grid(16, 16, density=0.25, seed=seed)
+    start, goal = rng.sample(open_cells(grid), 2)
+    planner = DStarLite(grid, start, goal)
+    for _ in range(10):
+        path = planner.plan()
+        expected = solve(grid, start, goal, "BFS", reachability=False)
+        assert (path is None) == (expected is None)
+        if path:
+            assert is_path(grid, path, start, goal)
+            assert len(path) == len(expected)
+        planner.update(edit_walls(grid, rng, rng.randint(1, 6), {start, goal}))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_replans_after_cost_edits(seed):
+    rng = random.Random(seed)
+    grid = random_terrain(12, 12, seed=seed)
+    start, goal = rng.sample(open_cells(grid), 2)
+    planner = DStarLite(grid, start, goal)
+    for _ in range(8):
+        path = planner.plan()
+        expected = solve(grid, start, goal, "Dijkstra", reachability=False)
+        assert (path is None) == (expected is None)
+        if path:
+            assert is_path(grid, path, start, goal)
+            assert path_cost(grid, path) == path_cost(grid, expected)
+        changed = rng.sample(open_cells(grid), 5)
+        for cell in changed:
+            grid.set_cost(cell, rng.randint(1, 9))
+        planner.update(changed)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_follows_the_path(seed):
+    # An agent walks the path while walls appear ahead of it.
+    rng = random.Random(seed)
+    grid = random_grid(16, 16, density=0.2, seed=seed)
+    start, goal = rng.sample(open_cells(grid), 2)
+    planner = DStarLite(grid, start, goal)
+    path = planner.plan()
+    while path and len(path) > 1:
+        planner.move_to(path[1])
+        planner.update(edit_walls(grid, rng, 2, {path[1], goal}))
+        path = planner.plan()
+        expected = solve(grid, planner.start, goal, "BFS", reachability=False)
+        assert (path is None) == (expected is None)
+        if path:
+            assert len(path) == len(expected)
+
+
+def test_blocked_endpoints():
+    grid = random_grid(6, 6, density=0, seed=1)
+    planner = DStarLite(grid, (0, 0), (5, 5))
+    assert planner.plan()
+    grid.set_wall((5, 5))
+    planner.update([(5, 5)])
+    assert planner.plan() is None
+    grid.set_wall((5, 5), False)
+    planner.update([(5, 5)])
+    assert len(planner.plan()) == 11
@@ -0,0 +1,111 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_files.py
+#
+# Round-trips mazes through every file format.
+
+import pytest
+
+from mazesolver import BitGrid, solve
+from mazesolver.files import (
+    format_ascii, load, load_maze, load_pbm, parse_ascii, save, save_maze,
+)
+from mazesolver.generate import random_grid
+
+
+@pytest.fixture(params=[(1, 1), (7, 13), (20, 65)], ids=lambda size: f"{size[0]}x{size[1]}")
+def grid(request):
+    # Widths either side of the 8- and 64-bit boundaries of the packed formats.
+    height, width = request.param
+    return random_grid(height, width, density=0.3, seed=height * width)
+
+
+@pytest.mark.parametrize("extension", [".txt", ".maze", ".pbm", ".png"])
+def test_round_trip(grid, extension, tmp_path):
+    path = str(tmp_path / f"maze{extension}")
+    save(path, grid)
+    loaded, start, end = load(path)
+    assert (loaded.height, loaded.width) == (grid.height, grid.width)
+    assert loaded.to_rows() == grid.to_rows()
+    assert start is None and end is None
+
+
+@pytest.mark.parametrize("extension", [".txt", ".maze"])
+def test_endpoints_round_trip(extension, tmp_path):
+    grid = random_grid(9, 11, density=0.3, seed=3)
+    start, end = (0, 0), (8, 10)
+    grid.set_wall(start, False)
+    grid.set_wall(end, False)
+    path = str(tmp_path / f"maze{extension}")
+    save(path, grid, start, end)
+    loaded, loaded_start, loaded_end = load(path)
+    assert (loaded_start, loaded_end) == (start, end)
+    assert solve(loaded, start, end, "BFS") == solve(grid, start, end, "BFS")
+
+
+def test_packed_maze(grid, tmp_path):
+    path = str(tmp_path / "maze.maze")
+    save_maze(path, grid, packed=True)
+    unpacked, _, _ = load_maze(path)
+    packed, _, _ = load_maze(path, bitgrid=True)
+    assert isinstance(packed, BitGrid)
+    assert unpacked.to_rows() == grid.to_rows()
+    assert packed.to_rows() == grid.to_rows()
+
+
+def test_bitgrid_saves_packed_and_unpacked(grid, tmp_path):
+    bits = BitGrid.from_rows(grid.to_rows())
+    for packed in (False, True):
+        path = str(tmp_path / f"maze{packed}.maze")
+        save_maze(path, bits, packed=packed)
+        assert load_maze(path)[0].to_rows() == grid.to_rows()
+
+
+def test_mapped_maze_modes(tmp_path):
+    grid = random_grid(6, 6, density=0, seed=1)
+    path = str(tmp_path / "maze.maze")
+    save_maze(path, grid)
+
+    copied, _, _ = load_maze(path, mode="c")
+    copied.set_wall((2, 3))
+    assert load_maze(path)[0].to_rows() == grid.to_rows()
+
+    written, _, _ = load_maze(path, mode="r+")
+    written.set_wall((2, 3))
+    assert load_maze(path)[0].is_wall((2, 3))
+
+    with pytest.raises(ValueError):
+        load_maze(path, mode="w")
+
+
+def test_ascii():
+    text = "S.#\n#..\n#.E\n"
+    grid, start, end = parse_ascii(text)
+    assert (start, end) == ((0, 0), (2, 2))
+    assert grid.to_rows() == [[0, 0, 1], [1, 0, 0], [1, 0, 0]]
+    assert format_ascii(grid, start, end) == text
+    # Short rows are padded with walls; '1', '0' and spaces are accepted.
+    assert parse_ascii("0 1\n0\n")[0].to_rows() == [[0, 0, 1], [0, 1, 1]]
+    with pytest.raises(ValueError):
+        parse_ascii("..x\n")
+
+
+def test_plain_pbm(tmp_path):
+    path = tmp_path / "maze.pbm"
+    path.write_text("P1\n# a comment\n3 2\n0 1 0\n1 0 0\n")
+    assert load_pbm(str(path)).to_rows() == [[0, 1, 0], [1, 0, 0]]
+
+
+@pytest.mark.parametrize("extension", [".maze", ".pbm", ".png"])
+def test_rejects_other_files(extension, tmp_path):
+    path = tmp_path / f"maze{extension}"
+    path.write_bytes(b"not a maze")
+    with pytest.raises(ValueError):
+        load(str(path))
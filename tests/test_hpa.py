@@ -0,0 +1,93 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_hpa.py
+#
+# HPA*: paths over the abstract graph, and its repair after maze edits.
+
+import random
+
+import pytest
+
+from conftest import endpoint_pairs, is_path
+
+from mazesolver import Grid, solve
+from mazesolver.generate import random_grid, room_grid
+from mazesolver.hpa import AbstractGraph
+
+
+def find_path(graph, grid, start, end):
+    path = graph.find_path(grid.index(start), grid.index(end))
+    return [grid.cell(index) for index in path] if path else None
+
+
+@pytest.mark.parametrize("cluster_size", [1, 3, 4, 8])
+@pytest.mark.parametrize("seed", range(3))
+def test_finds_paths(cluster_size, seed):
+    grid = random_grid(21, 18, density=0.3, seed=seed)
+    graph = AbstractGraph(grid, cluster_size)
+    for start, end in endpoint_pairs(grid, 10, seed):
+        expected = solve(grid, start, end, "BFS", reachability=False)
+        path = find_path(graph, grid, start, end)
+        assert (path is None) == (expected is None)
+        if path:
+            assert is_path(grid, path, start, end)
+
+
+@pytest.mark.parametrize("cluster_size", [3, 4, 8])
+@pytest.mark.parametrize("seed", range(4))
+def test_repairs_on_set_wall(cluster_size, seed):
+    rng = random.Random(seed)
+    grid = random_grid(20, 20, density=0.3, seed=seed)
+    graph = grid.memo("hpa test", lambda: AbstractGraph(grid, cluster_size))
+    for _ in range(25):
+        for _ in range(rng.randint(1, 3)):
+            cell = (rng.randrange(grid.height), rng.randrange(grid.width))
+            grid.set_wall(cell, not grid.is_wall(cell))
+        assert grid.memo("hpa test", None) is graph
+        fresh = AbstractGraph(grid, cluster_size)
+        for start, end in endpoint_pairs(grid, 3, rng.random()):
+            expected = solve(grid, start, end, "BFS", reachability=False)
+            path = find_path(graph, grid, start, end)
+            assert (path is None) == (expected is None)
+            if path:
+                assert is_path(grid, path, start, end)
+                assert len(path) == len(find_path(fresh, grid, start, end))
+
+
+def test_solver_uses_the_cached_graph():
+    grid = room_grid(40, 40, room_size=8, seed=1)
+    for start, end in endpoint_pairs(grid, 5, 1):
+        expected = solve(grid, start, end, "BFS")
+        path = solve(grid, start, end, "HPA*")
+        assert (path is None) == (expected is None)
+        if path:
+            assert is_path(grid, path, start, end)
+        # Wall the end in, and check that the repaired graph sees it.
+        around = [grid.cell(i) for i in grid.neighbors(grid.index(end))]
+        if start == end or start in around:
+            continue
+        for cell in around:
+            grid.set_wall(cell)
+        assert solve(grid, start, end, "HPA*", reachability=False) is None
+        for cell in around:
+            grid.set_wall(cell, False)
+        assert (solve(grid, start, end, "HPA*") is None) == (expected is None)
+
+
+def test_refuses_weighted_grids():
+    from mazesolver import WeightedGrid
+
+    with pytest.raises(ValueError):
+        AbstractGraph(WeightedGrid(4, 4))
+
+
+def test_single_cell():
+    grid = Grid(1, 1)
+    assert find_path(AbstractGraph(grid), grid, (0, 0), (0, 0)) == [(0, 0)]
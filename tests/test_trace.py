@@ -0,0 +1,124 @@
+#!/bin/python3
+
+#####################################
+#                                   #
+#    GitHub    : @therboy          #
+#    Developer : Reza Khodarahimi  #
+#  﫥  Copyright   2024              #
+#                                   #
+#####################################
+# tests/test_trace.py
+#
+# Search traces: writing, reading back and seeking.
+
+import random
+
+import pytest
+
+from mazesolver import Grid, TraceReader, TraceWriter, record_trace, solve
+from mazesolver import trace
+from mazesolver.generate import random_grid
+
+
+def test_records_the_solve(tmp_path):
+    grid = random_grid(30, 30, density=0.2, seed=1)
+    grid.set_wall((0, 0), False)
+    grid.set_wall((29, 29), False)
+    seen = []
+    expected = solve(grid, (0, 0), (29, 29), "A*", lambda cell, event: seen.append((event, cell)))
+
+    path = str(tmp_path / "astar.trace")
+    found = record_trace(path, grid, (0, 0), (29, 29), algorithm="A*")
+    assert found == expected
+    reader = TraceReader(path)
+    assert (reader.height, reader.width) == (30, 30)
+    events = list(reader.events())
+    assert len(reader) == len(events)
+    assert events == seen + [("path", cell) for cell in found]
+
+
+@pytest.mark.parametrize("algorithm, kind", [
+    ("BFS", "pushed"),
+    ("A*", "pushed"),
+    ("Jump Point Search", "expanded"),
+    ("D*", "expanded"),
+])
+def test_event_kinds(algorithm, kind, tmp_path):
+    grid = random_grid(12, 12, density=0, seed=1)
+    path = str(tmp_path / "kinds.trace")
+    found = record_trace(path, grid, (0, 0), (11, 11), algorithm=algorithm)
+    events = list(TraceReader(path).events())
+    assert {event for event, _ in events[:-len(found)]} == {kind}
+    assert [cell for event, cell in events if event == "path"] == found
+
+
+def test_far_jumps(tmp_path):
+    # Deltas of every size and sign, including ones that need several varint bytes.
+    grid = Grid(300, 400)
+    rng = random.Random(2)
+    cells = [(rng.randrange(300), rng.randrange(400)) for _ in range(500)]
+    cells += [(0, 0), (299, 399), (0, 0)]
+    path = str(tmp_path / "jumps.trace")
+    with TraceWriter(path, grid) as writer:
+        for cell in cells:
+            writer(cell, "expanded")
+        writer(cells[-1], "path")
+    events = list(TraceReader(path).events())
+    assert events == [("expanded", cell) for cell in cells] + [("path", cells[-1])]
+
+
+@pytest.mark.parametrize("flush_bytes", [trace.FLUSH_BYTES, 16])
+def test_seeking(flush_bytes, monkeypatch, tmp_path):
+    # Small blocks and checkpoints, so that seeks land in the middle of both.
+    monkeypatch.setattr(trace, "CHECKPOINT", 7)
+    monkeypatch.setattr(trace, "READ_BYTES", 5)
+    monkeypatch.setattr(trace, "FLUSH_BYTES", flush_bytes)
+    grid = random_grid(20, 20, density=0.2, seed=3)
+    grid.set_wall((0, 0), False)
+    grid.set_wall((19, 19), False)
+    path = str(tmp_path / "bfs.trace")
+    record_trace(path, grid, (0, 0), (19, 19), algorithm="BFS")
+
+    reader = TraceReader(path)
+    events = list(reader.events())
+    assert len(reader._checkpoints) == len(events) // 7 + 1
+    starts = list(range(len(events) + 1))
+    random.Random(3).shuffle(starts)
+    for start in starts:
+        assert list(reader.events(start)) == events[start:]
+    # Partly consumed iterators leave usable checkpoints behind.
+    reader = TraceReader(path)
+    for start in (10, 0, 30, 29):
+        iterator = reader.events(start)
+        assert next(iterator) == events[start]
+        assert list(reader.events(start + 1))[:3] == events[start + 1:start + 4]
+
+
+def test_empty_trace(tmp_path):
+    path = str(tmp_path / "empty.trace")
+    with TraceWriter(path, Grid(3, 3)):
+        pass
+    reader = TraceReader(path)
+    assert len(reader) == 0
+    assert list(reader.events()) == []
+
+
+def test_rejects_bad_files(tmp_path):
+    path = tmp_path / "bad.trace"
+    path.write_bytes(b"MZTR")
+    with pytest.raises(ValueError):
+        TraceReader(str(path))
+
+    old = trace.HEADER.pack(trace.MAGIC, trace.VERSION - 1, 3, 3, 0)
+    path.write_bytes(old)
+    with pytest.raises(ValueError):
+        TraceReader(str(path))
+
+    path = str(tmp_path / "truncated.trace")
+    with TraceWriter(path, Grid(3, 3)) as writer:
+        for cell in [(0, 0), (1, 1), (2, 2)]:
+            writer(cell, "expanded")
+    with open(path, "r+b") as f:
+        f.truncate(trace.HEADER.size + 1)
+    with pytest.raises(ValueError):
+        list(TraceReader(path).events())